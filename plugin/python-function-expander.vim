@@ -23,6 +23,50 @@ if get(g:, 'expander_full_auto', '0') == '1'
     autocmd! CursorHoldI *.py call s:ExpandSignatures()
 endif
 
+command! -nargs=* BuildPythonSignatureIndex call s:BuildSignatureIndex(<f-args>)
+command! -nargs=0 RefreshPythonExpanderSettings call s:RefreshSettings()
+
+
+" Settings are read once and cached. Re-read them whenever they may have changed.
+" jedi-vim defines its settings once every plugin is loaded or once its
+" autoload file is sourced by the first Python buffer. This group must come
+" before the warm-up group so that the warm-up reads the new settings.
+"
+augroup python_function_expander_settings
+    autocmd!
+    autocmd VimEnter * call s:SnapshotSettings()
+    autocmd FileType python call s:SnapshotSettings()
+    autocmd OptionSet encoding call s:RefreshSettings()
+    if exists('##SourcePost')
+        autocmd SourcePost $MYVIMRC call s:RefreshSettings()
+    endif
+augroup END
+
+
+" Keep track of the Python buffers that jedi may use for dynamic analysis
+augroup python_function_expander_dynamic_modules
+    autocmd!
+    autocmd BufAdd *.py call s:UpdateDynamicModules('add', expand('<afile>:p'))
+    autocmd BufDelete *.py call s:UpdateDynamicModules('remove', expand('<afile>:p'))
+    autocmd BufWritePost *.py call s:UpdateDynamicModules('refresh', expand('<afile>:p'))
+augroup END
+
+
+" Find jedi's environment and parse imported modules before the first expansion
+augroup python_function_expander_warm_up
+    autocmd!
+    autocmd FileType python call s:WarmUp()
+    autocmd BufEnter *.py call s:WarmUp()
+    autocmd BufUnload *.py call s:CancelWarmUp(expand('<abuf>'))
+augroup END
+
+
+" Forget the signatures of calls that were expanded in unloaded buffers
+augroup python_function_expander_signature_marks
+    autocmd!
+    autocmd BufUnload *.py call s:ForgetSignatures(expand('<abuf>'))
+augroup END
+
 
 function! s:ExpandSignatures()
     "from python_function_expander import jedi_expander
@@ -31,4 +75,54 @@ function! s:ExpandSignatures()
 endfunction
 
 
+function! s:BuildSignatureIndex(...)
+    "from python_function_expander import jedi_expander
+    "jedi_expander.build_signature_index([...])"
+    execute g:_uspy "from python_function_expander import jedi_expander;jedi_expander.build_signature_index(" . string(a:000) . ")"
+endfunction
+
+
+function! s:RefreshSettings()
+    "from python_function_expander import environment, session
+    "environment.refresh_settings()
+    "session.clear()"
+    execute g:_uspy "from python_function_expander import environment, session;environment.refresh_settings();session.clear()"
+endfunction
+
+
+function! s:SnapshotSettings()
+    "from python_function_expander import environment
+    "environment.refresh_settings()"
+    execute g:_uspy "from python_function_expander import environment;environment.refresh_settings()"
+endfunction
+
+
+function! s:UpdateDynamicModules(action, path)
+    "from python_function_expander import dynamic_modules
+    "dynamic_modules.add(path)"
+    execute g:_uspy "import vim;from python_function_expander import dynamic_modules;getattr(dynamic_modules, vim.eval('a:action'))(vim.eval('a:path'))"
+endfunction
+
+
+function! s:ForgetSignatures(number)
+    "from python_function_expander import signature_marks
+    "signature_marks.forget(number)"
+    execute g:_uspy "from python_function_expander import signature_marks;signature_marks.forget(" . a:number . ")"
+endfunction
+
+
+function! s:WarmUp()
+    "from python_function_expander import warmup
+    "warmup.warm_up_current_buffer()"
+    execute g:_uspy "from python_function_expander import warmup;warmup.warm_up_current_buffer()"
+endfunction
+
+
+function! s:CancelWarmUp(number)
+    "from python_function_expander import warmup
+    "warmup.cancel(number)"
+    execute g:_uspy "from python_function_expander import warmup;warmup.cancel(" . a:number . ")"
+endfunction
+
+
 let g:expander_loaded = '1'
@@ -19,6 +19,7 @@ if get(g:, 'trimmer_loaded', '0') == '1'
 endif
 
 command! -nargs=0 TrimUnchangedPythonParameters call s:TrimUnchangedPythonParameters()
+command! -nargs=0 PythonExpanderCacheStats call s:ShowCacheStats()
 
 " Plugin mappings
 nnoremap <silent> <Plug>(trimmer-mapping) :TrimUnchangedPythonParameters<CR>
@@ -41,4 +42,12 @@ function! s:TrimUnchangedPythonParameters()
 endfunction
 
 
+
+function! s:ShowCacheStats()
+    " from python_function_expander.trimmer import vim_trimmer
+    " vim_trimmer.show_cache_stats()
+    execute g:_uspy "from python_function_expander.trimmer import vim_trimmer;vim_trimmer.show_cache_stats()"
+endfunction
+
+
 let g:trimmer_loaded = '1'
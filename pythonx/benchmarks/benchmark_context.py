@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Time how long astroid's inference contexts take to clone and to infer astroid's test data.
+
+The hits and misses of the contexts' inference cache are printed for the last repeat over the
+test data, along with those of the manager's inference cache, for every inference.
+
+Run it from the "pythonx" folder, with astroid's vendors folder on the PYTHONPATH:
+
+    PYTHONPATH=python_function_expander/vendors python benchmarks/benchmark_context.py
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+from __future__ import print_function
+import argparse
+import os
+import sys
+import time
+
+# IMPORT THIRD-PARTY LIBRARIES
+from astroid import context as contextmod
+from astroid import exceptions
+from astroid import node_classes
+import astroid
+
+# IMPORT LOCAL LIBRARIES
+import benchmark_parse
+
+
+_INFERRED_CLASSES = (node_classes.BinOp, node_classes.Call, node_classes.Attribute)
+
+
+def _get_data_directory():
+    '''str: The folder of Python files which astroid's own tests use.'''
+    folder = 'python{}'.format(sys.version_info[0])
+
+    return os.path.join(
+        os.path.dirname(astroid.__file__), 'tests', 'testdata', folder, 'data')
+
+
+def _clone(size, count):
+    '''Push `size` entries onto a context and then clone it `count` times.'''
+    context = contextmod.InferenceContext()
+
+    for index in range(size):
+        context.push(index)
+
+    for index in range(count):
+        context.clone().push(-index)
+
+
+def _time_clones(size, count, repeat):
+    '''float: The fastest time, in seconds, to clone a context of `size` entries `count` times.'''
+    return benchmark_parse._time(lambda size: _clone(size, count), size, repeat)  # pylint: disable=protected-access
+
+
+def _infer_all(modules):
+    '''int: Infer every binary operation, call and attribute in `modules` and get how many there were.'''
+    count = 0
+
+    for module in modules:
+        for node in module.nodes_of_class(_INFERRED_CLASSES):
+            count += 1
+            try:
+                for _ in node.infer():
+                    pass
+            except (exceptions.AstroidError, RuntimeError):
+                pass
+
+    return count
+
+
+def main():
+    '''Print how long cloning contexts and inferring astroid's test data took.'''
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 100, 1000],
+                        help='The number of entries already on the path of each cloned context.')
+    parser.add_argument('--clones', type=int, default=10000, help='How many times to clone each context.')
+    parser.add_argument('--repeat', type=int, default=3, help='How many times to time each step.')
+    arguments = parser.parse_args()
+
+    print('{:>8}  {:>10}  {:>12}'.format('entries', 'clones', 'time (s)'))
+
+    for size in arguments.sizes:
+        print('{:>8}  {:>10}  {:>12.4f}'.format(
+            size, arguments.clones, _time_clones(size, arguments.clones, arguments.repeat)))
+
+    paths = sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(_get_data_directory())
+        for name in names if name.endswith('.py')
+    )
+    times = []
+    again = []
+
+    for _ in range(arguments.repeat):
+        astroid.MANAGER.clear_cache()
+        modules = []
+
+        for path in paths:
+            try:
+                modules.append(astroid.MANAGER.ast_from_file(path))
+            except (exceptions.AstroidBuildingError, RuntimeError):
+                pass
+
+        contextmod.CACHE_STATISTICS.clear()
+        start = time.time()
+        count = _infer_all(modules)
+        times.append(time.time() - start)
+
+        # The same nodes, like a call which is trimmed again, with every module already built
+        start = time.time()
+        _infer_all(modules)
+        again.append(time.time() - start)
+
+    print('Inferred {} nodes of {} test data modules in {:.4f}s, then again in {:.4f}s'.format(
+        count, len(paths), min(times), min(again)))
+    print('Inference cache: {hits} hits, {misses} misses'.format(
+        hits=contextmod.CACHE_STATISTICS['hits'], misses=contextmod.CACHE_STATISTICS['misses']))
+    print('Manager inference cache: {hits} hits, {misses} misses, {hit_rate:.1%} hit rate'.format(
+        **astroid.MANAGER.cache_stats()['inferences']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Measure how much memory astroid's nodes take up, per node, in large modules.
+
+Run it from the "pythonx" folder, with astroid's vendors folder on the PYTHONPATH:
+
+    PYTHONPATH=python_function_expander/vendors python benchmarks/benchmark_memory.py
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+from __future__ import print_function
+import argparse
+import collections
+import gc
+import tracemalloc
+
+# IMPORT THIRD-PARTY LIBRARIES
+from astroid import builder
+from astroid import node_classes
+
+# IMPORT LOCAL LIBRARIES
+import benchmark_parse
+
+
+def _build(code):
+    '''<astroid.Module>: Build `code` without transforms, caching or a node index.'''
+    return builder.AstroidBuilder(apply_transforms=False, cache_modules=False).string_build(code)
+
+
+def _measure(code):
+    '''tuple[int, int, collections.Counter]: The bytes, the nodes and the nodes with a `__dict__`, by class.'''
+    gc.collect()
+    tracemalloc.start()
+    module = _build(code)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    nodes = list(node_classes.NodeNG.nodes_of_class(module, node_classes.NodeNG))
+    with_dict = collections.Counter(
+        type(node).__name__ for node in nodes if getattr(node, '__dict__', None))
+
+    return size, len(nodes), with_dict
+
+
+def main():
+    '''Build generated modules of different sizes and print how much memory their nodes took.'''
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 5000, 20000],
+                        help='The number of lines of each generated module.')
+    arguments = parser.parse_args()
+
+    print('{:>8}  {:>8}  {:>12}  {:>14}  {:>10}'.format('lines', 'nodes', 'bytes', 'bytes / node', 'with dict'))
+
+    for size in arguments.sizes:
+        size_in_bytes, count, with_dict = _measure(benchmark_parse.make_code(size))
+        print('{:>8}  {:>8}  {:>12}  {:>14.1f}  {:>10}'.format(
+            size, count, size_in_bytes, size_in_bytes / float(count), sum(with_dict.values())))
+
+    print('Nodes with a __dict__, by class: {}'.format(dict(with_dict.most_common(8))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Compare astroid's normal parse with the parse-only mode that the trimmer uses.
+
+Run it from the "pythonx" folder, with astroid's vendors folder on the PYTHONPATH:
+
+    PYTHONPATH=python_function_expander/vendors python benchmarks/benchmark_parse.py
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+from __future__ import print_function
+import argparse
+import textwrap
+import timeit
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+
+
+_BLOCK = textwrap.dedent(
+    '''\
+    class Thing{index}(object):
+        def __init__(self, value=None):
+            super(Thing{index}, self).__init__()
+            self.value = collections.namedtuple('Value', 'a b')(value, {index})
+
+        def get(self, default={index}):
+            return self.value or default
+
+
+    def make_{index}(value, other=None, *args, **kwargs):
+        return Thing{index}(value=value).get(default=sorted([other, {index}]))
+
+    '''
+)
+
+
+def make_code(lines):
+    '''str: Generate a module that is roughly `lines` long.'''
+    blocks = ['import collections\n\n']
+    count = 1
+    index = 0
+
+    while count < lines:
+        block = _BLOCK.format(index=index)
+        blocks.append(block)
+        count += block.count('\n')
+        index += 1
+
+    return ''.join(blocks)
+
+
+def _time(function, code, repeat):
+    '''float: The fastest time, in seconds, that `function` took to parse `code`.'''
+    return min(timeit.repeat(lambda: function(code), number=1, repeat=repeat))
+
+
+def main():
+    '''Parse generated modules of different sizes and print how long each mode took.'''
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 5000, 20000],
+                        help='The number of lines of each generated module.')
+    parser.add_argument('--repeat', type=int, default=3, help='How many times to time each parse.')
+    arguments = parser.parse_args()
+
+    print('{:>8}  {:>12}  {:>12}  {:>8}'.format('lines', 'parse (s)', 'syntax (s)', 'speedup'))
+
+    for size in arguments.sizes:
+        code = make_code(size)
+        normal = _time(astroid.parse, code, arguments.repeat)
+        syntax = _time(astroid.parse_syntax, code, arguments.repeat)
+
+        print('{:>8}  {:>12.4f}  {:>12.4f}  {:>7.2f}x'.format(size, normal, syntax, normal / syntax))
+
+    cached = len(astroid.MANAGER.astroid_cache)
+    astroid.parse_syntax(make_code(100), module_name='benchmark_parse_syntax')
+    print('Modules cached by parse_syntax: {}'.format(len(astroid.MANAGER.astroid_cache) - cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Time how long astroid's transforms take, compared to a whole parse, on large modules.
+
+Run it from the "pythonx" folder, with astroid's vendors folder on the PYTHONPATH:
+
+    PYTHONPATH=python_function_expander/vendors python benchmarks/benchmark_transforms.py
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+from __future__ import print_function
+import argparse
+import time
+
+# IMPORT THIRD-PARTY LIBRARIES
+import astroid
+
+# IMPORT LOCAL LIBRARIES
+import benchmark_parse
+
+
+def _time_transforms(code, repeat):
+    '''float: The fastest time, in seconds, that the transforms took to visit a module of `code`.'''
+    times = []
+
+    for _ in range(repeat):
+        module = astroid.parse_syntax(code)
+        start = time.time()
+        astroid.MANAGER.visit_transforms(module)
+        times.append(time.time() - start)
+
+    return min(times)
+
+
+def main():
+    '''Parse generated modules of different sizes and print how long the transforms took.'''
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 5000, 20000],
+                        help='The number of lines of each generated module.')
+    parser.add_argument('--repeat', type=int, default=3, help='How many times to time each module.')
+    arguments = parser.parse_args()
+
+    print('{:>8}  {:>12}  {:>15}  {:>8}'.format('lines', 'parse (s)', 'transforms (s)', 'share'))
+
+    for size in arguments.sizes:
+        code = benchmark_parse.make_code(size)
+        parse = benchmark_parse._time(astroid.parse, code, arguments.repeat)  # pylint: disable=protected-access
+        transforms = _time_transforms(code, arguments.repeat)
+
+        print('{:>8}  {:>12.4f}  {:>15.4f}  {:>7.1%}'.format(size, parse, transforms, transforms / parse))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,50 @@
 
 '''Any generic function that is used across multiple modules.'''
 
+# IMPORT STANDARD LIBRARIES
+import contextlib
+import threading
+
+
+# jedi and astroid aren't thread-safe. Anything which infers code in a
+# background thread, or while a background thread may be running, holds this lock.
+#
+INFERENCE_LOCK = threading.RLock()
+
+# Cleared while Vim's thread waits for, or holds, `INFERENCE_LOCK`. Background
+# work waits for it before each of its steps so that, instead of racing Vim
+# for the lock, Vim never waits for more than the step which is already running
+#
+_BACKGROUND_ALLOWED = threading.Event()
+_BACKGROUND_ALLOWED.set()
+# Only Vim's thread changes this, so it needs no lock of its own
+_FOREGROUND_DEPTH = [0]
+
+
+@contextlib.contextmanager
+def foreground_inference():
+    '''Hold `INFERENCE_LOCK` for Vim's thread, ahead of any background work.'''
+    _FOREGROUND_DEPTH[0] += 1
+    _BACKGROUND_ALLOWED.clear()
+
+    try:
+        with INFERENCE_LOCK:
+            yield
+    finally:
+        _FOREGROUND_DEPTH[0] -= 1
+
+        if not _FOREGROUND_DEPTH[0]:
+            _BACKGROUND_ALLOWED.set()
+
+
+@contextlib.contextmanager
+def background_inference():
+    '''Hold `INFERENCE_LOCK` for one, short step of background work, once Vim doesn't need it.'''
+    _BACKGROUND_ALLOWED.wait()
+
+    with INFERENCE_LOCK:
+        yield
+
 
 def get_default(text):
     '''Get the default value of some parameter.
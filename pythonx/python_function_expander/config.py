@@ -1,10 +1,35 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-'''A simple module to store the user's style preferences.'''
+'''A simple module to store the user's style preferences and settings.'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
 
 
 INDENT_PREFERENCE = {'indent': '    '}
+SETTINGS = {'settings': None}
+
+# A snapshot of every Vim setting that the plugin reads while expanding or trimming.
+# Reading each setting from Vim, every time, costs one Vim round-trip each.
+#
+Settings = collections.namedtuple(
+    'Settings',
+    [
+        'show_call_signatures',  # str: `g:jedi#show_call_signatures`. "0", "1" or "2"
+        'call_signature_escape',  # str: `g:jedi#call_signature_escape`
+        'force_python_version',  # str: `g:jedi#force_py_version`. e.g. "auto" or "3.6"
+        'encoding',  # str: `&encoding`
+        'use_local_variables',  # bool: `g:expander_use_local_variables`
+        'signature_index',  # str: `g:expander_signature_index`
+        'warm_up',  # bool: `g:expander_warm_up`
+        'slice_threshold',  # int: `g:expander_slice_threshold`. 0 means "never slice"
+        'trim_on_exit',  # bool: `g:expander_trim_on_exit`
+        'astroid_cache_size',  # int: `g:expander_astroid_cache_size`. 0 means "no limit"
+        'astroid_cache_validation',  # str: `g:expander_astroid_cache_validation`. "mtime", "hash" or ""
+        'astroid_disk_cache',  # bool: `g:expander_astroid_disk_cache`
+    ],
+)
 
 
 def get_indent_preference():
@@ -15,3 +40,13 @@ def get_indent_preference():
 def register_indent_preference(text):
     '''Set indentation that will be used for multi-line function calls.'''
     INDENT_PREFERENCE['indent'] = text
+
+
+def get_settings():
+    '''`Settings` or NoneType: The last snapshot of the user's settings, if one was taken.'''
+    return SETTINGS['settings']
+
+
+def register_settings(settings):
+    '''Replace the snapshot of the user's settings.'''
+    SETTINGS['settings'] = settings
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Keep track of which listed Python buffers jedi should use for dynamic analysis.
+
+jedi searches every file in `jedi.settings.additional_dynamic_modules` for
+calls to the function that it is inferring. Giving it every listed buffer
+makes jedi parse files that have nothing to do with the current one.
+
+Instead, this module keeps a record of the listed buffers, which is updated
+by Vim's `BufAdd`, `BufDelete` and `BufWritePost` events, and only returns
+the buffers that are connected to the current buffer through imports.
+Those are the buffers that the current buffer imports and, since jedi
+looks for callers of the current buffer's functions, the buffers which
+import the current buffer.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import os
+
+# IMPORT LOCAL LIBRARIES
+from . import imports
+
+
+_BUFFERS = dict()
+_STATE = {'initialized': False, 'generation': 0, 'reachable': (None, None)}
+
+
+def _read_imports(path):
+    '''set[str]: Get the module names that the file at `path` imports.'''
+    try:
+        with open(path, 'r') as handle:
+            return get_imported_names(handle.read())
+    except (IOError, OSError, UnicodeError):
+        return set()
+
+
+def get_imported_names(code):
+    '''Find every module name that some Python code could be importing.
+
+    Since this doesn't parse the code, a from-import is treated as if it
+    might be importing a submodule. e.g. "from foo import bar" gives both
+    "foo" and "foo.bar". Relative imports have their leading "."s removed.
+
+    Args:
+        code (str): The Python source code to check.
+
+    Returns:
+        set[str]: The found module names, including the parents of dotted names.
+
+    '''
+    names = set()
+
+    for module, name, _ in imports.get_imports(code):
+        if module is None:
+            candidates = [name]
+        elif name == '*':
+            candidates = [module.lstrip('.')]
+        else:
+            candidates = ['.'.join(part for part in (module.lstrip('.'), name) if part)]
+
+        for candidate in candidates:
+            parts = candidate.split('.')
+
+            for index in range(1, len(parts) + 1):
+                names.add('.'.join(parts[:index]))
+
+    names.discard('')
+
+    return names
+
+
+def get_module_names(path):
+    '''Get every dotted name that a Python file could be imported as.
+
+    Example:
+        If "/repo/package/__init__.py" exists then "/repo/package/module.py"
+        could be imported as "module" or as "package.module".
+
+    Args:
+        path (str): The absolute path to a Python file.
+
+    Returns:
+        set[str]: The found names.
+
+    '''
+    (directory, name) = os.path.split(path)
+    name = os.path.splitext(name)[0]
+
+    if name == '__init__':
+        (directory, name) = os.path.split(directory)
+
+    parts = [name]
+    names = set(parts)
+
+    while os.path.isfile(os.path.join(directory, '__init__.py')):
+        (directory, package) = os.path.split(directory)
+
+        if not package:
+            break
+
+        parts.insert(0, package)
+        names.add('.'.join(parts))
+
+    return names
+
+
+def _is_python_file(path):
+    '''bool: Check if `path` is a Python file which should be tracked.'''
+    return bool(path) and path.endswith('.py')
+
+
+def initialize(paths):
+    '''Start tracking buffers, if this hasn't been done yet.
+
+    Vim doesn't run `BufAdd` for the buffers that it opens on start-up so
+    those are added here, the first time that jedi needs them.
+
+    Args:
+        paths (iter[str]): The absolute paths of every listed buffer.
+
+    '''
+    if _STATE['initialized']:
+        return
+
+    _STATE['initialized'] = True
+
+    for path in paths:
+        add(path)
+
+
+def add(path):
+    '''Track the Python buffer at `path`.'''
+    if not _is_python_file(path):
+        return
+
+    _BUFFERS[path] = (get_module_names(path), _read_imports(path))
+    _STATE['generation'] += 1
+
+
+def remove(path):
+    '''Stop tracking the buffer at `path`.'''
+    if _BUFFERS.pop(path, None) is not None:
+        _STATE['generation'] += 1
+
+
+def refresh(path):
+    '''Re-read the imports of a tracked buffer, usually because it was written.'''
+    if path in _BUFFERS:
+        add(path)
+
+
+def _get_importers(path):
+    '''Find the tracked buffers which import the buffer at `path`, directly or through other buffers.
+
+    Args:
+        path (str): The absolute path to the current buffer.
+
+    Returns:
+        set[str]: The paths of every importing buffer.
+
+    '''
+    importers = set()
+    pending = get_module_names(path)
+
+    while pending:
+        found = [other_path for other_path, (_, imported) in _BUFFERS.items()
+                 if other_path != path and other_path not in importers and imported & pending]
+        importers.update(found)
+        pending = set()
+
+        for other_path in found:
+            pending.update(_BUFFERS[other_path][0])
+
+    return importers
+
+
+def get_reachable_modules(path, code):
+    '''Find the tracked buffers which the current buffer imports or which import it.
+
+    Buffers that the current buffer imports are followed through their own
+    imports. Buffers which import the current buffer are where jedi finds
+    calls to its functions, for dynamic parameter and array analysis.
+
+    Args:
+        path (str):
+            The absolute path to the current buffer. It is never included in the results.
+        code (str):
+            The current buffer's source code. It may contain unsaved changes
+            so its imports are read from this text instead of from disk.
+
+    Returns:
+        list[str]: The paths of every reachable buffer.
+
+    '''
+    imported = get_imported_names(code)
+    key = (path, _STATE['generation'], frozenset(imported))
+    (cached_key, cached_paths) = _STATE['reachable']
+
+    if key == cached_key:
+        return list(cached_paths)
+
+    reachable = set()
+    pending = set(imported)
+
+    while pending:
+        found = [other_path for other_path, (names, _) in _BUFFERS.items()
+                 if other_path != path and other_path not in reachable and names & pending]
+        reachable.update(found)
+        pending = set()
+
+        for other_path in found:
+            pending.update(_BUFFERS[other_path][1])
+
+    reachable.update(_get_importers(path))
+    paths = sorted(reachable)
+    _STATE['reachable'] = (key, paths)
+
+    return list(paths)
@@ -8,6 +8,31 @@ import vim
 from . import config
 
 
+# Every setting is read in one `vim.eval` call, instead of one call per setting
+_SETTINGS_EXPRESSION = '''{
+    'show_call_signatures': get(g:, 'jedi#show_call_signatures', '0'),
+    'call_signature_escape': get(g:, 'jedi#call_signature_escape', '?!?'),
+    'force_python_version': get(g:, 'jedi#force_py_version', 'auto'),
+    'encoding': &encoding,
+    'use_local_variables': get(g:, 'expander_use_local_variables', '1'),
+    'signature_index': get(g:, 'expander_signature_index', ''),
+    'warm_up': get(g:, 'expander_warm_up', '1'),
+    'slice_threshold': get(g:, 'expander_slice_threshold', '1000'),
+    'trim_on_exit': get(g:, 'expander_trim_on_exit', '0'),
+    'astroid_cache_size': get(g:, 'expander_astroid_cache_size', '500'),
+    'astroid_cache_validation': get(g:, 'expander_astroid_cache_validation', 'mtime'),
+    'astroid_disk_cache': get(g:, 'expander_astroid_disk_cache', '0'),
+}'''.replace('\n', ' ')
+
+
+def _get_integer(value, default):
+    '''int: Convert a Vim setting to an integer or use `default`, if it isn't one.'''
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def init():
     '''Get the user's preferred indentation, if they have it defined.'''
     try:
@@ -24,3 +49,51 @@ def init():
         default_indent = '\t'
 
     config.register_indent_preference(default_indent)
+
+
+def refresh_settings():
+    '''Take a new snapshot of the user's settings.
+
+    This is run once every plugin is loaded, when a Python buffer is opened,
+    when an option changes, when the user's vimrc is sourced and by
+    `:RefreshPythonExpanderSettings`. jedi-vim only defines its settings
+    once its autoload file is sourced, which is usually when the first
+    Python buffer is opened, so a snapshot which was taken before that
+    would use this plugin's fallback values until the next refresh.
+
+    Settings which should be integers but aren't fall back to their defaults.
+
+    Returns:
+        :class:`python_function_expander.config.Settings`: The new snapshot.
+
+    '''
+    values = vim.eval(_SETTINGS_EXPRESSION)
+    settings = config.Settings(
+        show_call_signatures=str(values['show_call_signatures']),
+        call_signature_escape=values['call_signature_escape'],
+        force_python_version=str(values['force_python_version']),
+        encoding=values['encoding'],
+        use_local_variables=str(values['use_local_variables']) != '0',
+        signature_index=values['signature_index'],
+        warm_up=str(values['warm_up']) != '0',
+        slice_threshold=_get_integer(values['slice_threshold'], 1000),
+        trim_on_exit=str(values['trim_on_exit']) != '0',
+        astroid_cache_size=_get_integer(values['astroid_cache_size'], 500),
+        astroid_cache_validation=values['astroid_cache_validation'],
+        astroid_disk_cache=str(values['astroid_disk_cache']) != '0',
+    )
+    config.register_settings(settings)
+
+    return settings
+
+
+def get_settings():
+    '''Get the user's settings without asking Vim, if possible.
+
+    Returns:
+        :class:`python_function_expander.config.Settings`:
+            The last snapshot of the user's settings. If there is no
+            snapshot yet, a new one is taken.
+
+    '''
+    return config.get_settings() or refresh_settings()
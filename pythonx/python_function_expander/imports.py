@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A quick, regex-based reader for the import statements of Python source code.
+
+None of these functions parse the code. They only look at lines which start
+with "import" or "from", which is enough to know what names a buffer imports.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import re
+
+
+_IMPORT_EXPRESSION = re.compile(
+    r'^[ \t]*(?:from[ \t]+(?P<module>[\w.]+)[ \t]+)?import[ \t]+(?P<names>\([^)]*\)|[^\n#;]+)',
+    re.MULTILINE,
+)
+_NAME_EXPRESSION = re.compile(r'^(?P<name>[\w.*]+)(?:\s+as\s+(?P<alias>\w+))?$')
+
+
+def _get_names(text):
+    '''Split the names of an import statement into (name, alias) pairs.
+
+    Args:
+        text (str): The text after "import". e.g. "os, re as regex" or "(foo, bar)".
+
+    Returns:
+        list[tuple[str, str or NoneType]]: Every imported name and its alias, if any.
+
+    '''
+    text = text.strip().strip('()').replace('\\\n', ' ')
+    names = []
+
+    for part in text.split(','):
+        match = _NAME_EXPRESSION.match(part.strip())
+
+        if match:
+            names.append((match.group('name'), match.group('alias')))
+
+    return names
+
+
+def get_imports(code):
+    '''Find every import statement in some Python code.
+
+    Args:
+        code (str): The Python source code to check.
+
+    Returns:
+        list[tuple[str or NoneType, str, str or NoneType]]:
+            The "from" module (or None for plain "import" statements),
+            the imported name and its alias, for each imported name.
+
+    '''
+    imports = []
+
+    for match in _IMPORT_EXPRESSION.finditer(code):
+        module = match.group('module')
+
+        for name, alias in _get_names(match.group('names')):
+            imports.append((module, name, alias))
+
+    return imports
+
+
+def get_imported_modules(code):
+    '''set[str]: Get the name of every module that `code` imports from.'''
+    modules = set()
+
+    for module, name, _ in get_imports(code):
+        if module is None:
+            modules.add(name)
+        elif not module.startswith('.'):
+            modules.add(module)
+
+    return modules
+
+
+def get_aliases(code):
+    '''Map every name that `code` imports to its fully-qualified name.
+
+    Example:
+        >>> get_aliases('import numpy as np\\nfrom re import sub')
+        {'np': 'numpy', 'sub': 're.sub'}
+
+    Args:
+        code (str): The Python source code to check.
+
+    Returns:
+        dict[str, str]: Each local name and the dotted path that it refers to.
+
+    '''
+    aliases = dict()
+
+    for module, name, alias in get_imports(code):
+        if name == '*':
+            continue
+
+        if module is None:
+            if alias:
+                aliases[alias] = name
+            else:
+                # `import os.path` makes "os" available, not "os.path"
+                root = name.split('.')[0]
+                aliases[root] = root
+        elif not module.startswith('.'):
+            aliases[alias or name] = '{module}.{name}'.format(module=module, name=name)
+
+    return aliases
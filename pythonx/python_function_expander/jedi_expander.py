@@ -5,6 +5,7 @@
 
 # IMPORT STANDARD LIBRARIES
 import re
+import sys
 
 # IMPORT THIRD-PARTY LIBRARIES
 from UltiSnips import snippet_manager
@@ -21,9 +22,30 @@ import vim
 # IMPORT LOCAL LIBRARIES
 from . import common
 from . import config
-
-
-CURRENT_ENVIRONMENT = (None, None)
+from . import dynamic_modules
+from . import environment as environment_
+from . import imports
+from . import session
+from . import signature_index
+from . import signature_marks
+from . import slicer
+
+
+_CALLEE_EXPRESSION = re.compile(r'(?:^|[^\w.])(?P<name>[A-Za-z_][\w.]*)\s*\($')
+_BUILTINS_MODULES = ('builtins', '__builtin__')
+_CALL_SIGNATURE_REGEXES = dict()
+_INDEX_BUILDS = []
+# jedi-vim writes nested call signatures this many lines above the call, at most
+_SIGNATURE_LINES_ABOVE_WINDOW = 10
+
+# When the snippet's last tabstop is left, trim the call. It's done in a timer
+# because UltiSnips doesn't allow the buffer to be changed during a jump
+#
+_TRIM_ON_EXIT_ACTION = (
+    'import vim\n'
+    'if snip.tabstop == 0:\n'
+    '    vim.command(\'call timer_start(0, {-> execute("TrimUnchangedPythonParameters")})\')\n'
+)
 
 
 def _get_default(text):
@@ -43,10 +65,7 @@ def _get_default(text):
 
 def enabled_signatures():
     '''bool: If the user has jedi-vim installed with in-line signatures enabled.'''
-    try:
-        return vim.eval('g:jedi#show_call_signatures') == '1'
-    except Exception:
-        return False
+    return environment_.get_settings().show_call_signatures == '1'
 
 
 def needs_update(line, column):
@@ -112,6 +131,35 @@ def get_description_name(text):
     return text
 
 
+def _get_scope_lines(lines, names):
+    '''Remove the lines of a large buffer which can't change which of `names` are in-scope.
+
+    Args:
+        lines (list[str]):
+            The source code, with line endings, whose last line is the
+            user's current line.
+        names (iter[str]):
+            The variable names which will be checked, with :func:`get_default`.
+
+    Returns:
+        list[str]:
+            The sliced lines, if there are more than `g:expander_slice_threshold`.
+            Otherwise, `lines` is returned unchanged.
+
+    '''
+    threshold = environment_.get_settings().slice_threshold
+
+    if not threshold or len(lines) <= threshold:
+        return lines
+
+    sliced = slicer.get_sliced_lines([line.rstrip('\n') for line in lines], len(lines), names=names)
+
+    if sliced is None:
+        return lines
+
+    return [line + '\n' for line in sliced]
+
+
 def get_default(lines, name, fallback=''):
     '''Recommend a good default name for some variable based on what is in-scope.
 
@@ -140,7 +188,7 @@ def get_default(lines, name, fallback=''):
     column = len(fake_line) - 1
     code = ''.join(fake_lines)
 
-    new_script = jedi.Script(code, row, column)
+    new_script = session.get_script(code, row, column, vim.current.buffer.name)
     for completion in new_script.completions():
         if completion.name == name:
             return name
@@ -175,7 +223,13 @@ def get_parameter_details(parameter, lines, name):
         '''bool: Check if the given description is from an optional parameter.'''
         return '=' in description
 
+    # Indexed parameters and newer jedi parameters know their `inspect.Parameter` kind
+    kind = getattr(parameter, 'kind', None)
+
     if not is_optional(parameter.description):
+        if kind == signature_index.KEYWORD_ONLY:
+            return ('{name}=${{{tabstop}:{name}}}', '')
+
         return ('${{{tabstop}:{name}}}', '')
 
     # raise ValueError(sorted(dir(parameter)))
@@ -183,7 +237,11 @@ def get_parameter_details(parameter, lines, name):
 
     argument = '{name}=${{{tabstop}:{default}}}'
 
-    if vim.eval("get(g:, 'expander_use_local_variables', '1')") == '0':
+    if kind == signature_index.POSITIONAL_ONLY:
+        # Positional-only parameters can't be given by name
+        argument = '${{{tabstop}:{default}}}'
+
+    if not environment_.get_settings().use_local_variables:
         return (argument, common.get_default(parameter.description) or name)
 
     default = get_default(
@@ -212,6 +270,11 @@ def get_parameter_snippet(parameters, lines=None):
     if not lines:
         lines = []
 
+    if lines and environment_.get_settings().use_local_variables:
+        # Every parameter makes its own jedi Script so only give jedi what it needs
+        lines = _get_scope_lines(
+            lines, [get_description_name(parameter.description) for parameter in parameters])
+
     arguments = []
     tabstop = 1  # UltiSnips tabstops start at 1 (0 is a reserved tabstop)
 
@@ -233,6 +296,133 @@ def get_parameter_snippet(parameters, lines=None):
     return join_columnwise(arguments) + '${{{tabstop}}}\n'.format(tabstop=tabstop)
 
 
+def get_signature_index_path():
+    '''str: The signature index that the user wants to use. Default: The user's cache folder.'''
+    return environment_.get_settings().signature_index or signature_index.get_default_path()
+
+
+def get_qualified_names(lines, column):
+    '''Find the fully-qualified name of the callable object at the user's cursor.
+
+    This only reads the import statements of `lines`. If the called name
+    wasn't imported and isn't a builtin, then it cannot be found.
+
+    Args:
+        lines (list[str]):
+            The source code whose last line contains the call and all lines before it.
+        column (int):
+            The 0-based position of the cursor in the last line, just after its "(".
+
+    Returns:
+        list[str]: Every fully-qualified name that the call could refer to, in order of likelihood.
+
+    '''
+    match = _CALLEE_EXPRESSION.search(lines[-1][:column])
+
+    if not match:
+        return []
+
+    name = match.group('name')
+    (root, _, tail) = name.partition('.')
+    code = ''.join(lines)
+    aliases = imports.get_aliases(code)
+
+    if root in aliases:
+        return ['.'.join(part for part in (aliases[root], tail) if part)]
+
+    # A function, class or variable in the current file would shadow the builtin
+    if re.search(r'^\s*(?:(?:def|class)\s+{name}\b|{name}\s*=)'.format(name=re.escape(root)), code, re.MULTILINE):
+        return []
+
+    return ['{module}.{name}'.format(module=module, name=name) for module in _BUILTINS_MODULES]
+
+
+def get_indexed_parameters(lines, column):
+    '''Get the parameters of the callable object at the user's cursor from the signature index.
+
+    Args:
+        lines (list[str]):
+            The source code whose last line contains the call and all lines before it.
+        column (int):
+            The 0-based position of the cursor in the last line, just after its "(".
+
+    Returns:
+        list[:class:`python_function_expander.signature_index.IndexedParameter`] or NoneType:
+            The found parameters. If there is no index, or the callable object
+            wasn't indexed or it has changed since it was indexed, return None.
+
+    '''
+    index = signature_index.get_index(get_signature_index_path())
+
+    if not index:
+        return None
+
+    for name in get_qualified_names(lines, column):
+        parameters = index.lookup(name)
+
+        if parameters is not None:
+            return parameters
+
+    return None
+
+
+def build_signature_index(modules=None):
+    '''Index the signatures of the user's Python environment, in the background.
+
+    Args:
+        modules (list[str], optional):
+            The top-level modules to index. If no modules are given, every
+            importable module in the environment is indexed.
+
+    '''
+    # Without timers, this is the only place where finished builds are reported
+    report_signature_index_builds()
+
+    environment = get_environment()
+    executable = getattr(environment, 'executable', None) or sys.executable
+    _INDEX_BUILDS.append(signature_index.start_build(executable, get_signature_index_path(), modules))
+
+    if vim.eval("has('timers')") == '1':
+        vim.command(
+            'call timer_start(1000, {timer -> execute(g:_uspy . "from python_function_expander '
+            'import jedi_expander;jedi_expander.report_signature_index_builds(" . timer . ")")}, '
+            '{"repeat": -1})'
+        )
+
+
+def report_signature_index_builds(timer=None):
+    '''Tell the user about every signature index build which has finished.
+
+    Args:
+        timer (int, optional):
+            The Vim timer that calls this function. Once no builds are
+            running anymore, it's stopped.
+
+    '''
+    for build in list(_INDEX_BUILDS):
+        result = build.poll()
+
+        if result is None:
+            continue
+
+        _INDEX_BUILDS.remove(build)
+        (succeeded, message) = result
+
+        if succeeded:
+            text = 'Signature index "{path}" was built. {message}'
+            highlight = 'None'
+        else:
+            text = 'Signature index "{path}" could not be built. {message}'
+            highlight = 'ErrorMsg'
+
+        text = text.format(path=build.path, message=message).replace("'", "''")
+        vim.command("echohl {highlight} | echomsg '{text}' | echohl None".format(
+            highlight=highlight, text=text))
+
+    if timer is not None and not _INDEX_BUILDS:
+        vim.command('call timer_stop({timer})'.format(timer=timer))
+
+
 def get_balanced_parenthesis():
     '''Recommend the character(s) needed to append to the current line.
 
@@ -252,6 +442,27 @@ def get_balanced_parenthesis():
     return ''
 
 
+def get_call_signature_regex(escape):
+    '''Get a compiled regex that finds the call signatures that jedi-vim writes into buffers.
+
+    Args:
+        escape (str): The value of `g:jedi#call_signature_escape`. e.g. "?!?".
+
+    Returns:
+        :class:`re.RegexObject`: The compiled regex.
+
+    '''
+    try:
+        return _CALL_SIGNATURE_REGEXES[escape]
+    except KeyError:
+        pass
+
+    regex = re.compile(r'%sjedi=([0-9]+), (.*?)%s.*?%sjedi%s'.replace('%s', re.escape(escape)))
+    _CALL_SIGNATURE_REGEXES[escape] = regex
+
+    return regex
+
+
 # Note: This is a copy/paste of jedi_vim.clear_call_signatures. The only
 #       difference is that we modify the buffer using snip.buffer and snip.cursor,
 #       instead of vim.current.buffer and vim.cursor. This is important because
@@ -261,20 +472,34 @@ def get_balanced_parenthesis():
 # @jedi_vim.catch_and_print_exceptions
 def clear_call_signatures(snip):
     '''Clear the current buffer of any Jedi-completion menus.'''
+    settings = environment_.get_settings()
+
     # Check if using command line call signatures
-    if int(jedi_vim.vim_eval("g:jedi#show_call_signatures")) == 2:
+    if settings.show_call_signatures == '2':
         jedi_vim.vim_command('echo ""')
         return
     cursor = snip.cursor
-    e = jedi_vim.vim_eval('g:jedi#call_signature_escape')
+    e = settings.call_signature_escape
     # We need two turns here to search and replace certain lines:
     # 1. Search for a line with a call signature and save the appended
     #    characters
     # 2. Actually replace the line and redo the status quo.
-    py_regex = r'%sjedi=([0-9]+), (.*?)%s.*?%sjedi%s'.replace(
-        '%s', re.escape(e))
-    for i, line in enumerate(snip.buffer):
-        match = re.search(py_regex, line)
+    py_regex = get_call_signature_regex(e)
+    marker = e + 'jedi='
+
+    # jedi-vim only writes call signatures next to the cursor so there's
+    # no need to search every line of the buffer. It writes them on the
+    # lines above the call, one more line up for each nested signature,
+    # so they may be above the first visible line of the window.
+    #
+    (first, last) = [int(number) for number in vim.eval('[line("w0"), line("w$")]')]
+    first = max(0, first - 1 - _SIGNATURE_LINES_ABOVE_WINDOW)
+
+    for i, line in enumerate(snip.buffer[first:last], first):
+        if marker not in line:
+            continue
+
+        match = py_regex.search(line)
         if match is not None:
             # Some signs were added to minimize syntax changes due to call
             # signatures. We have to remove them again. The number of them is
@@ -339,36 +564,113 @@ def expand_signatures(snip, force=False):
         #
         clear_call_signatures(snip)
 
-    script = get_script()
+    (row, column) = vim.current.window.cursor
 
-    if not script:
-        return
+    # A background warm-up may be using jedi, too
+    with common.foreground_inference():
+        lines = [line + '\n' for line in vim.current.buffer[:row]]
+        parameters = None
 
-    signatures = script.call_signatures()
+        if lines:
+            parameters = get_indexed_parameters(lines, column)
 
-    if not signatures:
-        return
+        if parameters is None:
+            signatures = get_call_signatures()
 
-    (row, column) = vim.current.window.cursor
-    current_row_index = row - 1
-    code = script._code_lines
-    lines = code[:current_row_index + 1]
+            if not signatures:
+                return
 
-    if not lines:
+            parameters = signatures[0].params
+
+        if not lines:
+            return
+
+        lines[-1] = lines[-1].rstrip()
+
+        if force or needs_update(lines[-1], column):
+            snippet = get_parameter_snippet(
+                parameters,
+                lines=lines,
+            )
+            remember_signature(row, lines[-1], column, parameters)
+
+            actions = None
+            if environment_.get_settings().trim_on_exit:
+                actions = {'post_jump': _TRIM_ON_EXIT_ACTION}
+
+            snippet_manager.UltiSnips_Manager.expand_anon(snippet, actions=actions)
+
+            if snip:
+                # Make sure the user's cursor doesn't move, even after expanding the snippet
+                snip.cursor.preserve()
+
+
+def remember_signature(row, line, column, parameters):
+    '''Remember the default values of a call so that it can be trimmed without inferring it again.
+
+    Args:
+        row (int):
+            The 1-based line of the call.
+        line (str):
+            The text of the call's line.
+        column (int):
+            The 0-based position of the cursor in `line`, just after its "(".
+        parameters (list[:class:`jedi.api.classes.Definition`]):
+            The parameters that the call is being expanded with.
+
+    '''
+    match = _CALLEE_EXPRESSION.search(line[:column])
+
+    if not match:
         return
 
-    lines[-1] = lines[-1].rstrip()
+    defaults = dict()
 
-    if force or needs_update(lines[-1], column):
-        snippet = get_parameter_snippet(
-            signatures[0].params,
-            lines=lines,
-        )
-        snippet_manager.UltiSnips_Manager.expand_anon(snippet)
+    for parameter in parameters:
+        if getattr(parameter, 'kind', None) == signature_index.POSITIONAL_ONLY:
+            # It's never written as a keyword so the trimmer has nothing to remove
+            continue
+
+        default = common.get_default(parameter.description)
+
+        if default:
+            defaults[get_description_name(parameter.description)] = default
+
+    signature_marks.remember(row, line, match.start('name'), match.group('name'), defaults)
+
+
+def get_call_signatures():
+    '''Ask jedi for the call signatures at the user's cursor.
 
-        if snip:
-            # Make sure the user's cursor doesn't move, even after expanding the snippet
-            snip.cursor.preserve()
+    If the current buffer has more lines than `g:expander_slice_threshold`,
+    jedi is only given the parts of the buffer that the call needs.
+    If that isn't enough to find the call signature, jedi is given the
+    whole buffer, instead.
+
+    Returns:
+        list[:class:`jedi.api.classes.CallSignature`]: The found signatures, if any.
+
+    '''
+    buffer_ = vim.current.buffer
+    row = vim.current.window.cursor[0]
+    threshold = environment_.get_settings().slice_threshold
+
+    if threshold and len(buffer_) > threshold:
+        lines = slicer.get_sliced_lines(buffer_[:row], row)
+
+        if lines is not None:
+            script = get_script(source='\n'.join(lines))
+            signatures = script.call_signatures() if script else []
+
+            if signatures:
+                return signatures
+
+    script = get_script()
+
+    if not script:
+        return []
+
+    return script.call_signatures()
 
 
 def expand_signature_at_cursor():
@@ -402,51 +704,19 @@ def expand_signature_at_cursor():
 
 
 def get_environment(use_cache=True):
-    global CURRENT_ENVIRONMENT
+    '''`jedi.api.environment.Environment`: Find the jedi environment that the user wants to use.'''
+    force_python_version = environment_.get_settings().force_python_version
 
-    try:
-        vim_force_python_version = vim.eval("g:jedi#force_py_version")
-    except Exception:
-            vim_force_python_version = ''
-
-    if use_cache and vim_force_python_version == CURRENT_ENVIRONMENT[0]:
-        return CURRENT_ENVIRONMENT[1]
-
-    environment = None
-    if vim_force_python_version == "auto":
-        environment = jedi.api.environment.get_cached_default_environment()
-    else:
-        force_python_version = vim_force_python_version
-        if '0000' in force_python_version or '9999' in force_python_version:
-            # It's probably a float that wasn't shortened.
-            try:
-                force_python_version = "{:.1f}".format(float(force_python_version))
-            except ValueError:
-                pass
-        elif isinstance(force_python_version, float):
-            force_python_version = "{:.1f}".format(force_python_version)
-
-        try:
-            environment = jedi.get_system_environment(force_python_version)
-        except jedi.InvalidPythonEnvironment as exc:
-            environment = jedi.api.environment.get_cached_default_environment()
-            echo_highlight(
-                "force_python_version=%s is not supported: %s - using %s." % (
-                    vim_force_python_version, str(exc), str(environment)))
-
-    CURRENT_ENVIRONMENT = (vim_force_python_version, environment)
-    return environment
+    return session.get_environment(force_python_version, use_cache=use_cache)
 
 
 # Copied from jedi-vim
 # Reference: https://github.com/davidhalter/jedi-vim/blob/master/pythonx/jedi_vim.py
 #
 def get_script(source=None, column=None):
-    jedi.settings.additional_dynamic_modules = [
-        b.name for b in vim.buffers if (
-            b.name is not None and
-            b.name.endswith('.py') and
-            b.options['buflisted'])]
+    # Only done once. After that, `dynamic_modules` is kept up-to-date by buffer events
+    dynamic_modules.initialize(
+        b.name for b in vim.buffers if b.name is not None and b.options['buflisted'])
 
     if source is None:
         source = '\n'.join(vim.current.buffer)
@@ -457,14 +727,9 @@ def get_script(source=None, column=None):
     row = vim.current.window.cursor[0]
     buf_path = vim.current.buffer.name
 
-    try:
-        encoding = vim.eval('&encoding')
-    except Exception:
-        encoding = ''
+    jedi.settings.additional_dynamic_modules = dynamic_modules.get_reachable_modules(buf_path, source)
 
+    # Make sure that the session uses the user's latest settings
+    environment_.get_settings()
 
-    return jedi.Script(
-        source, row, column, buf_path,
-        encoding=encoding or 'latin1',
-        environment=get_environment(),
-    )
+    return session.get_script(source, row, column, buf_path)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''The one place where jedi objects are created, for both the expander and the trimmer.
+
+Finding a jedi environment means starting a Python subprocess so the
+environment is found once and then shared. Every `jedi.Script` is given
+the buffer's path, too, so that jedi finds the buffer's project and uses
+its sys.path and caches, no matter which part of the plugin asked for it.
+
+This module never talks to Vim. Whatever it needs from the user's
+settings is read from :mod:`python_function_expander.config` so it is
+safe to use from the trimmer and from background threads. Callers are
+expected to hold :obj:`python_function_expander.common.INFERENCE_LOCK`.
+
+'''
+
+# IMPORT THIRD-PARTY LIBRARIES
+import jedi
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+from . import config
+
+
+_ENVIRONMENT = {'version': None, 'environment': None}
+
+
+def _get_settings():
+    '''tuple[str, str]: The Python version and encoding that jedi should use.'''
+    settings = config.get_settings()
+
+    if not settings:
+        return ('auto', '')
+
+    return (settings.force_python_version, settings.encoding)
+
+
+def get_environment(force_python_version=None, use_cache=True):
+    '''Find the jedi environment for some Python version.
+
+    Args:
+        force_python_version (str, optional):
+            The value of `g:jedi#force_py_version`. e.g. "auto" or "3.6".
+            If no version is given, the user's settings are used.
+        use_cache (bool, optional):
+            If True and the last found environment was for the same version,
+            return it instead of searching again. Default is True.
+
+    Returns:
+        :class:`jedi.api.environment.Environment`: The found environment.
+
+    '''
+    if force_python_version is None:
+        (force_python_version, _) = _get_settings()
+
+    if use_cache and force_python_version == _ENVIRONMENT['version']:
+        return _ENVIRONMENT['environment']
+
+    environment = None
+    if force_python_version == "auto":
+        environment = jedi.api.environment.get_cached_default_environment()
+    else:
+        version = force_python_version
+        if '0000' in version or '9999' in version:
+            # It's probably a float that wasn't shortened.
+            try:
+                version = "{:.1f}".format(float(version))
+            except ValueError:
+                pass
+        elif isinstance(version, float):
+            version = "{:.1f}".format(version)
+
+        try:
+            environment = jedi.get_system_environment(version)
+        except jedi.InvalidPythonEnvironment:
+            # jedi-vim already tells the user that their version isn't supported
+            environment = jedi.api.environment.get_cached_default_environment()
+
+    _ENVIRONMENT['version'] = force_python_version
+    _ENVIRONMENT['environment'] = environment
+
+    return environment
+
+
+def get_script(code, row, column, path=None):
+    '''Create a jedi Script which uses the shared environment.
+
+    Args:
+        code (str): The Python source code to infer.
+        row (int): The 1-based line to infer at.
+        column (int): The 0-based column to infer at.
+        path (str, optional):
+            The absolute path of the buffer that `code` comes from. jedi
+            uses it to find the buffer's project and its sys.path.
+
+    Returns:
+        :class:`jedi.Script`: The created script.
+
+    '''
+    (force_python_version, encoding) = _get_settings()
+
+    return jedi.Script(
+        code, row, column, path or None,
+        encoding=encoding or 'latin1',
+        environment=get_environment(force_python_version),
+    )
+
+
+def get_parameter_info(script):
+    '''Find the parameter definition for a function call and its default values.
+
+    Note:
+        This function does NOT give the default value that the user wrote
+        for the function call. It's the default value that was used for the
+        object's definition. To get the actual default value info, use
+        <python_function_expander.trimmer.parser.get_parameter_values>.
+
+    Args:
+        (<jedi.Script>): The script whose row/column is positioned directly
+                         over the call that must be parsed for parameter data.
+
+    Returns:
+        dict[str, str]: The keywords and their defined default values.
+
+    '''
+    try:
+        signature = script.call_signatures()[0]
+    except IndexError:
+        return dict()
+
+    info = dict()
+    for parameter in signature.params:
+        default = common.get_default(parameter.description)
+
+        if default:
+            info[str(parameter.name)] = default
+
+    return info
+
+
+def clear():
+    '''Forget the shared environment so that it's found again, the next time it's needed.'''
+    _ENVIRONMENT['version'] = None
+    _ENVIRONMENT['environment'] = None
@@ -0,0 +1,940 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Build and read a precomputed index of call signatures for installed packages.
+
+Asking jedi for the signature of `numpy.zeros` or `re.sub` means inferring
+through those packages every time. This module moves that work "offline".
+The builder walks a Python environment once and writes every public
+callable's parameters into a compact binary file. At runtime the expander
+memory-maps that file and answers fully-qualified lookups with a binary
+search, so no source code is parsed.
+
+File layout (all integers are little-endian):
+
+    header:       magic, format version, entry count, module count,
+                  module table offset, key table offset
+    module table: one row per indexed module - its name, file path, file
+                  mtime, distribution metadata path and distribution version
+    key table:    one row per callable, sorted by fully-qualified name
+    blob:         the UTF-8 strings and parameter records that the tables point to
+
+Every entry is checked against its module's file mtime and distribution
+before it is returned. Stale or missing entries return None, which tells
+the caller to fall back to jedi.
+
+The builder can be run directly, with the interpreter of the environment to index:
+
+    python -m python_function_expander.signature_index ~/.cache/signatures.idx numpy re
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import argparse
+import ast
+import inspect
+import mmap
+import os
+import pkgutil
+import struct
+import subprocess
+import sys
+import tempfile
+
+
+MAGIC = b'PFXSIG\x00\x01'
+FORMAT_VERSION = 1
+
+POSITIONAL_ONLY = 0
+POSITIONAL_OR_KEYWORD = 1
+VAR_POSITIONAL = 2
+KEYWORD_ONLY = 3
+VAR_KEYWORD = 4
+
+_HEADER = struct.Struct('<8sIIIQQ')
+_MODULE_ROW = struct.Struct('<QIQIQIQId')
+_KEY_ROW = struct.Struct('<QIQII')
+_PARAMETER_COUNT = struct.Struct('<H')
+_PARAMETER_ROW = struct.Struct('<BHH')
+_NO_DEFAULT = 0xFFFF
+
+# Modules which are either not useful to index or do something when imported
+_SKIPPED_MODULES = frozenset((
+    '__main__',
+    'antigravity',
+    'idlelib',
+    'lib2to3',
+    'test',
+    'tests',
+    'this',
+    'turtledemo',
+))
+
+_INDEXES = {'path': None, 'mtime': None, 'index': None}
+
+
+class IndexedParameter(object):
+
+    '''A parameter which was loaded from a signature index.
+
+    It has the same `name` and `description` attributes as a jedi parameter
+    so it can be used anywhere that the expander uses jedi parameters.
+
+    '''
+
+    _prefixes = {VAR_POSITIONAL: '*', VAR_KEYWORD: '**'}
+
+    def __init__(self, name, kind=POSITIONAL_OR_KEYWORD, default=None):
+        '''Store the parameter's information.
+
+        Args:
+            name (str): The name of the parameter, without any "*"s.
+            kind (int, optional): The `inspect.Parameter` kind of the parameter.
+            default (str or NoneType, optional):
+                The source-code representation of the parameter's default value.
+                If None, the parameter is required.
+
+        '''
+        super(IndexedParameter, self).__init__()
+        self.name = name
+        self.kind = kind
+        self.default = default
+
+    @property
+    def description(self):
+        '''str: The parameter, written the way that jedi describes parameters.'''
+        text = 'param ' + self._prefixes.get(self.kind, '') + self.name
+
+        if self.default is not None:
+            text += '=' + self.default
+
+        return text
+
+    def __eq__(self, other):
+        '''bool: Check if `other` describes the same parameter.'''
+        return isinstance(other, IndexedParameter) and \
+            (self.name, self.kind, self.default) == (other.name, other.kind, other.default)
+
+    def __ne__(self, other):
+        '''bool: Check if `other` describes a different parameter.'''
+        return not self == other
+
+    def __repr__(self):
+        '''str: A description of this instance, for debugging.'''
+        return '{name}({parameter!r}, {kind!r}, {default!r})'.format(
+            name=self.__class__.__name__,
+            parameter=self.name,
+            kind=self.kind,
+            default=self.default,
+        )
+
+
+class SignatureIndex(object):
+
+    '''A read-only, memory-mapped signature index file.'''
+
+    def __init__(self, path):
+        '''Open and memory-map the index file.
+
+        Args:
+            path (str): The absolute path to an index file which was written by `write_index`.
+
+        Raises:
+            ValueError: If `path` is not a signature index file of the current format.
+
+        '''
+        super(SignatureIndex, self).__init__()
+        self.path = path
+        self._handle = open(path, 'rb')
+
+        try:
+            self._data = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, mmap.error):
+            self._handle.close()
+            raise ValueError('Path "{path}" is empty or cannot be mapped.'.format(path=path))
+
+        if len(self._data) < _HEADER.size:
+            self.close()
+            raise ValueError('Path "{path}" is not a signature index.'.format(path=path))
+
+        (magic, version, self._entries, self._modules, self._modules_offset, self._keys_offset) = \
+            _HEADER.unpack_from(self._data, 0)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError('Path "{path}" is not a signature index.'.format(path=path))
+
+    def _get_text(self, offset, length):
+        '''str: Read a UTF-8 string from the mapped file.'''
+        return self._data[offset:offset + length].decode('utf-8')
+
+    def _get_key(self, index):
+        '''bytes: Get the fully-qualified name of the `index`th entry.'''
+        (offset, length, _, _, _) = _KEY_ROW.unpack_from(
+            self._data, self._keys_offset + index * _KEY_ROW.size)
+
+        return self._data[offset:offset + length]
+
+    def _find(self, key):
+        '''int: The position of `key` in the key table or -1, if it was not found.'''
+        low = 0
+        high = self._entries
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self._get_key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self._entries and self._get_key(low) == key:
+            return low
+
+        return -1
+
+    def _is_stale(self, module_index):
+        '''bool: Check if the module that an entry came from has changed since the index was built.'''
+        (_, _, path_offset, path_length, dist_offset, dist_length, _, _, mtime) = \
+            _MODULE_ROW.unpack_from(self._data, self._modules_offset + module_index * _MODULE_ROW.size)
+
+        if path_length:
+            try:
+                if os.path.getmtime(self._get_text(path_offset, path_length)) != mtime:
+                    return True
+            except OSError:
+                return True
+
+        # The name of a distribution's metadata folder contains its version
+        # so, if the distribution was upgraded, the old folder will be gone.
+        #
+        if dist_length and not os.path.isdir(self._get_text(dist_offset, dist_length)):
+            return True
+
+        return False
+
+    def _read_parameters(self, offset):
+        '''list[`IndexedParameter`]: Decode the parameter record at `offset`.'''
+        (count, ) = _PARAMETER_COUNT.unpack_from(self._data, offset)
+        offset += _PARAMETER_COUNT.size
+        parameters = []
+
+        for _ in range(count):
+            (kind, name_length, default_length) = _PARAMETER_ROW.unpack_from(self._data, offset)
+            offset += _PARAMETER_ROW.size
+            name = self._get_text(offset, name_length)
+            offset += name_length
+            default = None
+
+            if default_length != _NO_DEFAULT:
+                default = self._get_text(offset, default_length)
+                offset += default_length
+
+            parameters.append(IndexedParameter(name, kind, default))
+
+        return parameters
+
+    def lookup(self, name):
+        '''Find the parameters of some callable object.
+
+        Args:
+            name (str): The fully-qualified name of a callable object. e.g. "re.sub".
+
+        Returns:
+            list[`IndexedParameter`] or NoneType:
+                The parameters of the callable object. If `name` was not
+                indexed or its module has changed since the index was built,
+                None is returned.
+
+        '''
+        index = self._find(name.encode('utf-8'))
+
+        if index == -1:
+            return None
+
+        (_, _, offset, _, module_index) = _KEY_ROW.unpack_from(
+            self._data, self._keys_offset + index * _KEY_ROW.size)
+
+        if self._is_stale(module_index):
+            return None
+
+        return self._read_parameters(offset)
+
+    def __len__(self):
+        '''int: The number of indexed callable objects.'''
+        return self._entries
+
+    def close(self):
+        '''Release the memory-mapped file.'''
+        self._data.close()
+        self._handle.close()
+
+
+def get_default_path():
+    '''str: The location where the signature index is written, if the user doesn't choose one.'''
+    root = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(root, 'vim-python-function-expander', 'signatures.idx')
+
+
+def get_index(path):
+    '''Get the signature index at `path`, re-using the already-opened index if possible.
+
+    Args:
+        path (str): The absolute path to a signature index file.
+
+    Returns:
+        `SignatureIndex` or NoneType: The found index, if `path` is a valid index file.
+
+    '''
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    if _INDEXES['path'] == path and _INDEXES['mtime'] == mtime:
+        return _INDEXES['index']
+
+    if _INDEXES['index']:
+        _INDEXES['index'].close()
+
+    try:
+        index = SignatureIndex(path)
+    except (IOError, OSError, ValueError):
+        index = None
+
+    _INDEXES.update({'path': path, 'mtime': mtime, 'index': index})
+
+    return index
+
+
+def _get_default_text(value):
+    '''str: Get a source-code representation of a live default value, if it has one.'''
+    text = repr(value)
+
+    # Objects which have no literal representation, like `<object object at 0x...>`,
+    # are no use as a default. `typeshed` uses "..." for unknown values so we do, too.
+    #
+    if text.startswith('<'):
+        return '...'
+
+    return text
+
+
+def _get_parameters(obj):
+    '''Get the parameters of a live callable object.
+
+    Args:
+        obj (callable): A function, class or any other callable object.
+
+    Returns:
+        list[`IndexedParameter`] or NoneType:
+            The found parameters. If `obj` has no introspectable signature,
+            None is returned.
+
+    '''
+    if not hasattr(inspect, 'signature'):
+        return _get_legacy_parameters(obj)
+
+    try:
+        signature = inspect.signature(obj)
+    except (TypeError, ValueError):
+        return None
+
+    parameters = []
+
+    for parameter in signature.parameters.values():
+        default = None
+
+        if parameter.default is not parameter.empty:
+            default = _get_default_text(parameter.default)
+
+        parameters.append(IndexedParameter(parameter.name, int(parameter.kind), default))
+
+    return parameters
+
+
+def _get_legacy_parameters(obj):
+    '''list[`IndexedParameter`] or NoneType: Get the parameters of `obj`, using Python 2's `inspect`.'''
+    drop_first = False
+
+    if inspect.isclass(obj):
+        obj = getattr(obj, '__init__', None)
+        drop_first = True
+    elif inspect.ismethod(obj):
+        drop_first = obj.__self__ is not None
+
+    try:
+        (args, varargs, varkw, defaults) = inspect.getargspec(obj)  # pylint: disable=deprecated-method
+    except TypeError:
+        return None
+
+    if drop_first:
+        args = args[1:]
+
+    defaults = defaults or ()
+    first_default = len(args) - len(defaults)
+    parameters = []
+
+    for index, name in enumerate(args):
+        default = None
+
+        if index >= first_default:
+            default = _get_default_text(defaults[index - first_default])
+
+        parameters.append(IndexedParameter(name, POSITIONAL_OR_KEYWORD, default))
+
+    if varargs:
+        parameters.append(IndexedParameter(varargs, VAR_POSITIONAL))
+
+    if varkw:
+        parameters.append(IndexedParameter(varkw, VAR_KEYWORD))
+
+    return parameters
+
+
+def _get_dotted_name(node):
+    '''str: Get the source-code of a name like "foo" or "foo.bar.fizz" or "", if `node` isn't one.'''
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        parent = _get_dotted_name(node.value)
+
+        if parent:
+            return parent + '.' + node.attr
+
+    return ''
+
+
+def _get_stub_default_text(node):
+    '''str: Get the source-code representation of a default value in a stub file.'''
+    if hasattr(ast, 'unparse'):
+        return ast.unparse(node)
+
+    name = _get_dotted_name(node)
+
+    if name:
+        return name
+
+    # `ast.Constant`, `ast.NameConstant`, `ast.Num` and `ast.Str`. Other
+    # nodes, like `ast.Subscript`, also have a "value" but it's another node
+    #
+    for attribute in ('value', 'n', 's'):
+        value = getattr(node, attribute, node)
+
+        if not isinstance(value, ast.AST):
+            return repr(value)
+
+    return '...'
+
+
+def _get_stub_parameters(node, is_method=False):
+    '''Get the parameters of a function which was defined in a stub file.
+
+    Args:
+        node (`ast.FunctionDef`): The function to get parameters for.
+        is_method (bool, optional): If True, the first parameter ("self" or "cls") is skipped.
+
+    Returns:
+        list[`IndexedParameter`]: The found parameters.
+
+    '''
+    arguments = node.args
+    positional = [(argument, POSITIONAL_ONLY) for argument in getattr(arguments, 'posonlyargs', [])]
+    positional.extend((argument, POSITIONAL_OR_KEYWORD) for argument in arguments.args)
+    first_default = len(positional) - len(arguments.defaults)
+    parameters = []
+
+    for index, (argument, kind) in enumerate(positional):
+        default = None
+
+        if index >= first_default:
+            default = _get_stub_default_text(arguments.defaults[index - first_default])
+
+        parameters.append(IndexedParameter(argument.arg, kind, default))
+
+    if is_method:
+        parameters = parameters[1:]
+
+    if arguments.vararg:
+        parameters.append(IndexedParameter(arguments.vararg.arg, VAR_POSITIONAL))
+
+    for argument, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+        if default is not None:
+            default = _get_stub_default_text(default)
+
+        parameters.append(IndexedParameter(argument.arg, KEYWORD_ONLY, default))
+
+    if arguments.kwarg:
+        parameters.append(IndexedParameter(arguments.kwarg.arg, VAR_KEYWORD))
+
+    return parameters
+
+
+def _get_decorator_names(node):
+    '''set[str]: The names of the decorators of a function, like "staticmethod".'''
+    return {_get_dotted_name(decorator) for decorator in node.decorator_list}
+
+
+def get_stub_signatures(path):
+    '''Read every public, module-level callable object out of a stub (.pyi) file.
+
+    Args:
+        path (str): The absolute path to a stub file.
+
+    Returns:
+        dict[str, list[`IndexedParameter`]]:
+            The name of each public function, class and method and its
+            parameters. Classes use the parameters of their `__init__`
+            method. Methods are named like "Class.method" and have the
+            parameters that they'd have if they were called through their class.
+
+    '''
+    with open(path, 'rb') as handle:
+        try:
+            tree = ast.parse(handle.read(), path)
+        except (SyntaxError, ValueError):
+            return dict()
+
+    functions = (ast.FunctionDef, getattr(ast, 'AsyncFunctionDef', ast.FunctionDef))
+    signatures = dict()
+
+    for node in tree.body:
+        name = getattr(node, 'name', '')
+
+        if not name or name.startswith('_'):
+            continue
+
+        if isinstance(node, functions):
+            signatures[node.name] = _get_stub_parameters(node)
+        elif isinstance(node, ast.ClassDef):
+            for child in node.body:
+                if not isinstance(child, functions):
+                    continue
+
+                if child.name == '__init__':
+                    signatures[node.name] = _get_stub_parameters(child, is_method=True)
+                elif not child.name.startswith('_'):
+                    # A method called through its class still needs "self"
+                    signatures[node.name + '.' + child.name] = _get_stub_parameters(
+                        child, is_method='classmethod' in _get_decorator_names(child))
+
+    return signatures
+
+
+def _get_stub_path(module):
+    '''str: Find the stub file (.pyi) of a live module, if there is one.'''
+    path = getattr(module, '__file__', None) or ''
+    stub = os.path.splitext(path)[0] + '.pyi'
+
+    if path and os.path.isfile(stub):
+        return stub
+
+    # PEP 561 stub-only packages, e.g. "pandas-stubs/core/frame.pyi"
+    parts = module.__name__.split('.')
+    parts[0] += '-stubs'
+
+    for root in sys.path:
+        for stub in (os.path.join(root, *parts) + '.pyi',
+                     os.path.join(os.path.join(root, *parts), '__init__.pyi')):
+            if os.path.isfile(stub):
+                return stub
+
+    return ''
+
+
+def _get_distributions():
+    '''Find the metadata folder of every installed distribution, by top-level module name.
+
+    Returns:
+        dict[str, tuple[str, str]]: Each top-level module and its metadata folder and version.
+
+    '''
+    distributions = dict()
+
+    for root in sys.path:
+        try:
+            names = os.listdir(root or '.')
+        except OSError:
+            continue
+
+        for name in names:
+            (base, extension) = os.path.splitext(name)
+
+            if extension not in ('.dist-info', '.egg-info'):
+                continue
+
+            (project, _, version) = base.partition('-')
+            version = version.split('-')[0]
+            folder = os.path.abspath(os.path.join(root or '.', name))
+            top_levels = [project.replace('-', '_').lower()]
+
+            try:
+                with open(os.path.join(folder, 'top_level.txt')) as handle:
+                    top_levels.extend(line.strip() for line in handle if line.strip())
+            except (IOError, OSError):
+                pass
+
+            for top_level in top_levels:
+                distributions.setdefault(top_level, (folder, version))
+
+    return distributions
+
+
+def _iter_module_names(names=None):
+    '''Find the name of every module that should be indexed.
+
+    Args:
+        names (iter[str], optional):
+            The top-level modules to index. If no names are given, every
+            built-in and importable top-level module is used.
+
+    Yields:
+        str: The name of each module to index.
+
+    '''
+    if not names:
+        names = list(sys.builtin_module_names)
+        names.extend(name for (_, name, _) in pkgutil.iter_modules())
+
+    for name in sorted(set(names)):
+        if _is_skipped(name):
+            continue
+
+        yield name
+
+        try:
+            module = __import__(name, fromlist=['__name__'])
+        except BaseException:  # pylint: disable=broad-except
+            continue
+
+        paths = getattr(module, '__path__', None)
+
+        if not paths:
+            continue
+
+        for (_, submodule, _) in pkgutil.walk_packages(paths, prefix=name + '.', onerror=lambda _: None):
+            if not _is_skipped(submodule):
+                yield submodule
+
+
+def _is_skipped(name):
+    '''bool: Check if the module called `name` should not be indexed.'''
+    return any(part.startswith('_') or part in _SKIPPED_MODULES for part in name.split('.'))
+
+
+def _get_class_signatures(class_):
+    '''Get the parameters of every public method that a live class defines.
+
+    Args:
+        class_ (type): The class to read. Inherited methods are not included.
+
+    Returns:
+        dict[str, list[`IndexedParameter`]]:
+            Each public method name and the parameters that it has when
+            it's called through the class.
+
+    '''
+    signatures = dict()
+
+    for name in list(vars(class_)):
+        if name.startswith('_'):
+            continue
+
+        try:
+            method = getattr(class_, name)
+        except Exception:  # pylint: disable=broad-except
+            continue
+
+        if not inspect.isroutine(method):
+            continue
+
+        parameters = _get_parameters(method)
+
+        if parameters is not None:
+            signatures[name] = parameters
+
+    return signatures
+
+
+def _get_module_signatures(module):
+    '''Get the parameters of every public callable object in a live module.
+
+    Args:
+        module (module): The imported module to read.
+
+    Returns:
+        dict[str, list[`IndexedParameter`]]:
+            Each public name and its parameters. The methods of classes
+            are named like "Class.method".
+
+    '''
+    names = getattr(module, '__all__', None)
+
+    if not isinstance(names, (list, tuple)):
+        names = [name for name in dir(module) if not name.startswith('_')]
+
+    signatures = dict()
+
+    for name in names:
+        try:
+            obj = getattr(module, name)
+        except Exception:  # pylint: disable=broad-except
+            continue
+
+        if not (inspect.isclass(obj) or inspect.isroutine(obj)):
+            continue
+
+        parameters = _get_parameters(obj)
+
+        if parameters is not None:
+            signatures[name] = parameters
+
+        if inspect.isclass(obj):
+            for method, parameters in _get_class_signatures(obj).items():
+                signatures[name + '.' + method] = parameters
+
+    stub = _get_stub_path(module)
+
+    if stub:
+        signatures.update(get_stub_signatures(stub))
+
+    return signatures
+
+
+def collect(names=None):
+    '''Import modules and read the signatures of their public callable objects.
+
+    Args:
+        names (iter[str], optional):
+            The top-level modules to index. If no names are given, every
+            module in the current environment is indexed.
+
+    Returns:
+        tuple[list[tuple[str, str, float, str, str]], dict[str, tuple[list[`IndexedParameter`], int]]]:
+            The indexed modules (name, file path, file mtime, distribution
+            metadata folder, distribution version) and each callable object's
+            fully-qualified name, parameters and index into the modules.
+
+    '''
+    distributions = _get_distributions()
+    modules = []
+    entries = dict()
+
+    for name in _iter_module_names(names):
+        try:
+            module = __import__(name, fromlist=['__name__'])
+        except BaseException:  # pylint: disable=broad-except
+            continue
+
+        signatures = _get_module_signatures(module)
+
+        if not signatures:
+            continue
+
+        path = getattr(module, '__file__', None) or ''
+
+        try:
+            mtime = os.path.getmtime(path) if path else 0.0
+        except OSError:
+            (path, mtime) = ('', 0.0)
+
+        (folder, version) = distributions.get(name.split('.')[0], ('', ''))
+        modules.append((name, path, mtime, folder, version))
+
+        for callable_name, parameters in signatures.items():
+            entries['{module}.{name}'.format(module=name, name=callable_name)] = \
+                (parameters, len(modules) - 1)
+
+    return (modules, entries)
+
+
+def write_index(path, modules, entries):
+    '''Write a signature index file.
+
+    Args:
+        path (str):
+            The absolute path where the index will be written.
+            The file is replaced atomically, so readers never see a partial file.
+        modules (list[tuple[str, str, float, str, str]]):
+            Each indexed module's name, file path, file mtime, distribution
+            metadata folder and distribution version.
+        entries (dict[str, tuple[list[`IndexedParameter`], int]]):
+            Each fully-qualified name, its parameters and the index of its module in `modules`.
+
+    '''
+    blob = bytearray()
+    # The blob starts right after the tables, so every offset is known up-front
+    blob_offset = _HEADER.size + len(modules) * _MODULE_ROW.size + len(entries) * _KEY_ROW.size
+
+    def _add(data):
+        '''tuple[int, int]: Append `data` to the blob and return its absolute offset and length.'''
+        offset = blob_offset + len(blob)
+        blob.extend(data)
+
+        return (offset, len(data))
+
+    def _add_text(text):
+        '''tuple[int, int]: Append `text` to the blob, as UTF-8.'''
+        return _add(text.encode('utf-8'))
+
+    module_rows = []
+
+    for (name, module_path, mtime, folder, version) in modules:
+        module_rows.append(_MODULE_ROW.pack(*(
+            _add_text(name) + _add_text(module_path) + _add_text(folder) + _add_text(version) + (mtime, ))))
+
+    key_rows = []
+
+    for name in sorted(entries, key=lambda text: text.encode('utf-8')):
+        (parameters, module_index) = entries[name]
+        record = bytearray(_PARAMETER_COUNT.pack(len(parameters)))
+
+        for parameter in parameters:
+            name_data = parameter.name.encode('utf-8')
+            default_data = b'' if parameter.default is None else parameter.default.encode('utf-8')[:_NO_DEFAULT - 1]
+            default_length = _NO_DEFAULT if parameter.default is None else len(default_data)
+            record.extend(_PARAMETER_ROW.pack(parameter.kind, len(name_data), default_length))
+            record.extend(name_data)
+            record.extend(default_data)
+
+        key_rows.append(_KEY_ROW.pack(*(_add_text(name) + _add(bytes(record)) + (module_index, ))))
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(entries),
+        len(modules),
+        _HEADER.size,
+        _HEADER.size + len(modules) * _MODULE_ROW.size,
+    )
+
+    directory = os.path.dirname(path)
+
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    temporary = path + '.tmp'
+
+    with open(temporary, 'wb') as handle:
+        handle.write(header)
+        handle.write(b''.join(module_rows))
+        handle.write(b''.join(key_rows))
+        handle.write(bytes(blob))
+
+    if os.path.isfile(path) and not hasattr(os, 'replace'):
+        os.remove(path)
+
+    getattr(os, 'replace', os.rename)(temporary, path)
+
+
+def build(path, names=None):
+    '''Index the current Python environment and write the result to `path`.
+
+    Args:
+        path (str): The absolute path where the index will be written.
+        names (iter[str], optional): The top-level modules to index. Default: every module.
+
+    Returns:
+        int: The number of indexed callable objects.
+
+    '''
+    (modules, entries) = collect(names)
+    write_index(path, modules, entries)
+
+    return len(entries)
+
+
+class IndexBuild(object):
+
+    '''A signature index which is being built by another process.'''
+
+    def __init__(self, process, path, output):
+        '''Store the process and where its output is written.
+
+        Args:
+            process (`subprocess.Popen`): The running builder process.
+            path (str): The absolute path where the index will be written.
+            output (file): A temporary file which the process writes its stdout and stderr to.
+
+        '''
+        super(IndexBuild, self).__init__()
+        self.process = process
+        self.path = path
+        self._output = output
+
+    def poll(self):
+        '''Check if the build has finished and, if so, clean up after it.
+
+        Returns:
+            tuple[bool, str] or NoneType:
+                None if the build is still running. Otherwise, whether the
+                build succeeded and the last line that the builder printed.
+
+        '''
+        if self.process.poll() is None:
+            return None
+
+        self._output.seek(0)
+        lines = [line.strip() for line in self._output.read().decode('utf-8', 'replace').splitlines()]
+        self._output.close()
+        lines = [line for line in lines if line]
+        message = lines[-1] if lines else 'The builder exited with code {code}.'.format(
+            code=self.process.returncode)
+
+        return (self.process.returncode == 0, message)
+
+
+def start_build(executable, path, names=None):
+    '''Build an index for another Python environment, in the background.
+
+    Args:
+        executable (str): The Python interpreter of the environment to index.
+        path (str): The absolute path where the index will be written.
+        names (iter[str], optional): The top-level modules to index. Default: every module.
+
+    Returns:
+        `IndexBuild`: The running build. Poll it to find out when it's finished.
+
+    '''
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [root] + [item for item in [environment.get('PYTHONPATH')] if item])
+
+    # The output goes to a file, instead of a pipe, so a long traceback can't fill
+    # a pipe's buffer and block the builder while nothing is reading from it
+    #
+    output = tempfile.TemporaryFile()
+
+    try:
+        with open(os.devnull, 'rb') as devnull:
+            process = subprocess.Popen(
+                [executable, '-m', 'python_function_expander.signature_index', path] + list(names or []),
+                env=environment,
+                stdin=devnull,
+                stdout=output,
+                stderr=subprocess.STDOUT,
+            )
+    except Exception:
+        output.close()
+
+        raise
+
+    return IndexBuild(process, path, output)
+
+
+def main(arguments=None):
+    '''Build a signature index from the command-line.'''
+    parser = argparse.ArgumentParser(description='Index the call signatures of a Python environment.')
+    parser.add_argument('path', help='The file to write the index to.')
+    parser.add_argument('modules', nargs='*', help='The top-level modules to index. Default: every module.')
+    arguments = parser.parse_args(arguments)
+
+    count = build(os.path.abspath(arguments.path), arguments.modules)
+    sys.stdout.write('Indexed {count} signatures.\n'.format(count=count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Remember the signatures of expanded calls so that they can be trimmed without inference.
+
+When a call is expanded, its parameters and their default values are
+already known. This module stores them and marks the start of the call
+with a Neovim extmark or a Vim text property. Marks move with the text as
+the user edits the buffer so, when the call is trimmed later, the mark
+tells the trimmer that the call is the same one that was expanded.
+
+If Vim supports neither extmarks nor text properties, nothing is
+remembered and the trimmer infers the call, like it always has.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+
+# IMPORT THIRD-PARTY LIBRARIES
+import vim
+
+
+_NAME = 'python_function_expander_signature'
+_MAXIMUM_SIGNATURES = 50  # Per-buffer. Old signatures are forgotten first
+_SIGNATURES = dict()
+_STATE = {'backend': None, 'namespace': None, 'next_id': 1}
+
+
+def _get_backend():
+    '''str: Find how marks can be made in this Vim. "extmark", "textprop" or "".'''
+    if _STATE['backend'] is not None:
+        return _STATE['backend']
+
+    (has_extmarks, has_text_properties) = vim.eval(
+        "[exists('*nvim_buf_set_extmark'), exists('*prop_add')]")
+
+    if has_extmarks == '1':
+        _STATE['backend'] = 'extmark'
+        _STATE['namespace'] = int(vim.eval("nvim_create_namespace('{name}')".format(name=_NAME)))
+    elif has_text_properties == '1':
+        _STATE['backend'] = 'textprop'
+        vim.command(
+            "if empty(prop_type_get('{name}')) | call prop_type_add('{name}', {{}}) | endif".format(name=_NAME))
+    else:
+        _STATE['backend'] = ''
+
+    return _STATE['backend']
+
+
+def _to_byte_column(line, column):
+    '''int: Convert a character `column` of `line` into the byte column that Vim uses.'''
+    if isinstance(line, bytes):
+        return column
+
+    return len(line[:column].encode('utf-8'))
+
+
+def _add_mark(number, row, column):
+    '''Mark a position in a buffer.
+
+    Args:
+        number (int): The Vim buffer number to add the mark to.
+        row (int): The 1-based line to mark.
+        column (int): The 0-based byte column to mark.
+
+    Returns:
+        int or NoneType: The new mark's ID, if a mark could be made.
+
+    '''
+    backend = _get_backend()
+
+    if backend == 'extmark':
+        return int(vim.eval('nvim_buf_set_extmark({number}, {namespace}, {row}, {column}, {{}})'.format(
+            number=number, namespace=_STATE['namespace'], row=row - 1, column=column)))
+
+    if backend == 'textprop':
+        identifier = _STATE['next_id']
+        _STATE['next_id'] += 1
+        vim.command("call prop_add({row}, {column}, {{'type': '{name}', 'id': {identifier}, 'bufnr': {number}}})".format(
+            row=row, column=column + 1, name=_NAME, identifier=identifier, number=number))
+
+        return identifier
+
+    return None
+
+
+def _get_mark(number, identifier):
+    '''tuple[int, int] or NoneType: Get the 1-based row and 0-based byte column of a mark.'''
+    backend = _get_backend()
+
+    if backend == 'extmark':
+        position = vim.eval('nvim_buf_get_extmark_by_id({number}, {namespace}, {identifier}, {{}})'.format(
+            number=number, namespace=_STATE['namespace'], identifier=identifier))
+
+        if not position:
+            return None
+
+        return (int(position[0]) + 1, int(position[1]))
+
+    if backend == 'textprop':
+        found = vim.eval(
+            "prop_find({{'id': {identifier}, 'type': '{name}', 'bufnr': {number}, 'lnum': 1, 'col': 1}}, 'f')".format(
+                identifier=identifier, name=_NAME, number=number))
+
+        if not found:
+            return None
+
+        return (int(found['lnum']), int(found['col']) - 1)
+
+    return None
+
+
+def _delete_mark(number, identifier):
+    '''Remove a mark from a buffer, if it still exists.'''
+    backend = _get_backend()
+
+    if backend == 'extmark':
+        vim.eval('nvim_buf_del_extmark({number}, {namespace}, {identifier})'.format(
+            number=number, namespace=_STATE['namespace'], identifier=identifier))
+    elif backend == 'textprop':
+        vim.command("silent! call prop_remove({{'id': {identifier}, 'type': '{name}', 'bufnr': {number}, 'all': 1}})".format(
+            identifier=identifier, name=_NAME, number=number))
+
+
+def remember(row, line, column, name, defaults):
+    '''Remember the signature of a call that is being expanded in the current buffer.
+
+    Args:
+        row (int):
+            The 1-based line of the call.
+        line (str):
+            The text of the call's line.
+        column (int):
+            The 0-based character where the callee's name starts in `line`.
+        name (str):
+            The callee, as it was written. e.g. "os.path.join".
+        defaults (dict[str, str]):
+            The keywords of the call's parameters and their default values.
+
+    '''
+    number = vim.current.buffer.number
+    identifier = _add_mark(number, row, _to_byte_column(line, column))
+
+    if identifier is None:
+        return
+
+    signatures = _SIGNATURES.setdefault(number, collections.OrderedDict())
+    signatures[identifier] = (name, defaults)
+
+    while len(signatures) > _MAXIMUM_SIGNATURES:
+        (old, _) = signatures.popitem(last=False)
+        _delete_mark(number, old)
+
+
+def get_remembered_parameters(row, column, callee):
+    '''Get the default values of a call which was expanded, if it hasn't changed since.
+
+    Args:
+        row (int): The 1-based line where the call starts.
+        column (int): The 0-based byte column where the call starts.
+        callee (str): The object that the call calls, as it's written now. e.g. "os.path.join".
+
+    Returns:
+        dict[str, str] or NoneType:
+            The keywords of the call's parameters and their default values.
+            If the call wasn't expanded, or its callee or position in the
+            buffer no longer match its mark, return None.
+
+    '''
+    number = vim.current.buffer.number
+    signatures = _SIGNATURES.get(number)
+
+    if not signatures:
+        return None
+
+    for identifier, (name, defaults) in reversed(list(signatures.items())):
+        if name == callee and _get_mark(number, identifier) == (row, column):
+            return defaults
+
+    return None
+
+
+def forget(number):
+    '''Forget every signature of the buffer whose Vim buffer number is `number`.'''
+    _SIGNATURES.pop(number, None)
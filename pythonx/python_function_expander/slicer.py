@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Reduce a large Python buffer to just the code that jedi needs to find a call signature.
+
+jedi parses and infers the whole buffer that it is given. In a buffer with
+thousands of lines, most of that work is for code which has nothing to do
+with the function being called at the user's cursor.
+
+This module keeps only these top-level statements:
+
+- import statements (and try/if blocks that contain imports)
+- module-level assignments, for loops, with statements, functions and
+  classes whose names are used by the statement that the cursor is in, or
+  by any other statement that is kept
+- the statement that the cursor is in, up to the cursor's line
+
+Every other line is replaced by an empty line so that line numbers stay
+the same as the original buffer's. Lines after the cursor are removed.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+import functools
+import tokenize
+
+
+_CLAUSE_KEYWORDS = frozenset(('elif', 'else', 'except', 'finally'))
+_CLOSE_BRACKETS = frozenset((')', ']', '}'))
+_DEFINITION_KEYWORDS = frozenset(('def', 'class'))
+_IMPORT_KEYWORDS = frozenset(('import', 'from'))
+_IMPORT_BLOCK_KEYWORDS = frozenset(('if', 'try'))
+_OPEN_BRACKETS = frozenset(('(', '[', '{'))
+_SKIPPED_TOKENS = frozenset((
+    tokenize.COMMENT,
+    tokenize.DEDENT,
+    tokenize.ENDMARKER,
+    tokenize.INDENT,
+    tokenize.NEWLINE,
+    tokenize.NL,
+))
+
+# A top-level statement of a module
+#
+# start (int): The 0-based line where the statement starts, including its decorators.
+# header (list[str]): Every token of the statement's first line. e.g. "def foo(bar):"
+# names (set[str]): Every name that is used anywhere in the statement.
+#
+_Statement = collections.namedtuple('_Statement', 'start header names')
+
+
+def _get_statements(lines):
+    '''Split Python source code into its top-level statements.
+
+    Args:
+        lines (list[str]): The lines of Python source code, without line endings.
+
+    Returns:
+        list[`_Statement`] or NoneType:
+            The found statements or None, if the code is too broken to be split.
+
+    '''
+    statements = []
+    start = None
+    header = []
+    names = set()
+    at_line_start = True
+    in_header = False
+    is_decorated = False
+    readline = functools.partial(next, iter([line + '\n' for line in lines]))
+
+    try:
+        for type_, string, (row, column), _, _ in tokenize.generate_tokens(readline):
+            if type_ == tokenize.NEWLINE:
+                at_line_start = True
+                in_header = False
+
+            if type_ in _SKIPPED_TOKENS:
+                continue
+
+            if at_line_start and column == 0 and string in _CLAUSE_KEYWORDS and start is not None:
+                # "else:", "except:", etc are part of the statement above them
+                pass
+            elif at_line_start and column == 0:
+                # Decorators belong to the definition below them
+                if start is not None and not is_decorated:
+                    statements.append(_Statement(start, header, names))
+                    start = None
+
+                if start is None:
+                    start = row - 1
+                    names = set()
+
+                header = []
+                in_header = True
+                is_decorated = string == '@'
+
+            at_line_start = False
+
+            if in_header:
+                header.append(string)
+
+            if type_ == tokenize.NAME:
+                names.add(string)
+    except tokenize.TokenError:
+        # The cursor's line is usually incomplete. e.g. "foo(". That's expected
+        pass
+    except (IndentationError, SyntaxError):
+        return None
+
+    if start is not None:
+        statements.append(_Statement(start, header, names))
+
+    return statements
+
+
+def _get_alias_names(header):
+    '''set[str]: Find the names which follow "as" in a statement. e.g. "with open(path) as handle:".'''
+    names = set()
+    depth = 0
+    is_target = False
+
+    for token in header:
+        if token in _OPEN_BRACKETS:
+            depth += 1
+        elif token in _CLOSE_BRACKETS:
+            depth -= 1
+        elif token == 'as':
+            is_target = True
+        elif depth == 0 and token in (',', ':'):
+            is_target = False
+        elif is_target and _is_name(token):
+            names.add(token)
+
+    return names
+
+
+def _get_imported_names(header):
+    '''set[str]: Find the names that an import statement binds. e.g. "os" in "import os.path".'''
+    names = set()
+    name = None
+    is_alias = False
+
+    for token in header[header.index('import') + 1:]:
+        if token == ',':
+            names.add(name)
+            name = None
+        elif token == 'as':
+            is_alias = True
+        elif _is_name(token) and (name is None or is_alias):
+            name = token
+            is_alias = False
+
+    names.add(name)
+    names.discard(None)
+
+    return names
+
+
+def _get_defined_names(header):
+    '''set[str]: Find the names that a top-level statement defines, if any.'''
+    if not header:
+        return set()
+
+    if header[0] == 'async':
+        header = header[1:]
+
+    if header[0] in _DEFINITION_KEYWORDS and len(header) > 1:
+        return {header[1]}
+
+    if header[0] == 'for':
+        end = header.index('in') if 'in' in header else len(header)
+
+        return {token for token in header[1:end] if _is_name(token)}
+
+    if header[0] == 'with':
+        return _get_alias_names(header)
+
+    if header[0] in _IMPORT_KEYWORDS and 'import' in header:
+        return _get_imported_names(header)
+
+    if '=' not in header:
+        return set()
+
+    # This may find a few names which are not assigned, like "foo" in "foo[bar] = 8".
+    # That's fine. It just means that a statement is kept that didn't need to be
+    #
+    return {token for token in header[:header.index('=')] if _is_name(token)}
+
+
+def _is_name(token):
+    '''bool: Check if `token` is an identifier.'''
+    return (token[:1].isalpha() or token[:1] == '_') and all(
+        character.isalnum() or character == '_' for character in token)
+
+
+def _is_import(statement):
+    '''bool: Check if a top-level statement imports anything.'''
+    if not statement.header:
+        return False
+
+    if statement.header[0] in _IMPORT_KEYWORDS:
+        return True
+
+    return statement.header[0] in _IMPORT_BLOCK_KEYWORDS and 'import' in statement.names
+
+
+def _get_kept_statements(statements, names):
+    '''Find every statement that the last statement in `statements` depends on.
+
+    A statement is kept if it defines a name which a kept statement uses.
+    So in "a = f()", "b = a.x", "foo(b", both assignments and the
+    definition of "f" are kept.
+
+    Args:
+        statements (list[`_Statement`]):
+            Every top-level statement of a module. The last one is the
+            statement that the cursor is in.
+        names (iter[str]):
+            Any other names which should be treated as used.
+
+    Returns:
+        list[`_Statement`]: The statements that need to be kept, in their original order.
+
+    '''
+    enclosing = statements[-1]
+    kept = {enclosing.start}
+    used = set(enclosing.names)
+    used.update(names)
+    remaining = []
+
+    for statement in statements[:-1]:
+        if _is_import(statement):
+            kept.add(statement.start)
+            used.update(statement.names)
+        else:
+            remaining.append((statement, _get_defined_names(statement.header)))
+
+    found = True
+
+    while found:
+        found = False
+
+        for statement, defined in list(remaining):
+            if defined & used:
+                remaining.remove((statement, defined))
+                kept.add(statement.start)
+                used.update(statement.names)
+                found = True
+
+    return [statement for statement in statements if statement.start in kept]
+
+
+def get_sliced_lines(lines, row, names=()):
+    '''Remove every line that jedi doesn't need to find the call signature at `row`.
+
+    Args:
+        lines (list[str]):
+            The lines of Python source code, without line endings. Every
+            line after `row` is ignored.
+        row (int):
+            The 1-based line of the user's cursor.
+        names (iter[str], optional):
+            Names which must stay defined, even if the cursor's statement
+            doesn't use them. e.g. variable names which are checked for
+            completions. Default: ().
+
+    Returns:
+        list[str] or NoneType:
+            The first `row` lines of `lines`, where every line that isn't
+            needed is empty. If the code is too broken to be split into
+            statements, None is returned and the full source should be used.
+
+    '''
+    lines = list(lines[:row])
+    statements = _get_statements(lines)
+
+    if not statements:
+        return None
+
+    ends = {
+        statement.start: end for statement, end in
+        zip(statements, [statement.start for statement in statements[1:]] + [len(lines)])
+    }
+    sliced = [''] * len(lines)
+
+    for statement in _get_kept_statements(statements, names):
+        end = ends[statement.start]
+        sliced[statement.start:end] = lines[statement.start:end]
+
+    return sliced
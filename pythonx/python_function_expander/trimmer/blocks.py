@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Split a module into its top-level blocks so that only the blocks that matter are parsed.
+
+A call is always inside of one top-level statement (a function, a class,
+an assignment, etc). Parsing just that statement, instead of the whole
+module, makes trimming in a huge file about as fast as trimming in a small
+one. Each parse is cached by the text that was parsed so, after an edit,
+a statement that didn't change isn't parsed again.
+
+Blocks are found by tokenizing the module and looking for logical lines
+which start at column 0, so text at column 0 inside of a multi-line
+string is never mistaken for a statement. If the module can't be
+tokenized, lines which start at column 0 are used, instead. If a block
+can't be parsed, callers should parse the whole module.
+
+This module must never import astroid.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import collections
+import functools
+import re
+import tokenize
+
+
+_CLAUSE_EXPRESSION = re.compile(r'(?:elif|else|except|finally)\b')
+_CLAUSE_KEYWORDS = frozenset(('elif', 'else', 'except', 'finally'))
+_DEFINITION_EXPRESSION = re.compile(r'(?:async\s+)?(?:def|class)\s+(?P<name>\w+)')
+_ASSIGNMENT_EXPRESSION = re.compile(r'(?P<names>[\w\s,.\[\]()*]+?)\s*(?::[^=]*)?=(?!=)')
+_IMPORT_EXPRESSION = re.compile(r'(?:import|from)\s')
+_IMPORT_BLOCK_EXPRESSION = re.compile(r'(?:if|try)\b')
+_NAME_EXPRESSION = re.compile(r'[A-Za-z_]\w*')
+_MAXIMUM_PARSES = 64
+_PARSES = collections.OrderedDict()
+_SKIPPED_TOKENS = frozenset((
+    tokenize.COMMENT,
+    tokenize.DEDENT,
+    tokenize.ENDMARKER,
+    tokenize.INDENT,
+    tokenize.NL,
+))
+# The lines that were last split into blocks and their blocks
+_LAST_BLOCKS = [None, None]
+
+
+def _is_block_start(line):
+    '''bool: Check if `line` could be the first line of a top-level statement.'''
+    if not line or line[0] in ' \t#)]}':
+        return False
+
+    return not _CLAUSE_EXPRESSION.match(line)
+
+
+def _get_tokenized_starts(lines):
+    '''Find the first line of every top-level logical line of a module.
+
+    Args:
+        lines (list[str]): The lines of a Python module.
+
+    Raises:
+        IndentationError or SyntaxError: If `lines` can't be tokenized.
+
+    Returns:
+        list[tuple[int, str]]: The 0-based line and the first token of each logical line.
+
+    '''
+    starts = []
+    at_line_start = True
+    readline = functools.partial(next, iter([line + '\n' for line in lines]))
+
+    try:
+        for type_, string, (row, column), _, _ in tokenize.generate_tokens(readline):
+            if type_ == tokenize.NEWLINE:
+                at_line_start = True
+            elif type_ not in _SKIPPED_TOKENS:
+                if at_line_start and column == 0:
+                    starts.append((row - 1, string))
+
+                at_line_start = False
+    except tokenize.TokenError:
+        # The last statement isn't finished. e.g. "foo(". It's a block of its own
+        pass
+
+    return starts
+
+
+def _get_line_starts(lines):
+    '''list[tuple[int, str]]: Find the lines which start at column 0, if `lines` can't be tokenized.'''
+    return [(index, line[0]) for index, line in enumerate(lines) if _is_block_start(line)]
+
+
+def get_blocks(lines):
+    '''Find the top-level statements of a module.
+
+    Args:
+        lines (list[str]): The lines of a Python module.
+
+    Returns:
+        list[tuple[int, int]]:
+            The 0-based start and end line of each statement. Blank lines
+            and comments after a statement are part of the statement.
+
+    '''
+    if lines == _LAST_BLOCKS[0]:
+        return list(_LAST_BLOCKS[1])
+
+    try:
+        found = [(index, token) for index, token in _get_tokenized_starts(lines)
+                 if token not in _CLAUSE_KEYWORDS]
+    except (IndentationError, SyntaxError):
+        found = _get_line_starts(lines)
+
+    starts = []
+    is_decorated = False
+
+    for index, token in found:
+        # Decorators belong to the definition below them
+        if not is_decorated:
+            starts.append(index)
+
+        is_decorated = token == '@'
+
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+
+    blocks = list(zip(starts, starts[1:] + [len(lines)]))
+    _LAST_BLOCKS[:] = [list(lines), blocks]
+
+    return list(blocks)
+
+
+def get_block(lines, row):
+    '''tuple[int, int]: Find the 0-based start and end line of the top-level statement on a 1-based `row`.'''
+    for start, end in reversed(get_blocks(lines)):
+        if start < row:
+            return (start, end)
+
+    return (0, len(lines))
+
+
+def _get_defined_names(lines, start, end):
+    '''set[str]: Guess which names a top-level statement defines.'''
+    for line in lines[start:end]:
+        if not line.startswith('@'):
+            break
+    else:
+        return set()
+
+    match = _DEFINITION_EXPRESSION.match(line)
+
+    if match:
+        return {match.group('name')}
+
+    match = _ASSIGNMENT_EXPRESSION.match(line)
+
+    if match:
+        return set(_NAME_EXPRESSION.findall(match.group('names')))
+
+    return set()
+
+
+def _is_import(lines, start, end):
+    '''bool: Check if a top-level statement imports anything.'''
+    if _IMPORT_EXPRESSION.match(lines[start]):
+        return True
+
+    return bool(_IMPORT_BLOCK_EXPRESSION.match(lines[start])) and any(
+        _IMPORT_EXPRESSION.match(line.lstrip()) for line in lines[start:end])
+
+
+def get_context_lines(lines, row):
+    '''Keep only the top-level statements that a statement needs to be inferred.
+
+    These are the statement on `row`, every import and every statement
+    that defines a name which the statement on `row` uses. Statements which
+    define names that those statements use are kept too, and so on. e.g.
+    the base classes of a class.
+
+    Args:
+        lines (list[str]): The lines of a Python module.
+        row (int): The 1-based line of the statement to keep.
+
+    Returns:
+        list[str]:
+            A copy of `lines` where every line that isn't needed is empty,
+            so that line numbers stay the same.
+
+    '''
+    current = get_block(lines, row)
+    pending = [current]
+    used = set()
+    definitions = []
+    context = [''] * len(lines)
+
+    for start, end in get_blocks(lines):
+        if (start, end) == current:
+            continue
+
+        if _is_import(lines, start, end):
+            context[start:end] = lines[start:end]
+        else:
+            definitions.append((start, end, _get_defined_names(lines, start, end)))
+
+    while pending:
+        for start, end in pending:
+            context[start:end] = lines[start:end]
+            used.update(_NAME_EXPRESSION.findall('\n'.join(lines[start:end])))
+
+        pending = [(start, end) for start, end, names in definitions if names & used]
+        definitions = [definition for definition in definitions if not definition[2] & used]
+
+    return context
+
+
+def parse(parser, lines, start, end):
+    '''Parse some lines of a module, using a cached result if the lines haven't changed.
+
+    Args:
+        parser (callable[str]):
+            The function which parses the text. e.g. `ast.parse`.
+        lines (list[str]):
+            The lines of the module.
+        start (int):
+            The 0-based line to start parsing from.
+        end (int):
+            The 0-based line to stop parsing at.
+
+    Raises:
+        Exception: Whatever `parser` raises, if the lines can't be parsed.
+
+    Returns:
+        object: Whatever `parser` returns. Its line numbers match the module's.
+
+    '''
+    text = '\n'.join(lines[start:end])
+    key = (parser, start, text)
+
+    try:
+        result = _PARSES.pop(key)
+    except KeyError:
+        # The leading newlines make the parse's line numbers match the module's
+        result = parser('\n' * start + text)
+
+    _PARSES[key] = result
+
+    while len(_PARSES) > _MAXIMUM_PARSES:
+        _PARSES.popitem(last=False)
+
+    return result
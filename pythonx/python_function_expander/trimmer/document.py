@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Share one copy of some source code between every step of a trim.
+
+Each step of a trim needs the code in a different form. Parsers need
+the text, finding blocks and cursors needs its lines and rewriting a call
+needs its tokens and the offset of each line. A :class:`SourceDocument`
+makes each form only once, the first time that it's needed, instead of
+every step splitting and joining the code again.
+
+This module must never import astroid.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import functools
+import tokenize
+
+
+def _iter_lines(lines, row):
+    '''Yield every line from `row` onwards, with its newline, without copying `lines`.'''
+    for index in range(row, len(lines)):
+        yield lines[index] + '\n'
+
+
+class SourceDocument(object):
+
+    '''Some Python code and the forms of it that the trimmer uses.'''
+
+    def __init__(self, text=None, lines=None):
+        '''Store the code. Give it as text or as lines, not both.
+
+        Args:
+            text (str, optional): The code, as one string.
+            lines (list[str], optional): The code, split into lines. The lines must not end with a newline.
+
+        '''
+        super(SourceDocument, self).__init__()
+        self._text = text
+        self._lines = lines
+        self._offsets = None
+
+    @classmethod
+    def from_lines(cls, lines):
+        '''`SourceDocument`: Create a document from some lines, like the lines of a Vim buffer.'''
+        return cls(lines=lines)
+
+    @property
+    def text(self):
+        '''str: The code, as one string.'''
+        if self._text is None:
+            self._text = '\n'.join(self._lines)
+
+        return self._text
+
+    @property
+    def lines(self):
+        '''list[str]: The lines of the code. Don't modify it, make a copy instead.'''
+        if self._lines is None:
+            self._lines = self._text.split('\n')
+
+        return self._lines
+
+    @property
+    def offsets(self):
+        '''list[int]: The index in :attr:`text` where each line starts.'''
+        if self._offsets is None:
+            offsets = [0]
+
+            for line in self.lines:
+                offsets.append(offsets[-1] + len(line) + 1)
+
+            self._offsets = offsets
+
+        return self._offsets
+
+    def get_offset(self, row, column):
+        '''int: Convert a 0-based line and character column into an index of :attr:`text`.'''
+        return self.offsets[row] + column
+
+    def get_segment(self, row, column, end_row, end_column):
+        '''Get the text between two positions, like :func:`ast.get_source_segment`.
+
+        Args:
+            row (int): The 1-based line where the text starts.
+            column (int): The 0-based byte column where the text starts.
+            end_row (int): The 1-based line where the text ends.
+            end_column (int): The 0-based byte column where the text ends.
+
+        Returns:
+            str: The found text.
+
+        '''
+        lines = [line.encode('utf-8') for line in self.lines[row - 1:end_row]]
+
+        if len(lines) == 1:
+            return lines[0][column:end_column].decode('utf-8')
+
+        lines[0] = lines[0][column:]
+        lines[-1] = lines[-1][:end_column]
+
+        return b'\n'.join(lines).decode('utf-8')
+
+    def iter_tokens(self, row=0):
+        '''Tokenize the code, starting from some line.
+
+        The tokens are made as they're read so, if the caller stops early,
+        the rest of the code is never tokenized.
+
+        Args:
+            row (int, optional): The 0-based line to start tokenizing from. Default is 0.
+
+        Raises:
+            :class:`tokenize.TokenError`: If the code ends in the middle of a statement.
+
+        Yields:
+            tuple[int, str, tuple[int, int], tuple[int, int]]:
+                The type, text, start and end of each token. Each position
+                is a 0-based line and character column of the whole document.
+
+        '''
+        readline = functools.partial(next, _iter_lines(self.lines, row))
+
+        for type_, string, start, end, _ in tokenize.generate_tokens(readline):
+            yield (type_, string, (start[0] - 1 + row, start[1]), (end[0] - 1 + row, end[1]))
+
+
+def get_document(code):
+    '''`SourceDocument`: Wrap `code` in a document, unless it already is one.'''
+    if isinstance(code, SourceDocument):
+        return code
+
+    return SourceDocument(code)
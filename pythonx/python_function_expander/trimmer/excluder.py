@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Visitors which re-print astroid calls without some of their keywords.'''
+
+# IMPORT LOCAL LIBRARIES
+from . import call_visitor
+
+
+class _CommonParameterExcluder(call_visitor.MultiLineCallVisitor):
+
+    '''A class that can parse Python AST nodes into text.'''
+
+    def __init__(self, excluded_keywords, indent='    '):
+        '''Create the instance and store keywords to exclude.
+
+        Args:
+            excluded_keywords (set[tuple[str, str]]):
+                All the keyword and value pairs which will, if found, will not
+                be added to the returned text.
+            indent (str):
+                The text that will be used for indentation.
+
+        '''
+        super(_CommonParameterExcluder, self).__init__(indent)
+        self.excluded_keywords = excluded_keywords
+
+    def _is_allowed(self, node):
+        '''bool: If the given node isn't listed as an excluded keyword.'''
+        return (node.arg, node.value.as_string()) not in self.excluded_keywords
+
+    def _get_args(self, node):
+        '''list[str]: Add newline and extra space to each arg and kwarg.'''
+        args = [arg.accept(self) for arg in node.args]
+
+        keywords = []
+
+        if node.keywords:
+            keywords = [
+                kwarg.accept(self) for kwarg in node.keywords if
+                self._is_allowed(kwarg)]
+
+        args.extend(keywords)
+        return self._format_args(args)
+
+
+class MultiLineParameterExcluder(_CommonParameterExcluder):
+
+    '''A class that can parse Python AST nodes into a multi-line statement.'''
+
+    pass
+
+
+class SingleLineParameterExcluder(_CommonParameterExcluder):
+
+    '''A class that can parse Python AST nodes into a single statement.'''
+
+    def _format_args(self, args):
+        '''str: Return the args as a comma-separate list.'''
+        return ', '.join(args)
@@ -3,44 +3,22 @@
 
 '''A series of helpers that are used to parse Python callable objects.'''
 
-# IMPORT THIRD-PARTY LIBRARIES
+# IMPORT STANDARD LIBRARIES
 import functools
 import re
+import weakref
 
 # IMPORT THIRD-PARTY LIBRARIES
 import astroid
 
 # IMPORT LOCAL LIBRARIES
-from .. import common
-
-
-class CallVisitor(object):
-
-    '''A node vistor that finds all calls for a given node.'''
-
-    def __init__(self):
-        '''Create the instance and make a container for <astroid.Call> nodes.'''
-        super(CallVisitor, self).__init__()
-        self.expressions = []
+from . import blocks
+from . import document as document_
+from . import syntax
 
-    def visit(self, node):
-        '''Visit the given Node's children.
-
-        Args:
-            (<astroid.Node>): The node to visit.
-
-        '''
-        for child in node.get_children():
-            try:
-                child.accept(self)
-            except AttributeError:
-                self.visit(child)
-
-    def visit_call(self, node):
-        '''Add the found <astroid.Call> node to the current instance.'''
-        self.expressions.append(node)
-        self.visit(node)
 
+# Modules from `_parse_context` whose transforms have already been applied
+_TRANSFORMED = weakref.WeakSet()
 
 def get_tolineno(node, lines):
     '''Find the 'tolineno' of an astroid node.
@@ -87,26 +65,79 @@ def get_tolineno(node, lines):
     return -1
 
 
+def _parse_context(document, row):
+    '''Parse the statement on `row` and only the parts of the module that it needs.
+
+    Args:
+        document (`SourceDocument`): The Python code to parse.
+        row (int): The 1-based row of the statement that will be inferred.
+
+    Returns:
+        <astroid.Module>: The parsed module. Its line numbers match `document`.
+
+    '''
+    context = blocks.get_context_lines(document.lines, row)
+
+    # Finding a call only reads syntax so skip astroid's transforms and don't fill its module cache.
+    # The transforms are applied later, if the call's defaults need to be inferred
+    #
+    try:
+        return blocks.parse(astroid.parse_syntax, context, 0, len(context))
+    except astroid.AstroidSyntaxError:
+        # The module may have been split incorrectly. Try again, using the whole module
+        return astroid.parse_syntax(document.text)
+
+
+def _apply_transforms(module):
+    '''Run astroid's transforms and brain plugins on a module from :func:`_parse_context`.
+
+    Finding a call only needs syntax so transforms are skipped while
+    parsing. Inference needs them, though. e.g. To understand a namedtuple
+    or a class which uses six's metaclasses. So they're applied only once a
+    call's defaults are inferred, and only once per module. The module
+    indexes its nodes so the transforms skip the statements that have
+    nothing for them to change.
+
+    Args:
+        module (<astroid.Module>): The module to change, in-place.
+
+    '''
+    if module in _TRANSFORMED:
+        return
+
+    _TRANSFORMED.add(module)
+    astroid.MANAGER.visit_transforms(module)
+
+
+def _get_calls(module):
+    '''Find every call in a module, in the order of its source.
+
+    Args:
+        module (<astroid.Module>): A module from :func:`_parse_context`.
+
+    Returns:
+        iterable[<astroid.Call>]: Outer calls come before the calls in their arguments.
+
+    '''
+    # Modules from `astroid.parse_syntax` index their nodes so this doesn't walk the tree
+    return module.nodes_of_class(astroid.Call)
+
+
 def get_nearest_call(code, row):
     '''Find the node in some code that is closest to the given row.
 
     Args:
-        code (str): The Python code to parse.
+        code (str or `SourceDocument`): The Python code to parse.
         row (int): The 0-based row where the Call objects is expected to be.
 
     Returns:
         <astroid.Call> or NoneType: The found node, if any.
 
     '''
-    node = astroid.parse(code)
-    visitor = CallVisitor()
-    visitor.visit(node)
-
-    lines = code.split('\n')
+    document = document_.get_document(code)
+    get_real_tolineno = functools.partial(get_tolineno, lines=document.lines)
 
-    get_real_tolineno = functools.partial(get_tolineno, lines=lines)
-
-    for node in visitor.expressions:
+    for node in _get_calls(_parse_context(document, row)):
         if isinstance(node, astroid.Call):
             tolineno = get_real_tolineno(node)
             is_row_on_single_line_call = (node.fromlineno == tolineno and row == node.fromlineno)
@@ -116,33 +147,106 @@ def get_nearest_call(code, row):
                 return node
 
 
-def get_parameter_info(script):
-    '''Find the parameter definition for a function call and its default values.
+def configure_cache(size, validation, directory=''):
+    '''Limit the number of modules that astroid keeps in memory.
 
-    Note:
-        This function does NOT give the default value that the user wrote
-        for the function call. It's the default value that was used for the
-        object's definition. To get the actual default value info, use <get_parameter_values>.
+    Args:
+        size (int): The number of modules to keep. 0 means "no limit".
+        validation (str):
+            How to find out if the file of a cached module changed.
+            "mtime", "hash" or "" to never check.
+        directory (str, optional):
+            If given, astroid saves the modules that it builds from files
+            here and loads them in later Vim sessions, instead of parsing
+            them again. Default: "".
+
+    '''
+    astroid.MANAGER.configure_cache(max_entries=size or None, validation=validation or None)
+    astroid.MANAGER.serialization_directory = directory or None
+
+
+def revalidate_cache():
+    '''Check if the files of astroid's cached modules changed, the next time that they're used.'''
+    astroid.MANAGER.revalidate_cache()
+
+
+def get_cache_stats():
+    '''dict[str, dict[str, int]]: How astroid's module and module file caches were used.'''
+    return astroid.MANAGER.cache_stats()
+
+
+def _get_inferred_function(node):
+    '''Find the function definition that an <astroid.Call> would call.
+
+    Classes are resolved to their `__init__` method.
 
     Args:
-        (<jedi.Script>): The script whose row/column is positioned directly
-                         over the call that must be parsed for parameter data.
+        node (<astroid.Call>): The called object to infer.
 
     Returns:
-        dict[str, str]: The keywords and their defined default values.
+        <astroid.FunctionDef> or <astroid.Lambda> or NoneType:
+            The found definition or None, if the callee couldn't be inferred.
 
     '''
     try:
-        signature = script.call_signatures()[0]
-    except IndexError:
-        return dict()
+        values = list(node.func.infer())
+    except astroid.InferenceError:
+        return None
+
+    for value in values:
+        if isinstance(value, astroid.ClassDef):
+            try:
+                value = next(value.igetattr('__init__'))
+            except (astroid.AttributeInferenceError, astroid.InferenceError, StopIteration):
+                continue
+
+        # Methods may be wrapped more than once. e.g. A BoundMethod of an UnboundMethod
+        while isinstance(value, astroid.UnboundMethod):
+            value = value._proxied
+
+        if isinstance(value, (astroid.FunctionDef, astroid.Lambda)):
+            return value
+
+    return None
+
+
+def get_inferred_parameter_info(node):
+    '''Find the default values of a call's parameters, using only astroid.
+
+    This is much faster than :func:`python_function_expander.session.get_parameter_info`
+    because the code was already parsed by astroid. But it only works for
+    callable objects which were written in Python and that astroid can infer.
+
+    Args:
+        node (<astroid.Call>): The callable object to parse.
+
+    Returns:
+        dict[str, str] or NoneType:
+            The keywords and their defined default values or None, if
+            astroid couldn't find the definition of the callable object.
+
+    '''
+    _apply_transforms(node.root())
+    function = _get_inferred_function(node)
+
+    if function is None:
+        return None
+
+    arguments = function.args
+
+    # Objects which were built from compiled code have no reliable arguments
+    if arguments.args is None or not getattr(function.root(), 'pure_python', False):
+        return None
 
     info = dict()
-    for parameter in signature.params:
-        default = common.get_default(parameter.description)
+    positional = arguments.args[len(arguments.args) - len(arguments.defaults):]
+
+    for argument, default in zip(positional, arguments.defaults):
+        info[argument.name] = default.as_string()
 
-        if default:
-            info[str(parameter.name)] = default
+    for argument, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+        if default is not None:
+            info[argument.name] = default.as_string()
 
     return info
 
@@ -153,7 +257,7 @@ def get_parameter_values(node):
     Note:
         This function gives the value that the user wrote for the function call.
         To get the default value for that callable object's definition,
-        use <get_parameter_info>.
+        use <python_function_expander.session.get_parameter_info>.
 
     Args:
         node (<astroid.Call>): The callable object to parse.
@@ -171,37 +275,38 @@ def get_parameter_values(node):
     return items
 
 
-def get_unchanged_keywords(node, script):
+def get_unchanged_keywords(node, parameters):
     '''Check some code and determine which call keywords are set to their defaults.
 
     Args:
         node (<astroid.Call>):
             The callable object to parse.
-        script (<jedi.Script>):
-            The script whose row/column is positioned directly over the call
-            that must be parsed for parameter data.
-
-    Raises:
-        RuntimeError:
-            If astroid and Jedi created different keyword results.
-            This should never happen but, if it did, it'll create many errors
-            so this function bails out early.
+        parameters (dict[str, str]):
+            The keywords and their defined default values. See
+            :func:`get_inferred_parameter_info` and
+            :func:`python_function_expander.session.get_parameter_info`.
 
     Returns:
         list[tuple[str, str]]: The keywords and their defined default values.
 
     '''
-    parameters = get_parameter_info(script)
-    values = get_parameter_values(node)
+    return syntax.get_unchanged_keywords(get_parameter_values(node), parameters)
 
-    if not parameters or not values:
-        return dict()
 
-    unchanged = []
+def get_call_at(code, row, column):
+    '''Find the call which starts at a specific position in some code.
+
+    Args:
+        code (str or `SourceDocument`): The Python code to parse.
+        row (int): The 1-based line where the call starts.
+        column (int): The 0-based byte column where the call starts.
 
-    for keyword, value in values.items():
-        default = parameters[keyword]
-        if default == value:
-            unchanged.append((keyword, value))
+    Returns:
+        <astroid.Call> or NoneType: The found node, if any.
+
+    '''
+    for node in _get_calls(_parse_context(document_.get_document(code), row)):
+        if node.fromlineno == row and node.col_offset == column:
+            return node
 
-    return unchanged
+    return None
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Remove keywords from a call without re-writing the rest of the call.
+
+The visitors in :mod:`python_function_expander.trimmer.excluder` print
+the whole call again, argument by argument. That loses the user's
+formatting and it takes longer the bigger the arguments are.
+
+Instead, this module tokenizes the call, finds where each of its
+arguments starts and ends and deletes only the text of the removed
+keywords and their commas. Everything else is kept exactly as it was written.
+
+This module must never import astroid.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import tokenize
+
+
+class _Argument(object):
+
+    '''The position of one argument of a call.
+
+    Attributes:
+        start (tuple[int, int]):
+            The 0-based line and character column where the argument's first token starts.
+        end (tuple[int, int]):
+            Where the argument's last token ends, not including its comma.
+        keyword (str or NoneType):
+            The argument's keyword, if it's a keyword argument. e.g. "foo" in "foo=bar".
+
+    '''
+
+    def __init__(self, start):
+        '''Start a new argument.
+
+        Args:
+            start (tuple[int, int]): Where the argument's first token starts.
+
+        '''
+        super(_Argument, self).__init__()
+        self.start = start
+        self.end = start
+        self.keyword = None
+        self.tokens = []
+
+
+def _to_character_column(line, column):
+    '''int: Convert a byte column, like the ones that `ast` and astroid use, to a character column.'''
+    if isinstance(line, bytes):
+        return column
+
+    return len(line.encode('utf-8')[:column].decode('utf-8', 'ignore'))
+
+
+def _get_arguments(document, row, column):
+    '''Find the arguments of the first call at or after a position.
+
+    Args:
+        document (`SourceDocument`): The source code which contains the call.
+        row (int): The 0-based line to start searching from.
+        column (int): The 0-based character column to start searching from.
+
+    Returns:
+        tuple[tuple[int, int], tuple[int, int], list[`_Argument`]] or NoneType:
+            The positions of the call's "(" and ")" and every argument
+            in-between. If no complete call could be found, return None.
+
+    '''
+    opening = None
+    depth = 0
+    arguments = []
+    argument = None
+    # The depth of every "lambda" whose ":" hasn't been found yet. Until
+    # then, commas separate the lambda's parameters, not the call's arguments
+    #
+    lambdas = []
+
+    try:
+        for type_, string, start, end in document.iter_tokens(row):
+            if opening is None:
+                if start >= (row, column) and type_ == tokenize.OP and string == '(':
+                    opening = start
+                    depth = 1
+
+                continue
+
+            if type_ in (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT):
+                continue
+
+            if type_ == tokenize.OP and string in '([{':
+                depth += 1
+            elif type_ == tokenize.OP and string in ')]}':
+                depth -= 1
+
+                if not depth:
+                    return (opening, start, arguments)
+
+            if type_ == tokenize.NAME and string == 'lambda':
+                lambdas.append(depth)
+            elif lambdas and lambdas[-1] == depth and type_ == tokenize.OP and string == ':':
+                lambdas.pop()
+
+            if depth == 1 and type_ == tokenize.OP and string == ',' and not (lambdas and lambdas[-1] == 1):
+                argument = None
+
+                continue
+
+            if argument is None:
+                argument = _Argument(start)
+                arguments.append(argument)
+
+            argument.tokens.append((type_, string))
+            argument.end = end
+
+            if len(argument.tokens) == 2 and argument.tokens[0][0] == tokenize.NAME and string == '=':
+                argument.keyword = argument.tokens[0][1]
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        pass
+
+    return None
+
+
+def _is_first(lines, position):
+    '''bool: Check if only whitespace comes before a (0-based line, column) position.'''
+    return not lines[position[0]][:position[1]].strip()
+
+
+def remove_keywords(document, row, column, keywords):
+    '''Delete some keyword arguments from a call, keeping the rest of the code as-is.
+
+    Args:
+        document (`SourceDocument`):
+            The Python code which contains the call.
+        row (int):
+            The 1-based line where the call's callee ends.
+        column (int):
+            The 0-based byte column where the call's callee ends. The first
+            "(" at or after this position must be the call's "(".
+        keywords (set[str]):
+            The keyword arguments to remove.
+
+    Returns:
+        list[str] or NoneType: The changed lines or None, if the call couldn't be read.
+
+    '''
+    lines = document.lines
+    row -= 1
+
+    if row < 0 or row >= len(lines):
+        return None
+
+    found = _get_arguments(document, row, _to_character_column(lines[row], column))
+
+    if found is None:
+        return None
+
+    (opening, closing, arguments) = found
+    kept = [index for index, argument in enumerate(arguments) if argument.keyword not in keywords]
+
+    if not kept:
+        # Every argument was removed. e.g. "foo(\n    bar=8,\n)" becomes "foo()"
+        spans = [((opening[0], opening[1] + 1), closing)]
+    else:
+        spans = []
+
+        # Arguments before the last kept argument are removed along with their comma
+        for index, argument in enumerate(arguments[:kept[-1]]):
+            if index in kept:
+                continue
+
+            start = argument.start
+            end = arguments[index + 1].start
+
+            if _is_first(lines, start) and _is_first(lines, end):
+                # The argument has its own line(s). Remove them, including their indent
+                (start, end) = ((start[0], 0), (end[0], 0))
+
+            spans.append((start, end))
+
+        # Arguments after it are removed along with the comma before them
+        if kept[-1] != len(arguments) - 1:
+            spans.append((arguments[kept[-1]].end, arguments[-1].end))
+
+    # Only the lines of the call are joined and changed. Every other line is re-used as-is
+    first = opening[0]
+    last = closing[0]
+    origin = document.get_offset(first, 0)
+    text = '\n'.join(lines[first:last + 1])
+
+    for start, end in reversed(spans):
+        text = text[:document.get_offset(*start) - origin] + text[document.get_offset(*end) - origin:]
+
+    return lines[:first] + text.split('\n') + lines[last + 1:]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Find calls and their keywords with Python's built-in `ast` module.
+
+Finding the call under the user's cursor and reading its keywords only
+needs the syntax of the code. astroid can do it but it also rebuilds the
+tree into its own nodes and runs its transforms and brain plugins, which
+is much slower than parsing with `ast`.
+
+Since Python 3.8, `ast` nodes know where they end and the source code of
+any node can be read back, exactly as the user wrote it. Older versions of
+Python use :mod:`python_function_expander.trimmer.parser`, instead.
+
+This module must never import astroid.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import ast
+
+# IMPORT LOCAL LIBRARIES
+from . import blocks
+from . import document as document_
+
+
+def is_supported():
+    '''bool: Check if this Python's `ast` module has the end positions that this module needs.'''
+    return hasattr(ast, 'get_source_segment')
+
+
+def _iter_calls(node):
+    '''Find every call in `node`, outer calls first, in the order that they're written.
+
+    Args:
+        node (:class:`ast.AST`): The node to search within.
+
+    Yields:
+        :class:`ast.Call`: Every found call.
+
+    '''
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.Call):
+            yield child
+
+        for call in _iter_calls(child):
+            yield call
+
+
+def get_nearest_call(code, row):
+    '''Find the call in some code that is closest to the given row.
+
+    Args:
+        code (str or `SourceDocument`): The Python code to parse.
+        row (int): The 1-based row where the call is expected to be.
+
+    Returns:
+        :class:`ast.Call` or NoneType: The found call, if any.
+
+    '''
+    lines = document_.get_document(code).lines
+    (start, end) = blocks.get_block(lines, row)
+
+    try:
+        module = blocks.parse(ast.parse, lines, start, end)
+    except (SyntaxError, ValueError):
+        # The statement may have been split incorrectly. Try again, using the whole module
+        try:
+            module = blocks.parse(ast.parse, lines, 0, len(lines))
+        except (SyntaxError, ValueError):
+            return None
+
+    for node in _iter_calls(module):
+        if node.lineno <= row <= node.end_lineno:
+            return node
+
+    return None
+
+
+def _get_source(document, node):
+    '''str: Get the source code of `node`, exactly as it was written.'''
+    return document.get_segment(node.lineno, node.col_offset, node.end_lineno, node.end_col_offset)
+
+
+def get_callee(code, node):
+    '''str: Get the source code of the object that `node` calls. e.g. "os.path.join".'''
+    return _get_source(document_.get_document(code), node.func)
+
+
+def get_parameter_values(code, node):
+    '''Find the keywords of a call and the values that the user wrote for them.
+
+    Args:
+        code (str or `SourceDocument`): The Python code that `node` was parsed from.
+        node (:class:`ast.Call`): The call to check.
+
+    Returns:
+        dict[str, str]: Each keyword and the source code of its value.
+
+    '''
+    document = document_.get_document(code)
+
+    return {
+        keyword.arg: _get_source(document, keyword.value)
+        for keyword in node.keywords
+        if keyword.arg is not None  # Skip "**kwargs"
+    }
+
+
+def _normalize(text):
+    '''Get a form of some source code which doesn't depend on how it was written.
+
+    Defaults can come from jedi's descriptions, astroid's `as_string` or
+    the user's own code so the same value may be written as "x" or 'x',
+    or as 1.0 or 1.
+
+    Args:
+        text (str): A Python expression.
+
+    Returns:
+        str: A dump of the parsed expression or `text`, if it can't be parsed.
+
+    '''
+    try:
+        return ast.dump(ast.parse(text.strip(), mode='eval').body)
+    except (SyntaxError, ValueError):
+        return text
+
+
+def get_unchanged_keywords(values, parameters):
+    '''Find the keywords of a call which were given their default values.
+
+    Args:
+        values (dict[str, str]):
+            The keywords of a call and the values that the user wrote for them.
+        parameters (dict[str, str]):
+            The keywords of the called object's definition and their default values.
+
+    Returns:
+        list[tuple[str, str]]: The keywords and values which match their defaults.
+
+    '''
+    if not parameters or not values:
+        return []
+
+    unchanged = []
+
+    for keyword, value in values.items():
+        default = parameters.get(keyword)
+        if default is not None and (default == value or _normalize(default) == _normalize(value)):
+            unchanged.append((keyword, value))
+
+    return unchanged
@@ -3,66 +3,64 @@
 
 '''The main module that trims arguments out of function calls.'''
 
-# IMPORT THIRD-PARTY LIBRARIES
-import jedi
+# IMPORT STANDARD LIBRARIES
+import os
 
 # IMPORT LOCAL LIBRARIES
-from . import call_visitor
 from .. import config
-from . import parser
+from .. import session
+from . import document as document_
+from . import rewrite
+from . import syntax
 
 
-class _CommonParameterExcluder(call_visitor.MultiLineCallVisitor):
+# The (size, validation, directory) that astroid's module cache was last configured with
+_CACHE_SETTINGS = [None]
 
-    '''A class that can parse Python AST nodes into text.'''
 
-    def __init__(self, excluded_keywords, indent='    '):
-        '''Create the instance and store keywords to exclude.
+def get_disk_cache_directory():
+    '''str: The folder where astroid saves the modules that it builds, if the user enables it.'''
+    root = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
 
-        Args:
-            excluded_keywords (set[tuple[str, str]]):
-                All the keyword and value pairs which will, if found, will not
-                be added to the returned text.
-            indent (str):
-                The text that will be used for indentation.
+    return os.path.join(root, 'vim-python-function-expander', 'astroid')
 
-        '''
-        super(_CommonParameterExcluder, self).__init__(indent)
-        self.excluded_keywords = excluded_keywords
 
-    def _is_allowed(self, node):
-        '''bool: If the given node isn't listed as an excluded keyword.'''
-        return (node.arg, node.value.as_string()) not in self.excluded_keywords
+def is_astroid_used():
+    '''Check if the trimmer uses astroid on this version of Python.
 
-    def _get_args(self, node):
-        '''list[str]: Add newline and extra space to each arg and kwarg.'''
-        args = [arg.accept(self) for arg in node.args]
+    On Python 3.8+, calls are found with `ast` and their defaults come from
+    remembered signatures or jedi. The vendored astroid can't be imported
+    there, since it needs `ast` nodes which Python 3.8 removed.
 
-        keywords = []
-
-        if node.keywords:
-            keywords = [
-                kwarg.accept(self) for kwarg in node.keywords if
-                self._is_allowed(kwarg)]
+    Returns:
+        bool: If astroid is needed.
 
-        args.extend(keywords)
-        return self._format_args(args)
+    '''
+    return not syntax.is_supported()
 
 
-class MultiLineParameterExcluder(_CommonParameterExcluder):
+def get_parser():
+    '''module: Import and return the astroid-based parser.
 
-    '''A class that can parse Python AST nodes into a multi-line statement.'''
+    astroid is slow to import and it isn't needed to find most calls, so
+    it's only imported once it's actually needed. astroid's module cache
+    is set up from the user's settings, if there are any, whenever they change.
 
-    pass
+    '''
+    settings = config.get_settings()
+    cache = None
 
+    if settings:
+        directory = get_disk_cache_directory() if settings.astroid_disk_cache else ''
+        cache = (settings.astroid_cache_size, settings.astroid_cache_validation, directory)
 
-class SingleLineParameterExcluder(_CommonParameterExcluder):
+    from . import parser
 
-    '''A class that can parse Python AST nodes into a single statement.'''
+    if cache is not None and cache != _CACHE_SETTINGS[0]:
+        parser.configure_cache(cache[0], cache[1], directory=cache[2])
+        _CACHE_SETTINGS[0] = cache
 
-    def _format_args(self, args):
-        '''str: Return the args as a comma-separate list.'''
-        return ', '.join(args)
+    return parser
 
 
 def adjust_cursor(code, row, column):
@@ -73,7 +71,7 @@ def adjust_cursor(code, row, column):
     user's script is parsed.
 
     Args:
-        code (str): The code to use as a reference for adjusting the cursor.
+        code (str or `SourceDocument`): The code to use as a reference for adjusting the cursor.
         row (int): A 1-based line number where the cursor sits.
         column (int): A 0-based position on `row` where the cursor sits.
 
@@ -81,7 +79,7 @@ def adjust_cursor(code, row, column):
         tuple[int, int]: The adjusted row and column.
 
     '''
-    lines = code.split('\n')
+    lines = document_.get_document(code).lines
 
     # fromlineo is 1-based so convert it to 0-based by subtracting 1
     row -= 1
@@ -106,7 +104,7 @@ def format_lines(code, node, visited_lines):
     '''Replace code with text that has been run through a visitor.
 
     Args:
-        code (str): The original code to replace.
+        code (str or `SourceDocument`): The original code to replace.
         node (`astroid.Node`): The callable object that will be replaced.
         visited_lines (iter[str]): The lines to replace `code` with.
 
@@ -115,13 +113,13 @@ def format_lines(code, node, visited_lines):
             The code, now with `visited_lines` in-place of the original text.
 
     '''
-    lines = code.split('\n')
+    lines = list(document_.get_document(code).lines)
     indent = get_indent(lines[node.fromlineno - 1])
     output_lines = ['{indent}{text}'.format(indent=indent, text=text)
                     for text in visited_lines]
 
     start = node.fromlineno - 1
-    end = parser.get_tolineno(node, lines)
+    end = get_parser().get_tolineno(node, lines)
     lines[start:end] = output_lines
 
     return lines
@@ -132,41 +130,174 @@ def get_indent(text):
     return text[:len(text) - len(text.lstrip())]
 
 
-def get_trimmed_keywords(code, row, column, adjust=True):
+def _rewrite(code, node, excluded_keywords):
+    '''Re-write a call in some code without some of its keywords.
+
+    Args:
+        code (`SourceDocument`): The Python text which contains `node`.
+        node (<astroid.Call>): The call to re-write.
+        excluded_keywords (list[tuple[str, str]]):
+            The keywords to remove. The values are ignored because they may
+            not have been written by astroid.
+
+    Returns:
+        list[str]: The lines of the re-written code.
+
+    '''
+    from . import excluder
+
+    names = {keyword for keyword, _ in excluded_keywords}
+    excluded_keywords = {
+        (keyword.arg, keyword.value.as_string())
+        for keyword in node.keywords or []
+        if keyword.arg in names
+    }
+    indent = config.get_indent_preference()
+
+    if node.fromlineno != node.tolineno:
+        visitor = excluder.MultiLineParameterExcluder(excluded_keywords, indent=indent)
+    else:
+        visitor = excluder.SingleLineParameterExcluder(excluded_keywords, indent=indent)
+
+    return format_lines(code, node, visitor(node).split('\n'))
+
+
+def _get_arguments_start(node):
+    '''Find where to start looking for the "(" of a call.
+
+    Args:
+        node (`ast.Call` or `astroid.Call`): The call to check.
+
+    Returns:
+        tuple[int, int] or NoneType:
+            The 1-based line and 0-based byte column to start looking from.
+            If the "(" can't be found reliably, return None.
+
+    '''
+    if hasattr(node.func, 'end_col_offset'):
+        return (node.func.end_lineno, node.func.end_col_offset)
+
+    # astroid nodes don't know where they end. But if the callee is just
+    # a name, like "foo" or "foo.bar.fizz", the first "(" must be the call's
+    callee = node.func
+
+    while type(callee).__name__ == 'Attribute':
+        callee = callee.expr
+
+    if type(callee).__name__ != 'Name':
+        return None
+
+    return (node.lineno, node.col_offset)
+
+
+def get_trimmed_keywords(code, row, column, adjust=True, path=None, get_remembered_parameters=None):
     '''Delete the keyword(s) that are set to default value.
 
+    On Python 3.8+, calls are found with Python's `ast` module. Keywords
+    are removed from the call's text directly so the rest of the call keeps
+    its formatting. astroid is never used, there. On older versions of
+    Python, astroid finds the call, infers its defaults and re-writes it,
+    if the call's text can't be read.
+
     Args:
-        code (str): The Python text to trim.
+        code (str or `SourceDocument`):
+            The Python text to trim. If it's a document, the trimmed code is
+            returned as a document, too, so that its lines aren't split again.
         row (int): The 1-based index that represents the user's cursor, horizontally.
         column (int): The 0-based index that represents the user's cursor, vertically.
+        adjust (bool, optional):
+            If True, move the cursor inside of the call's ()s before inferring it.
+            Default is True.
+        path (str, optional):
+            The absolute path to the file that `code` comes from. jedi uses
+            it to find the file's project. Default is None.
+        get_remembered_parameters (callable[int, int, str], optional):
+            A function which takes the 1-based line, 0-based byte column and
+            callee of a call and returns the default values of the call's
+            parameters, if they were remembered when the call was expanded,
+            or None. If it returns None, the call's defaults are inferred.
+            Default is None.
 
     Returns:
-        tuple[str, `astroid.node` or NoneType]: The trimmed code.
+        tuple[str or `SourceDocument`, `ast.Call` or `astroid.Call` or NoneType]:
+            The trimmed code and the call that was trimmed, if any.
 
     '''
-    node = parser.get_nearest_call(code, row)
+    document = document_.get_document(code)
+    astroid_node = None
 
-    if not node:
-        return (code, None)
+    if syntax.is_supported():
+        node = syntax.get_nearest_call(document, row)
+
+        if not node:
+            return (code, None)
+
+        callee = syntax.get_callee(document, node)
+        values = syntax.get_parameter_values(document, node)
+    else:
+        parser = get_parser()
+        # Files may have changed since the last trim. Check each cached module's file, once
+        parser.revalidate_cache()
+        node = astroid_node = parser.get_nearest_call(document, row)
+
+        if not node:
+            return (code, None)
+
+        callee = node.func.as_string()
+        values = parser.get_parameter_values(node)
+
+    if not values:
+        # There's nothing to trim
+        return (code, node)
 
-    if adjust:
-        row, column = adjust_cursor(code, row, column)
+    parameters = None
 
-    script = jedi.Script(code, row, column)
+    if get_remembered_parameters:
+        parameters = get_remembered_parameters(node.lineno, node.col_offset, callee)
 
-    if not script:
+    # If astroid already parsed `code`, ask it first. jedi is only used if astroid can't find the callee
+    if parameters is None and astroid_node is not None:
+        parameters = get_parser().get_inferred_parameter_info(astroid_node)
+
+    if parameters is None:
+        if adjust:
+            row, column = adjust_cursor(document, row, column)
+
+        script = session.get_script(document.text, row, column, path)
+
+        if not script:
+            return (code, None)
+
+        parameters = session.get_parameter_info(script)
+
+    excluded_keywords = syntax.get_unchanged_keywords(values, parameters)
+
+    if not excluded_keywords:
+        return (code, node)
+
+    start = _get_arguments_start(node)
+    lines = None
+
+    if start is not None:
+        names = {keyword for keyword, _ in excluded_keywords}
+        lines = rewrite.remove_keywords(document, start[0], start[1], names)
+
+    if lines is None and not is_astroid_used():
         return (code, None)
 
-    is_multiline = node.fromlineno != node.tolineno
-    excluded_keywords = parser.get_unchanged_keywords(node, script)
+    if lines is None:
+        # The call couldn't be tokenized so re-write the whole call, instead
+        if astroid_node is None:
+            astroid_node = get_parser().get_call_at(document, node.lineno, node.col_offset)
 
-    indent = config.get_indent_preference()
+            if astroid_node is None:
+                return (code, None)
 
-    if is_multiline:
-        visitor = MultiLineParameterExcluder(excluded_keywords, indent=indent)
-    else:
-        visitor = SingleLineParameterExcluder(excluded_keywords, indent=indent)
+        lines = _rewrite(document, astroid_node, excluded_keywords)
+
+    trimmed = document_.SourceDocument.from_lines(lines)
 
-    lines = format_lines(code, node, visitor(node).split('\n'))
+    if isinstance(code, document_.SourceDocument):
+        return (trimmed, node)
 
-    return ('\n'.join(lines), node)
+    return (trimmed.text, node)
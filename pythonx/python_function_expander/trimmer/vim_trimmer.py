@@ -7,6 +7,10 @@
 import vim
 
 # IMPORT LOCAL LIBRARIES
+from .. import common
+from .. import environment
+from .. import signature_marks
+from . import document
 from . import trimmer
 
 
@@ -26,21 +30,89 @@ def _set_cursor(cursor):
     vim.current.window.cursor = _to_vim(cursor)
 
 
+def _get_changed_range(old, new):
+    '''Find the lines which are different between two lists of lines.
+
+    Args:
+        old (list[str]): The original lines.
+        new (list[str]): The changed lines.
+
+    Returns:
+        tuple[int, int, int]:
+            The first changed line and the end of the changed lines in
+            `old` and in `new`. e.g. `old[start:old_end]` should be replaced
+            by `new[start:new_end]`.
+
+    '''
+    start = 0
+    maximum = min(len(old), len(new))
+
+    while start < maximum and old[start] == new[start]:
+        start += 1
+
+    old_end = len(old)
+    new_end = len(new)
+
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    return (start, old_end, new_end)
+
+
+def show_cache_stats():
+    '''Print how many modules and inferences astroid has cached and how often they were re-used.'''
+    # Make sure that the cache's limits come from the user's latest settings
+    environment.get_settings()
+
+    if not trimmer.is_astroid_used():
+        vim.command("echo 'astroid is not used on this version of Python'")
+
+        return
+
+    with common.foreground_inference():
+        stats = trimmer.get_parser().get_cache_stats()
+
+    for name in sorted(stats):
+        values = dict(stats[name])
+        values['max_entries'] = values['max_entries'] or 'unlimited'
+        message = '{name}: {entries}/{max_entries} entries, {hits} hits, {misses} misses, ' \
+                  '{hit_rate:.0%} hit rate, {evictions} evicted, {invalidations} invalidated'.format(
+                      name=name, **values)
+        vim.command("echo '{message}'".format(message=message))
+
+
 def trim_unchanged_arguments_in_buffer():
     '''Remove any unneeded arguments in the function call of the user's cursor.'''
-    code = '\n'.join(vim.current.window.buffer)
+    lines = vim.current.window.buffer[:]
     (row, column) = vim.current.window.cursor
 
-    trimmed_code, call = trimmer.get_trimmed_keywords(code, row, column)
+    path = vim.current.window.buffer.name
+
+    # Make sure that jedi uses the user's latest settings
+    environment.get_settings()
+
+    # A background warm-up may be using jedi or astroid, too
+    with common.foreground_inference():
+        trimmed_code, call = trimmer.get_trimmed_keywords(
+            document.SourceDocument.from_lines(lines),
+            row,
+            column,
+            path=path,
+            get_remembered_parameters=signature_marks.get_remembered_parameters,
+        )
 
     if not call:
         return
 
-    trimmed_lines = trimmed_code.splitlines()
-    vim.current.window.buffer[:] = trimmed_lines
+    trimmed_lines = trimmed_code.lines
+    (start, old_end, new_end) = _get_changed_range(lines, trimmed_lines)
+
+    # Only replace the changed lines so that marks on every other line stay where they are
+    vim.current.window.buffer[start:old_end] = trimmed_lines[start:new_end]
 
     first_non_whitespace_character_column = \
-        len(trimmed_lines[call.fromlineno - 1]) - \
-        len(trimmed_lines[call.fromlineno - 1].lstrip())
+        len(trimmed_lines[call.lineno - 1]) - \
+        len(trimmed_lines[call.lineno - 1].lstrip())
 
-    _set_cursor((call.fromlineno - 1, first_non_whitespace_character_column))
+    _set_cursor((call.lineno - 1, first_non_whitespace_character_column))
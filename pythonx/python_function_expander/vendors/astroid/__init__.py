@@ -42,6 +42,8 @@ _Context = enum.Enum('Context', 'Load Store Del')
 Load = _Context.Load
 Store = _Context.Store
 Del = _Context.Del
+# Pickle finds enum members through their class' name so it must stay importable
+Context = _Context
 del _Context
 
 
@@ -64,7 +66,7 @@ from astroid import raw_building
 from astroid.bases import BaseInstance, Instance, BoundMethod, UnboundMethod
 from astroid.node_classes import are_exclusive, unpack_infer
 from astroid.scoped_nodes import builtin_lookup
-from astroid.builder import parse, extract_node
+from astroid.builder import parse, parse_syntax, extract_node
 from astroid.util import Uninferable, YES
 
 # make a manager instance (borg) accessible from astroid package
@@ -150,7 +152,31 @@ BRAIN_MODULES_DIR = os.path.join(os.path.dirname(__file__), 'brain')
 if BRAIN_MODULES_DIR not in sys.path:
     # add it to the end of the list so user path take precedence
     sys.path.append(BRAIN_MODULES_DIR)
+# brain plugins which only change the modules that they extend, so they are
+# imported once one of those modules is built
+LAZY_BRAIN_MODULES = {
+    'brain_collections': ('collections', ),
+    'brain_curses': ('curses', ),
+    'brain_dateutil': ('dateutil', ),
+    'brain_hashlib': ('hashlib', ),
+    'brain_io': ('_io', 'io'),
+    'brain_mechanize': ('mechanize', ),
+    'brain_multiprocessing': ('multiprocessing', ),
+    'brain_nose': ('nose', ),
+    'brain_numpy': ('numpy', ),
+    'brain_pkg_resources': ('pkg_resources', ),
+    'brain_pytest': ('pytest', 'py'),
+    'brain_qt': ('PyQt4', 'PyQt5'),
+    'brain_re': ('re', ),
+    'brain_ssl': ('ssl', ),
+    'brain_subprocess': ('subprocess', ),
+    'brain_threading': ('threading', ),
+    'brain_uuid': ('uuid', ),
+}
 # load modules in this directory
 for module in os.listdir(BRAIN_MODULES_DIR):
-    if module.endswith('.py'):
+    if module.endswith('.py') and module[:-3] not in LAZY_BRAIN_MODULES:
         __import__(module[:-3])
+for module, modnames in LAZY_BRAIN_MODULES.items():
+    for modname in modnames:
+        MANAGER.register_brain(modname, module)
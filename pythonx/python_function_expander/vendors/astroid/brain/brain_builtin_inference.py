@@ -18,6 +18,7 @@ from astroid.builder import AstroidBuilder
 from astroid import helpers
 from astroid import nodes
 from astroid import objects
+from astroid import raw_building
 from astroid import scoped_nodes
 from astroid import util
 
@@ -80,9 +81,14 @@ def _extend_str(class_node, rvalue):
 
 def extend_builtins(class_transforms):
     from astroid.bases import BUILTINS
-    builtin_ast = MANAGER.astroid_cache[BUILTINS]
-    for class_name, transform in class_transforms.items():
-        transform(builtin_ast[class_name])
+
+    def extend():
+        builtin_ast = MANAGER.astroid_cache[BUILTINS]
+        for class_name, transform in class_transforms.items():
+            transform(builtin_ast[class_name])
+
+    # the builtins module is only built once it's needed
+    raw_building.on_bootstrap(extend)
 
 
 if sys.version_info > (3, 0):
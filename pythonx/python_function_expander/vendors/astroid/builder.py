@@ -24,6 +24,7 @@ from astroid import manager
 from astroid import modutils
 from astroid import raw_building
 from astroid import rebuilder
+from astroid import serialization
 from astroid import nodes
 from astroid import util
 
@@ -95,13 +96,20 @@ class AstroidBuilder(raw_building.InspectBuilder):
     If no manager is given, then the default one will be used. The
     param *apply_transforms* determines if the transforms should be
     applied after the tree was built from source or from a live object,
-    by default being True.
+    by default being True. The param *cache_modules* determines if the
+    built modules are stored in the manager's cache, by default being True.
+    The param *index_nodes* determines if the modules built from source
+    get a :attr:`~astroid.scoped_nodes.Module.node_index`, by default
+    being False.
     """
     # pylint: disable=redefined-outer-name
-    def __init__(self, manager=None, apply_transforms=True):
+    def __init__(self, manager=None, apply_transforms=True, cache_modules=True,
+                 index_nodes=False):
         super(AstroidBuilder, self).__init__()
         self._manager = manager or MANAGER
         self._apply_transforms = apply_transforms
+        self._cache_modules = cache_modules
+        self._index_nodes = index_nodes
 
     def module_build(self, module, modname=None):
         """Build an astroid from a living module instance."""
@@ -115,6 +123,9 @@ class AstroidBuilder(raw_building.InspectBuilder):
             # this is a built-in module
             # get a partial representation by introspection
             node = self.inspect_build(module, modname=modname, path=path)
+            directory = getattr(self._manager, 'serialization_directory', None)
+            if directory:
+                serialization.save_inspected_module(directory, node.name, path, node)
             if self._apply_transforms:
                 # We have to handle transformation by ourselves since the
                 # rebuilder isn't called for builtin nodes
@@ -149,7 +160,7 @@ class AstroidBuilder(raw_building.InspectBuilder):
                 except ImportError:
                     modname = os.path.splitext(os.path.basename(path))[0]
             # build astroid representation
-            module = self._data_build(data, modname, path)
+            module = self._cached_data_build(data, modname, path)
             return self._post_build(module, encoding)
 
     def string_build(self, data, modname='', path=None):
@@ -161,7 +172,8 @@ class AstroidBuilder(raw_building.InspectBuilder):
     def _post_build(self, module, encoding):
         """Handles encoding and delayed nodes after a module has been built"""
         module.file_encoding = encoding
-        self._manager.cache_module(module)
+        if self._cache_modules:
+            self._manager.cache_module(module)
         # post tree building steps after we stored the module in the cache:
         for from_node in module._import_from_nodes:
             if from_node.modname == '__future__':
@@ -177,6 +189,19 @@ class AstroidBuilder(raw_building.InspectBuilder):
             module = self._manager.visit_transforms(module)
         return module
 
+    def _cached_data_build(self, data, modname, path):
+        """Load the tree of a file from the manager's serialization
+        directory, if it was saved there, or build and save it
+        """
+        directory = getattr(self._manager, 'serialization_directory', None)
+        if not directory:
+            return self._data_build(data, modname, path)
+        module = serialization.load_module(directory, modname, path, data)
+        if module is None:
+            module = self._data_build(data, modname, path)
+            serialization.save_module(directory, modname, path, data, module)
+        return module
+
     def _data_build(self, data, modname, path):
         """Build tree node from data and add some informations"""
         try:
@@ -194,7 +219,7 @@ class AstroidBuilder(raw_building.InspectBuilder):
             package = True
         else:
             package = path is not None and os.path.splitext(os.path.basename(path))[0] == '__init__'
-        builder = rebuilder.TreeRebuilder(self._manager)
+        builder = rebuilder.TreeRebuilder(self._manager, index_nodes=self._index_nodes)
         module = builder.visit_module(node, modname, node_file, package)
         module._import_from_nodes = builder._import_from_nodes
         module._delayed_assattr = builder._delayed_assattr
@@ -282,6 +307,24 @@ def parse(code, module_name='', path=None, apply_transforms=True):
     return builder.string_build(code, modname=module_name, path=path)
 
 
+def parse_syntax(code, module_name='', path=None):
+    """Parses a source string, without any of the extra work that inference may need
+
+    No transforms are applied, the module isn't stored in the manager's
+    cache and the code isn't dedented. Use it when only the syntax of the
+    code is needed, e.g. to find the nodes under some line, or when the
+    same code is parsed over and over and each result is thrown away.
+    The module gets a :attr:`~astroid.scoped_nodes.Module.node_index`.
+
+    :param str code: The code for the module.
+    :param str module_name: The name for the module, if any
+    :param str path: The path for the module
+    """
+    builder = AstroidBuilder(manager=MANAGER, apply_transforms=False,
+                             cache_modules=False, index_nodes=True)
+    return builder.string_build(code, modname=module_name, path=path)
+
+
 def _extract_expressions(node):
     """Find expressions in a call to _TRANSIENT_FUNCTION and extract them.
 
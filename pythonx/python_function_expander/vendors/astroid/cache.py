@@ -0,0 +1,235 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/COPYING.LESSER
+
+"""Bounded caches for the astroid manager.
+
+The manager keeps every module that it ever built. In a long running
+process, like an editor, that cache only grows and a module whose file
+was edited is never built again. :class:`ModuleCache` is a mapping which
+forgets the least recently used entries once it holds more than
+*max_entries* of them and which forgets a module when its file changes.
+"""
+
+import collections
+import hashlib
+import os
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+
+MTIME = 'mtime'
+HASH = 'hash'
+
+
+def _get_stamp(path, validation, previous=None):
+    """Get what identifies the current content of *path*
+
+    A stamp is the file's modification time and size and, with ``'hash'``
+    validation, a digest of its content. The file is only read again if its
+    modification time or size differ from the *previous* stamp.
+    Return None if *path* isn't a file or if *validation* is disabled.
+    """
+    if not validation or not path:
+        return None
+    try:
+        status = os.stat(path)
+        stamp = (status.st_mtime, status.st_size)
+        if validation != HASH:
+            return stamp
+        if previous is not None and previous[:2] == stamp:
+            return previous
+        with open(path, 'rb') as stream:
+            return stamp + (hashlib.md5(stream.read()).hexdigest(), )
+    except (IOError, OSError):
+        return None
+
+
+class ModuleCache(MutableMapping):
+    """A least recently used cache of modules, or of anything else
+
+    :param max_entries:
+        The number of entries to keep. If None, the cache is never trimmed.
+    :param protected:
+        Keys which are never evicted, like the builtins module.
+    :param validation:
+        How to find out if the file of a cached module changed. Either
+        ``'mtime'``, ``'hash'`` or None to never check. Only values that
+        have a *file* attribute that points to a file are checked.
+    :param on_remove:
+        A function which is called, without arguments, whenever entries
+        are removed or replaced by a different value.
+    :param on_missing:
+        A function which is called with a key that isn't cached, before it
+        is looked up, so that it can add the key.
+
+    Each entry's file is checked at most once until :meth:`revalidate` is
+    called, so looking up the same module over and over stays cheap.
+    """
+
+    def __init__(self, max_entries=None, protected=(), validation=MTIME,
+                 on_remove=None, on_missing=None):
+        self._entries = collections.OrderedDict()
+        self._stamps = {}
+        # the keys whose files were checked since the last revalidate()
+        self._checked = set()
+        self.max_entries = max_entries
+        self.protected = set(protected)
+        self._validation = validation
+        self._on_remove = on_remove
+        self._on_missing = on_missing
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __getitem__(self, key):
+        if key not in self._entries:
+            self._missing(key)
+        try:
+            value = self._entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self._entries[key] = value
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        previous = self._entries.pop(key, None)
+        self._entries[key] = value
+        self._stamp(key)
+        self._checked.add(key)
+        if previous is not None and previous is not value:
+            self._removed()
+        self.evict()
+
+    def __delitem__(self, key):
+        del self._entries[key]
+        self._stamps.pop(key, None)
+        self._checked.discard(key)
+        self._removed()
+
+    def __contains__(self, key):
+        return self._is_valid(key)
+
+    def get(self, key, default=None):
+        """Get the value of *key*, unless its file changed, counting one hit or miss"""
+        if not self._is_valid(key):
+            self.misses += 1
+            return default
+        return self[key]
+
+    def setdefault(self, key, default=None):
+        if key in self._entries:
+            return self._entries[key]
+        self[key] = default
+        return default
+
+    def _is_valid(self, key):
+        if key not in self._entries:
+            self._missing(key)
+            if key not in self._entries:
+                return False
+        if key in self._checked:
+            return True
+        self._checked.add(key)
+        if self.is_stale(key):
+            del self[key]
+            self.invalidations += 1
+            return False
+        return True
+
+    def revalidate(self):
+        """Check the file of each entry again, the next time it is looked up"""
+        self._checked.clear()
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self._stamps.clear()
+        self._checked.clear()
+        self._removed()
+
+    def _missing(self, key):
+        if self._on_missing is not None:
+            self._on_missing(key)
+
+    def _removed(self):
+        if self._on_remove is not None:
+            self._on_remove()
+
+    @property
+    def validation(self):
+        """How changed files are found. ``'mtime'``, ``'hash'`` or None"""
+        return self._validation
+
+    @validation.setter
+    def validation(self, validation):
+        if validation == self._validation:
+            return
+        self._validation = validation
+        self._checked.clear()
+        for key in self._entries:
+            self._stamp(key)
+
+    def _stamp(self, key):
+        stamp = _get_stamp(getattr(self._entries[key], 'file', None), self._validation)
+        if stamp is None:
+            self._stamps.pop(key, None)
+        else:
+            self._stamps[key] = stamp
+
+    def is_stale(self, key):
+        """Check if the file of the value of *key* changed since it was cached"""
+        try:
+            stamp = self._stamps[key]
+        except KeyError:
+            return False
+        path = getattr(self._entries[key], 'file', None)
+        current = _get_stamp(path, self._validation, previous=stamp)
+        if current is None:
+            return True
+        if self._validation == HASH:
+            if current[2:] != stamp[2:]:
+                return True
+            # the content is the same, so don't read it again until it's touched
+            self._stamps[key] = current
+            return False
+        return current != stamp
+
+    def evict(self):
+        """Forget the least recently used entries until the cache is small enough"""
+        if self.max_entries is None:
+            return
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+        keys = []
+        for key in self._entries:
+            if key not in self.protected:
+                keys.append(key)
+                if len(keys) == excess:
+                    break
+        for key in keys:
+            del self[key]
+            self.evictions += 1
+
+    def stats(self):
+        """Get how the cache was used, as a dict"""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / float(self.hits + self.misses or 1),
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
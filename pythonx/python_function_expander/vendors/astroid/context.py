@@ -6,11 +6,173 @@
 
 """Various context related utilities, including inference and call contexts."""
 
+import collections
 import contextlib
-import copy
 import pprint
 
 
+CACHE_STATISTICS = collections.Counter()
+"""How many inferences were served from a context's cache, as 'hits',
+and how many started a new one, as 'misses', across every context
+
+:type: collections.Counter
+"""
+
+
+class InferencePath(object):
+    """The nodes visited by an inference, shared between cloned contexts
+
+    Small paths are copied when they are forked. Larger ones become a chain
+    of sets which are not changed anymore, each linked to its parent, with
+    a mutable set on top, so that forking them does not copy the entries
+    already visited.
+    """
+
+    __slots__ = ('_entries', '_parent', '_depth')
+
+    # the number of entries a path can have and still be copied on a fork
+    max_copied = 32
+    # the number of links a chain can have before it is flattened, so
+    # that looking up an entry stays cheap
+    max_depth = 16
+    # how many times an entry was pushed while already in its path, which
+    # is when an inference loop is cut short, across every path
+    cuts = 0
+
+    def __init__(self, entries=None, parent=None):
+        self._entries = set() if entries is None else entries
+        self._parent = parent
+        self._depth = 0 if parent is None else parent._depth + 1
+
+    def __contains__(self, entry):
+        path = self
+        while path is not None:
+            if entry in path._entries:
+                return True
+            path = path._parent
+        return False
+
+    def __iter__(self):
+        if self._parent is None:
+            return iter(self._entries)
+        return iter(self._flatten())
+
+    def __len__(self):
+        if self._parent is None:
+            return len(self._entries)
+        return len(self._flatten())
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, set(self))
+
+    def _flatten(self):
+        entries = set()
+        path = self
+        while path is not None:
+            entries.update(path._entries)
+            path = path._parent
+        return entries
+
+    def add(self, entry):
+        self._entries.add(entry)
+
+    def push(self, entry):
+        """Add the entry to the path
+
+        :return: True if the entry was already in the path else False
+        :rtype: bool
+        """
+        if self._parent is None:
+            found = entry in self._entries
+        else:
+            found = entry in self
+        if found:
+            InferencePath.cuts += 1
+            return True
+        self._entries.add(entry)
+        return False
+
+    def fork(self):
+        """Get a new path which starts with the same entries as this one
+
+        Entries added to either path afterwards are not seen by the other.
+        """
+        entries = self._entries
+        if self._parent is None and len(entries) <= self.max_copied:
+            return InferencePath(set(entries))
+        if entries:
+            # the entries are moved to a parent which nothing adds to anymore
+            if self._depth >= self.max_depth:
+                parent = InferencePath(self._flatten())
+            else:
+                parent = InferencePath(entries, self._parent)
+            self._entries = set()
+            self._parent = parent
+            self._depth = parent._depth + 1
+        return InferencePath(parent=self._parent)
+
+
+class CachedGenerator(object):
+    """Record the values of a generator as they are produced
+
+    Each iteration yields the values recorded so far and then resumes the
+    generator where the last consumer left it, so that a consumer which
+    only takes the first value does not make the next one start over.
+    """
+
+    __slots__ = ('_generator', '_results', '_error', 'running')
+
+    def __init__(self, generator):
+        self._generator = generator
+        self._results = []
+        self._error = None
+        self.running = False
+        """Whether the generator is producing a value
+
+        :type: bool
+        """
+
+    @property
+    def usable(self):
+        """Whether the values can be iterated over, outside of the generator
+
+        :type: bool
+        """
+        return not self.running and self._error is None
+
+    def __iter__(self):
+        results = self._results
+        index = 0
+        while True:
+            if index < len(results):
+                yield results[index]
+                index += 1
+                continue
+            if self._generator is None:
+                if self._error is not None:
+                    raise self._error
+                return
+            if self.running:
+                # the generator is inferring itself
+                return
+            self.running = True
+            try:
+                result = next(self._generator)
+            except StopIteration:
+                self._generator = None
+                return
+            except Exception as error:
+                self._generator = None
+                self._error = error
+                raise
+            finally:
+                self.running = False
+            results.append(result)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self._results)
+
+
 class InferenceContext(object):
     """Provide context for inference
 
@@ -21,19 +183,21 @@ class InferenceContext(object):
     __slots__ = ('path', 'lookupname', 'callcontext', 'boundnode', 'inferred')
 
     def __init__(self, path=None, inferred=None):
-        self.path = path or set()
+        if not isinstance(path, InferencePath):
+            path = InferencePath(path)
+        self.path = path
         """Path of visited nodes and their lookupname
-        :type: set(tuple(NodeNG, optional(str)))"""
+        :type: InferencePath(tuple(NodeNG, optional(str)))"""
         self.lookupname = None
         self.callcontext = None
         self.boundnode = None
-        self.inferred = inferred or {}
+        self.inferred = {} if inferred is None else inferred
         """
-        :type: dict(seq, seq)
+        :type: dict(seq, CachedGenerator)
 
         Inferred node contexts to their mapped results
         Currently the key is (node, lookupname, callcontext, boundnode)
-        and the value is tuple of the inferred results
+        and the value records the inferred results
         """
 
     def push(self, node):
@@ -44,12 +208,7 @@ class InferenceContext(object):
 
         Allows one to see if the given node has already
         been looked at for this inference context"""
-        name = self.lookupname
-        if (node, name) in self.path:
-            return True
-
-        self.path.add((node, name))
-        return False
+        return self.path.push((node, self.lookupname))
 
     def clone(self):
         """Clone inference path
@@ -58,25 +217,38 @@ class InferenceContext(object):
         starts with the same context but diverge as each side is inferred
         so the InferenceContext will need be cloned"""
         # XXX copy lookupname/callcontext ?
-        clone = InferenceContext(copy.copy(self.path), inferred=self.inferred)
+        clone = InferenceContext(self.path.fork(), inferred=self.inferred)
         clone.callcontext = self.callcontext
         clone.boundnode = self.boundnode
         return clone
 
+    def get_cached(self, key):
+        """Get the cached results of an inference
+
+        :returns: An iterator of the results, which resumes the inference
+            if it was not finished, or None if nothing usable is cached.
+        :rtype: iterable or None
+        """
+        cached = self.inferred.get(key)
+        if cached is None or not cached.usable:
+            return None
+        CACHE_STATISTICS['hits'] += 1
+        return iter(cached)
+
     def cache_generator(self, key, generator):
         """Cache result of generator into dictionary
 
-        Used to cache inference results"""
-        results = []
-        for result in generator:
-            results.append(result)
-            yield result
-
-        self.inferred[key] = tuple(results)
+        Used to cache inference results. The results are recorded as
+        they are produced, so they are cached even if the returned
+        iterator is not exhausted."""
+        CACHE_STATISTICS['misses'] += 1
+        cached = self.inferred[key] = CachedGenerator(generator)
+        return iter(cached)
 
     @contextlib.contextmanager
     def restore_path(self):
-        path = set(self.path)
+        path = self.path
+        self.path = path.fork()
         yield
         self.path = path
 
@@ -155,6 +155,38 @@ nodes.Name._infer = decorators.path_wrapper(infer_name)
 nodes.AssignName.infer_lhs = infer_name # won't work with a path wrapper
 
 
+def _memoize(infer):
+    """Remember what *infer* inferred for a node in the manager, so that
+    later inferences of the node, from any context, don't start over
+
+    Only inferences without a call context or a bound node are remembered,
+    once they are exhausted and if no inference loop was cut while they ran.
+    """
+    @functools.wraps(infer)
+    def wrapped(self, context=None, **kwargs):
+        if kwargs or (context is not None and (
+                context.callcontext is not None
+                or context.boundnode is not None)):
+            return infer(self, context, **kwargs)
+        key = (self, context.lookupname if context is not None else None)
+        results = MANAGER.get_inference(key)
+        if results is not None:
+            return iter(results)
+        return _infer_and_remember(infer, self, context, key)
+    return wrapped
+
+
+def _infer_and_remember(infer, node, context, key):
+    generation = MANAGER.generation
+    cuts = contextmod.InferencePath.cuts
+    results = []
+    for result in infer(node, context):
+        results.append(result)
+        yield result
+    if cuts == contextmod.InferencePath.cuts:
+        MANAGER.cache_inference(key, tuple(results), generation)
+
+
 @decorators.raise_if_nothing_inferred
 @decorators.path_wrapper
 def infer_call(self, context=None):
@@ -177,7 +209,7 @@ def infer_call(self, context=None):
     # Explicit StopIteration to return error information, see comment
     # in raise_if_nothing_inferred.
     raise StopIteration(dict(node=self, context=context))
-nodes.Call._infer = infer_call
+nodes.Call._infer = _memoize(infer_call)
 
 
 @decorators.path_wrapper
@@ -267,7 +299,7 @@ def infer_attribute(self, context=None):
     # Explicit StopIteration to return error information, see comment
     # in raise_if_nothing_inferred.
     raise StopIteration(dict(node=self, context=context))
-nodes.Attribute._infer = decorators.path_wrapper(infer_attribute)
+nodes.Attribute._infer = _memoize(decorators.path_wrapper(infer_attribute))
 nodes.AssignAttr.infer_lhs = infer_attribute # # won't work with a path wrapper
 
 
@@ -17,6 +17,7 @@ import zipimport
 
 import six
 
+from astroid import cache
 from astroid import exceptions
 from astroid.interpreter._import import spec
 from astroid import modutils
@@ -40,18 +41,33 @@ class AstroidManager(object):
 
     name = 'astroid loader'
     brain = {}
+    max_inferences = 4096
 
     def __init__(self):
         self.__dict__ = AstroidManager.brain
         if not self.__dict__:
             # NOTE: cache entries are added by the [re]builder
-            self.astroid_cache = {}
-            self._mod_file_cache = {}
+            self.astroid_cache = cache.ModuleCache(
+                protected=(six.moves.builtins.__name__,),
+                on_remove=self._forget_inferences,
+                on_missing=self._build_missing_builtins)
+            # what calls and attributes were inferred to, until a cached
+            # module is removed or replaced, which starts a new generation
+            self._inference_cache = cache.ModuleCache(
+                max_entries=self.max_inferences, validation=None)
+            self.generation = 0
+            self._mod_file_cache = cache.ModuleCache(validation=None)
             self._failed_import_hooks = []
             self.always_load_extensions = False
             self.optimize_ast = False
             self.extension_package_whitelist = set()
+            # If set, built files are saved here and loaded in later sessions.
+            # The builtins module is only built once it's needed, so setting
+            # this right after astroid is imported is enough to load it from here
+            self.serialization_directory = None
             self._transform = transforms.TransformVisitor()
+            # brain plugins which are imported once a module they extend is built
+            self._brains = {}
 
             # Export these APIs for convenience
             self.register_transform = self._transform.register_transform
@@ -59,8 +75,25 @@ class AstroidManager(object):
 
     def visit_transforms(self, node):
         """Visit the transforms and apply them to the given *node*."""
+        if getattr(self, '_brains', None):
+            from astroid.scoped_nodes import Module
+            if isinstance(node, Module):
+                self.load_brains(node.name)
         return self._transform.visit(node)
 
+    def register_brain(self, modname, brain):
+        """Import the brain plugin module *brain* only once the module
+        *modname*, or one of its submodules, is built
+        """
+        self._brains.setdefault(modname, []).append(brain)
+
+    def load_brains(self, modname):
+        """Import the brain plugins registered for *modname* or its packages"""
+        parts = modname.split('.')
+        for index in range(1, len(parts) + 1):
+            for brain in self._brains.pop('.'.join(parts[:index]), ()):
+                __import__(brain)
+
     def ast_from_file(self, filepath, modname=None, fallback=True, source=False):
         """given a module name, return the astroid object"""
         try:
@@ -73,8 +106,9 @@ class AstroidManager(object):
                 modname = '.'.join(modutils.modpath_from_file(filepath))
             except ImportError:
                 modname = filepath
-        if modname in self.astroid_cache and self.astroid_cache[modname].file == filepath:
-            return self.astroid_cache[modname]
+        module = self.astroid_cache.get(modname)
+        if module is not None and module.file == filepath:
+            return module
         if source:
             from astroid.builder import AstroidBuilder
             return AstroidBuilder(self).file_build(filepath, modname)
@@ -91,6 +125,20 @@ class AstroidManager(object):
         from astroid.builder import build_namespace_package_module
         return build_namespace_package_module(modname, path)
 
+    def _load_inspected_module(self, modname, path):
+        """Load the tree of a compiled module that an earlier session
+        introspected, without importing the module
+        """
+        directory = getattr(self, 'serialization_directory', None)
+        if not directory:
+            return None
+        from astroid import serialization
+        module = serialization.load_inspected_module(directory, modname, path)
+        if module is None:
+            return None
+        self.cache_module(module)
+        return self.visit_transforms(module)
+
     def _can_load_extension(self, modname):
         if self.always_load_extensions:
             return True
@@ -103,8 +151,9 @@ class AstroidManager(object):
 
     def ast_from_module_name(self, modname, context_file=None):
         """given a module name, return the astroid object"""
-        if modname in self.astroid_cache:
-            return self.astroid_cache[modname]
+        module = self.astroid_cache.get(modname)
+        if module is not None:
+            return module
         if modname == '__main__':
             return self._build_stub_module(modname)
         old_cwd = os.getcwd()
@@ -125,6 +174,10 @@ class AstroidManager(object):
                 if (found_spec.type == spec.ModuleType.C_EXTENSION
                         and not self._can_load_extension(modname)):
                     return self._build_stub_module(modname)
+                # pylint: disable=no-member
+                module = self._load_inspected_module(modname, found_spec.location)
+                if module is not None:
+                    return module
                 try:
                     module = modutils.load_module_from_name(modname)
                 except Exception as ex: # pylint: disable=broad-except
@@ -207,8 +260,9 @@ class AstroidManager(object):
     def ast_from_module(self, module, modname=None):
         """given an imported module, return the astroid object"""
         modname = modname or module.__name__
-        if modname in self.astroid_cache:
-            return self.astroid_cache[modname]
+        cached = self.astroid_cache.get(modname)
+        if cached is not None:
+            return cached
         try:
             # some builtin modules don't have __file__ attribute
             filepath = module.__file__
@@ -280,6 +334,66 @@ class AstroidManager(object):
         """Cache a module if no module with the same name is known yet."""
         self.astroid_cache.setdefault(module.name, module)
 
+    def configure_cache(self, max_entries=None, validation=cache.MTIME):
+        """Limit how many modules are cached and how changed files are found
+
+        :param max_entries:
+            The number of modules to keep. The least recently used modules
+            are forgotten first, except for builtins. If None, every module
+            is kept.
+        :param validation:
+            ``'mtime'`` to build a module again if its file's modification
+            time changed, ``'hash'`` if its content changed or None to never
+            check.
+        """
+        self.astroid_cache.validation = validation
+        for cache_ in (self.astroid_cache, self._mod_file_cache):
+            cache_.max_entries = max_entries
+            cache_.evict()
+
+    def revalidate_cache(self):
+        """Check the files of cached modules again, the next time that
+        they are looked up. Until then, each module's file is only checked
+        once, however often the module is looked up.
+
+        What was inferred is forgotten too, because an inference which is
+        remembered doesn't look up the modules it depends on again.
+        """
+        self.astroid_cache.revalidate()
+        self._forget_inferences()
+
+    def cache_stats(self):
+        """Get how the module, module file and inference caches were used, as dicts"""
+        return {
+            'modules': self.astroid_cache.stats(),
+            'files': self._mod_file_cache.stats(),
+            'inferences': self._inference_cache.stats(),
+        }
+
+    def get_inference(self, key):
+        """Get what was inferred for *key*, or None if it's not known"""
+        try:
+            return self._inference_cache[key]
+        except KeyError:
+            return None
+
+    def cache_inference(self, key, results, generation):
+        """Remember the inferred *results* of *key*, unless a cached module
+        was removed or replaced since *generation*, when they were inferred
+        """
+        if generation == self.generation:
+            self._inference_cache[key] = results
+
+    @staticmethod
+    def _build_missing_builtins(modname):
+        if modname == six.moves.builtins.__name__:
+            import astroid.raw_building
+            astroid.raw_building.bootstrap()
+
+    def _forget_inferences(self):
+        self.generation += 1
+        self._inference_cache.clear()
+
     def clear_cache(self, astroid_builtin=None):
         # XXX clear transforms
         self.astroid_cache.clear()
@@ -288,5 +402,4 @@ class AstroidManager(object):
         # unittest_lookup.LookupTC.test_builtin_lookup fail depending on the
         # test order
         import astroid.raw_building
-        astroid.raw_building._astroid_bootstrapping(
-            astroid_builtin=astroid_builtin)
+        astroid.raw_building.bootstrap(astroid_builtin=astroid_builtin)
@@ -223,22 +223,6 @@ class NodeNG(object):
 
     :type: bool
     """
-    # Attributes below are set by the builder module or by raw factories
-    lineno = None
-    """The line that this node appears on in the source code.
-
-    :type: int or None
-    """
-    col_offset = None
-    """The column that this node appears on in the source code.
-
-    :type: int or None
-    """
-    parent = None
-    """The parent node in the syntax tree.
-
-    :type: NodeNG or None
-    """
     _astroid_fields = ()
     """Node attributes that contain child nodes.
 
@@ -258,6 +242,10 @@ class NodeNG(object):
     """
     # instance specific inference function infer(node, context)
     _explicit_inference = None
+    # Nodes are the bulk of a built module so their most used attributes are
+    # slots. Anything else, like cached values, is kept in a __dict__ which
+    # is only created once it's needed.
+    __slots__ = ('lineno', 'col_offset', 'parent', '__dict__', '__weakref__')
 
     def __init__(self, lineno=None, col_offset=None, parent=None):
         """
@@ -272,8 +260,22 @@ class NodeNG(object):
         :type parent: NodeNG or None
         """
         self.lineno = lineno
+        """The line that this node appears on in the source code.
+
+        :type: int or None
+        """
+
         self.col_offset = col_offset
+        """The column that this node appears on in the source code.
+
+        :type: int or None
+        """
+
         self.parent = parent
+        """The parent node in the syntax tree.
+
+        :type: NodeNG or None
+        """
 
     def infer(self, context=None, **kwargs):
         """Get a generator of the inferred values.
@@ -301,8 +303,9 @@ class NodeNG(object):
 
         key = (self, context.lookupname,
                context.callcontext, context.boundnode)
-        if key in context.inferred:
-            return iter(context.inferred[key])
+        cached = context.get_cached(key)
+        if cached is not None:
+            return cached
 
         return context.cache_generator(key, self._infer(context, **kwargs))
 
@@ -897,6 +900,7 @@ class _BaseContainer(mixins.ParentAssignTypeMixin,
     """Base class for Set, FrozenSet, Tuple and List."""
 
     _astroid_fields = ('elts',)
+    __slots__ = ('elts',)
 
     def __init__(self, lineno=None, col_offset=None, parent=None):
         """
@@ -1148,6 +1152,7 @@ class AssignName(LookupMixIn, mixins.ParentAssignTypeMixin, NodeNG):
     'variable'
     """
     _other_fields = ('name',)
+    __slots__ = ('name',)
 
     def __init__(self, name=None, lineno=None, col_offset=None, parent=None):
         """
@@ -1185,6 +1190,7 @@ class DelName(LookupMixIn, mixins.ParentAssignTypeMixin, NodeNG):
     'variable'
     """
     _other_fields = ('name',)
+    __slots__ = ('name',)
 
     def __init__(self, name=None, lineno=None, col_offset=None, parent=None):
         """
@@ -1225,6 +1231,7 @@ class Name(LookupMixIn, NodeNG):
     'range'
     """
     _other_fields = ('name',)
+    __slots__ = ('name',)
 
     def __init__(self, name=None, lineno=None, col_offset=None, parent=None):
         """
@@ -1554,11 +1561,7 @@ class AssignAttr(mixins.ParentAssignTypeMixin, NodeNG):
     """
     _astroid_fields = ('expr',)
     _other_fields = ('attrname',)
-    expr = None
-    """What has the attribute that is being assigned to.
-
-    :type: NodeNG or None
-    """
+    __slots__ = ('expr', 'attrname')
 
     def __init__(self, attrname=None, lineno=None, col_offset=None, parent=None):
         """
@@ -1581,6 +1584,12 @@ class AssignAttr(mixins.ParentAssignTypeMixin, NodeNG):
         :type: str or None
         """
 
+        self.expr = None
+        """What has the attribute that is being assigned to.
+
+        :type: NodeNG or None
+        """
+
         super(AssignAttr, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, expr=None):
@@ -1637,16 +1646,33 @@ class Assign(mixins.AssignTypeMixin, Statement):
     <Assign l.1 at 0x7effe1db8550>
     """
     _astroid_fields = ('targets', 'value',)
-    targets = None
-    """What is being assigned to.
+    __slots__ = ('targets', 'value')
 
-    :type: list(NodeNG) or None
-    """
-    value = None
-    """The value being assigned to the variables.
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
 
-    :type: NodeNG or None
-    """
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
+
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.targets = None
+        """What is being assigned to.
+
+        :type: list(NodeNG) or None
+        """
+
+        self.value = None
+        """The value being assigned to the variables.
+
+        :type: NodeNG or None
+        """
+
+        super(Assign, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, targets=None, value=None):
         """Do some setup after initialisation.
@@ -1727,16 +1753,7 @@ class AugAssign(mixins.AssignTypeMixin, Statement):
     """
     _astroid_fields = ('target', 'value')
     _other_fields = ('op',)
-    target = None
-    """What is being assigned to.
-
-    :type: NodeNG or None
-    """
-    value = None
-    """The value being assigned to the variable.
-
-    :type: NodeNG or None
-    """
+    __slots__ = ('target', 'value', 'op')
 
     def __init__(self, op=None, lineno=None, col_offset=None, parent=None):
         """
@@ -1762,6 +1779,18 @@ class AugAssign(mixins.AssignTypeMixin, Statement):
         :type: str or None
         """
 
+        self.target = None
+        """What is being assigned to.
+
+        :type: NodeNG or None
+        """
+
+        self.value = None
+        """The value being assigned to the variable.
+
+        :type: NodeNG or None
+        """
+
         super(AugAssign, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, target=None, value=None):
@@ -1834,16 +1863,7 @@ class BinOp(NodeNG):
     """
     _astroid_fields = ('left', 'right')
     _other_fields = ('op',)
-    left = None
-    """What is being applied to the operator on the left side.
-
-    :type: NodeNG or None
-    """
-    right = None
-    """What is being applied to the operator on the right side.
-
-    :type: NodeNG or None
-    """
+    __slots__ = ('left', 'right', 'op')
 
     def __init__(self, op=None, lineno=None, col_offset=None, parent=None):
         """
@@ -1866,6 +1886,18 @@ class BinOp(NodeNG):
         :type: str or None
         """
 
+        self.left = None
+        """What is being applied to the operator on the left side.
+
+        :type: NodeNG or None
+        """
+
+        self.right = None
+        """What is being applied to the operator on the right side.
+
+        :type: NodeNG or None
+        """
+
         super(BinOp, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, left=None, right=None):
@@ -1912,11 +1944,7 @@ class BoolOp(NodeNG):
     """
     _astroid_fields = ('values',)
     _other_fields = ('op',)
-    values = None
-    """The values being applied to the operator.
-
-    :type: list(NodeNG) or None
-    """
+    __slots__ = ('values', 'op')
 
     def __init__(self, op=None, lineno=None, col_offset=None, parent=None):
         """
@@ -1939,6 +1967,12 @@ class BoolOp(NodeNG):
         :type: str or None
         """
 
+        self.values = None
+        """The values being applied to the operator.
+
+        :type: list(NodeNG) or None
+        """
+
         super(BoolOp, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, values=None):
@@ -1969,21 +2003,39 @@ class Call(NodeNG):
     <Call l.1 at 0x7f23b2e71eb8>
     """
     _astroid_fields = ('func', 'args', 'keywords')
-    func = None
-    """What is being called.
+    __slots__ = ('func', 'args', 'keywords')
 
-    :type: NodeNG or None
-    """
-    args = None
-    """The positional arguments being given to the call.
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
 
-    :type: list(NodeNG) or None
-    """
-    keywords = None
-    """The keyword arguments being given to the call.
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
 
-    :type: list(NodeNG) or None
-    """
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.func = None
+        """What is being called.
+
+        :type: NodeNG or None
+        """
+
+        self.args = None
+        """The positional arguments being given to the call.
+
+        :type: list(NodeNG) or None
+        """
+
+        self.keywords = None
+        """The keyword arguments being given to the call.
+
+        :type: list(NodeNG) or None
+        """
+
+        super(Call, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, func=None, args=None, keywords=None):
         """Do some setup after initialisation.
@@ -2032,16 +2084,33 @@ class Compare(NodeNG):
     [('<=', <Name.b l.1 at 0x7f23b2e9e2b0>), ('<=', <Name.c l.1 at 0x7f23b2e9e390>)]
     """
     _astroid_fields = ('left', 'ops',)
-    left = None
-    """The value at the left being applied to a comparison operator.
+    __slots__ = ('left', 'ops')
 
-    :type: NodeNG or None
-    """
-    ops = None
-    """The remainder of the operators and their relevant right hand value.
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
 
-    :type: list(tuple(str, NodeNG)) or None
-    """
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
+
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.left = None
+        """The value at the left being applied to a comparison operator.
+
+        :type: NodeNG or None
+        """
+
+        self.ops = None
+        """The remainder of the operators and their relevant right hand value.
+
+        :type: list(tuple(str, NodeNG)) or None
+        """
+
+        super(Compare, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, left=None, ops=None):
         """Do some setup after initialisation.
@@ -2202,6 +2271,7 @@ class Const(NodeNG, bases.Instance):
     <Const.bytes l.1 at 0x7f23b2e35a20>]
     """
     _other_fields = ('value',)
+    __slots__ = ('value',)
 
     def __init__(self, value, lineno=None, col_offset=None, parent=None):
         """
@@ -2366,11 +2436,7 @@ class DelAttr(mixins.ParentAssignTypeMixin, NodeNG):
     """
     _astroid_fields = ('expr',)
     _other_fields = ('attrname',)
-    expr = None
-    """The name that this node represents.
-
-    :type: Name or None
-    """
+    __slots__ = ('expr', 'attrname')
 
     def __init__(self, attrname=None, lineno=None, col_offset=None, parent=None):
         """
@@ -2393,6 +2459,12 @@ class DelAttr(mixins.ParentAssignTypeMixin, NodeNG):
         :type: str or None
         """
 
+        self.expr = None
+        """The name that this node represents.
+
+        :type: Name or None
+        """
+
         super(DelAttr, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, expr=None):
@@ -2574,11 +2646,27 @@ class Expr(Statement):
     <Expr l.1 at 0x7f23b2e35278>
     """
     _astroid_fields = ('value',)
-    value = None
-    """What the expression does.
+    __slots__ = ('value',)
 
-    :type: NodeNG or None
-    """
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
+
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
+
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.value = None
+        """What the expression does.
+
+        :type: NodeNG or None
+        """
+
+        super(Expr, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, value=None):
         """Do some setup after initialisation.
@@ -2945,11 +3033,7 @@ class Attribute(NodeNG):
     """Class representing an :class:`ast.Attribute` node."""
     _astroid_fields = ('expr',)
     _other_fields = ('attrname',)
-    expr = None
-    """The name that this node represents.
-
-    :type: Name or None
-    """
+    __slots__ = ('expr', 'attrname')
 
     def __init__(self, attrname=None, lineno=None, col_offset=None, parent=None):
         """
@@ -2972,6 +3056,12 @@ class Attribute(NodeNG):
         :type: str or None
         """
 
+        self.expr = None
+        """The name that this node represents.
+
+        :type: Name or None
+        """
+
         super(Attribute, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, expr=None):
@@ -3027,21 +3117,39 @@ class If(mixins.BlockRangeMixIn, Statement):
     <If l.1 at 0x7f23b2e9dd30>
     """
     _astroid_fields = ('test', 'body', 'orelse')
-    test = None
-    """The condition that the statement tests.
+    __slots__ = ('test', 'body', 'orelse')
 
-    :type: NodeNG or None
-    """
-    body = None
-    """The contents of the block.
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
 
-    :type: list(NodeNG) or None
-    """
-    orelse = None
-    """The contents of the ``else`` block.
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
 
-    :type: list(NodeNG) or None
-    """
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.test = None
+        """The condition that the statement tests.
+
+        :type: NodeNG or None
+        """
+
+        self.body = None
+        """The contents of the block.
+
+        :type: list(NodeNG) or None
+        """
+
+        self.orelse = None
+        """The contents of the ``else`` block.
+
+        :type: list(NodeNG) or None
+        """
+
+        super(If, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, test=None, body=None, orelse=None):
         """Do some setup after initialisation.
@@ -3173,11 +3281,27 @@ class Index(NodeNG):
     <Index l.1 at 0x7f23b2e9e6a0>
     """
     _astroid_fields = ('value',)
-    value = None
-    """The value to subscript with.
+    __slots__ = ('value',)
 
-    :type: NodeNG or None
-    """
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
+
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
+
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.value = None
+        """The value to subscript with.
+
+        :type: NodeNG or None
+        """
+
+        super(Index, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, value=None):
         """Do some setup after initialisation.
@@ -3199,11 +3323,7 @@ class Keyword(NodeNG):
     """
     _astroid_fields = ('value',)
     _other_fields = ('arg',)
-    value = None
-    """The value being assigned to the keyword argument.
-
-    :type: NodeNG or None
-    """
+    __slots__ = ('value', 'arg')
 
     def __init__(self, arg=None, lineno=None, col_offset=None, parent=None):
         """
@@ -3226,6 +3346,12 @@ class Keyword(NodeNG):
         :type: Name or None
         """
 
+        self.value = None
+        """The value being assigned to the keyword argument.
+
+        :type: NodeNG or None
+        """
+
         super(Keyword, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, value=None):
@@ -3245,6 +3371,7 @@ class List(_BaseContainer):
     <List.list l.1 at 0x7f23b2e9e128>
     """
     _other_fields = ('ctx',)
+    __slots__ = ('ctx',)
 
     def __init__(self, ctx=None, lineno=None,
                  col_offset=None, parent=None):
@@ -3475,11 +3602,27 @@ class Return(Statement):
     <Return l.1 at 0x7f23b8211908>
     """
     _astroid_fields = ('value',)
-    value = None
-    """The value being returned.
+    __slots__ = ('value',)
 
-    :type: NodeNG or None
-    """
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
+
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
+
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.value = None
+        """The value being returned.
+
+        :type: NodeNG or None
+        """
+
+        super(Return, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, value=None):
         """Do some setup after initialisation.
@@ -3517,21 +3660,39 @@ class Slice(NodeNG):
     <Slice l.1 at 0x7f23b2e71e80>
     """
     _astroid_fields = ('lower', 'upper', 'step')
-    lower = None
-    """The lower index in the slice.
+    __slots__ = ('lower', 'upper', 'step')
 
-    :type: NodeNG or None
-    """
-    upper = None
-    """The upper index in the slice.
+    def __init__(self, lineno=None, col_offset=None, parent=None):
+        """
+        :param lineno: The line that this node appears on in the source code.
+        :type lineno: int or None
 
-    :type: NodeNG or None
-    """
-    step = None
-    """The step to take between indexes.
+        :param col_offset: The column that this node appears on in the
+            source code.
+        :type col_offset: int or None
 
-    :type: NodeNG or None
-    """
+        :param parent: The parent node in the syntax tree.
+        :type parent: NodeNG or None
+        """
+        self.lower = None
+        """The lower index in the slice.
+
+        :type: NodeNG or None
+        """
+
+        self.upper = None
+        """The upper index in the slice.
+
+        :type: NodeNG or None
+        """
+
+        self.step = None
+        """The step to take between indexes.
+
+        :type: NodeNG or None
+        """
+
+        super(Slice, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, lower=None, upper=None, step=None):
         """Do some setup after initialisation.
@@ -3602,11 +3763,7 @@ class Starred(mixins.ParentAssignTypeMixin, NodeNG):
     """
     _astroid_fields = ('value',)
     _other_fields = ('ctx', )
-    value = None
-    """What is being unpacked.
-
-    :type: NodeNG or None
-    """
+    __slots__ = ('value', 'ctx')
 
     def __init__(self, ctx=None, lineno=None, col_offset=None, parent=None):
         """
@@ -3629,6 +3786,12 @@ class Starred(mixins.ParentAssignTypeMixin, NodeNG):
         :type: Context or None
         """
 
+        self.value = None
+        """What is being unpacked.
+
+        :type: NodeNG or None
+        """
+
         super(Starred, self).__init__(lineno=lineno,
                                       col_offset=col_offset, parent=parent)
 
@@ -3650,16 +3813,7 @@ class Subscript(NodeNG):
     """
     _astroid_fields = ('value', 'slice')
     _other_fields = ('ctx', )
-    value = None
-    """What is being indexed.
-
-    :type: NodeNG or None
-    """
-    slice = None
-    """The slice being used to lookup.
-
-    :type: NodeNG or None
-    """
+    __slots__ = ('value', 'slice', 'ctx')
 
     def __init__(self, ctx=None, lineno=None, col_offset=None, parent=None):
         """
@@ -3682,6 +3836,18 @@ class Subscript(NodeNG):
         :type: Context or None
         """
 
+        self.value = None
+        """What is being indexed.
+
+        :type: NodeNG or None
+        """
+
+        self.slice = None
+        """The slice being used to lookup.
+
+        :type: NodeNG or None
+        """
+
         super(Subscript, self).__init__(lineno=lineno,
                                         col_offset=col_offset, parent=parent)
 
@@ -3833,6 +3999,7 @@ class Tuple(_BaseContainer):
     """
 
     _other_fields = ('ctx',)
+    __slots__ = ('ctx',)
 
     def __init__(self, ctx=None, lineno=None,
                  col_offset=None, parent=None):
@@ -3884,11 +4051,7 @@ class UnaryOp(NodeNG):
     """
     _astroid_fields = ('operand',)
     _other_fields = ('op',)
-    operand = None
-    """What the unary operator is applied to.
-
-    :type: NodeNG or None
-    """
+    __slots__ = ('operand', 'op')
 
     def __init__(self, op=None, lineno=None, col_offset=None, parent=None):
         """
@@ -3911,6 +4074,12 @@ class UnaryOp(NodeNG):
         :type: str or None
         """
 
+        self.operand = None
+        """What the unary operator is applied to.
+
+        :type: NodeNG or None
+        """
+
         super(UnaryOp, self).__init__(lineno, col_offset, parent)
 
     def postinit(self, operand=None):
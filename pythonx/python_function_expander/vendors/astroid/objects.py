@@ -61,6 +61,7 @@ class Super(node_classes.NodeNG):
 
     # pylint: disable=super-init-not-called
     def __init__(self, mro_pointer, mro_type, self_class, scope):
+        super(Super, self).__init__()
         self.type = mro_type
         self.mro_pointer = mro_pointer
         self._class_based = False
@@ -22,6 +22,7 @@ from astroid import bases
 from astroid import manager
 from astroid import node_classes
 from astroid import nodes
+from astroid import serialization
 
 
 MANAGER = manager.AstroidManager()
@@ -30,6 +31,8 @@ _CONSTANTS = tuple(node_classes.CONST_CLS)
 _JYTHON = os.name == 'java'
 _BUILTINS = vars(six.moves.builtins)
 _LOG = logging.getLogger(__name__)
+# The serialized builtins module, which is much faster to load than to inspect
+_BUILTINS_SNAPSHOT = {'data': None, 'builds': 0}
 
 
 def _io_discrepancy(member):
@@ -367,13 +370,67 @@ class InspectBuilder(object):
 Astroid_BUILDER = InspectBuilder()
 
 _CONST_PROXY = {}
+def _restore_builtins(data):
+    """load the builtins module from a snapshot, None if it can't be loaded"""
+    try:
+        module = serialization.loads(data)
+    except Exception: # pylint: disable=broad-except
+        return None
+    MANAGER.cache_module(module)
+    # object_build expects what inspect_build leaves behind, to reuse the
+    # builtin classes instead of building them again
+    done = {six.moves.builtins: module}
+    for name, member in _BUILTINS.items():
+        if inspect.isclass(member) and isinstance(module.locals.get(name, [None])[0], nodes.ClassDef):
+            done[member] = module.locals[name][0]
+    # the snapshot can't hold the live objects of empty nodes, like help
+    for obj, node in done.items():
+        for name, local_nodes in node.locals.items():
+            for local_node in local_nodes:
+                if isinstance(local_node, nodes.EmptyNode) and local_node.object is None:
+                    local_node.object = getattr(obj, name, None)
+    Astroid_BUILDER._module = six.moves.builtins
+    Astroid_BUILDER._done = done
+    return module
+
+
+def _build_builtins():
+    """build the builtins module, restoring it from a snapshot when there is one
+
+    The snapshot is kept in memory and, if the manager has a
+    serialization directory, on disk for later sessions. Taking a snapshot
+    costs more than inspecting builtins, so it's only taken when builtins
+    are built a second time, by clear_cache, or when it can be saved.
+    """
+    directory = MANAGER.serialization_directory
+    data = _BUILTINS_SNAPSHOT['data']
+    if data is None and directory:
+        data = serialization.read_snapshot(directory, six.moves.builtins.__name__)
+    if data is not None:
+        module = _restore_builtins(data)
+        if module is not None:
+            _BUILTINS_SNAPSHOT['data'] = data
+            return module
+
+    module = Astroid_BUILDER.inspect_build(six.moves.builtins)
+    _BUILTINS_SNAPSHOT['builds'] += 1
+    if directory or _BUILTINS_SNAPSHOT['builds'] > 1:
+        try:
+            data = serialization.dumps(module)
+        except Exception: # pylint: disable=broad-except
+            return module
+        _BUILTINS_SNAPSHOT['data'] = data
+        if directory:
+            serialization.write_snapshot(directory, six.moves.builtins.__name__, data)
+    return module
+
+
 def _astroid_bootstrapping(astroid_builtin=None):
     """astroid boot strapping the builtins module"""
     # this boot strapping is necessary since we need the Const nodes to
     # inspect_build builtins, and then we can proxy Const
     if astroid_builtin is None:
-        from six.moves import builtins
-        astroid_builtin = Astroid_BUILDER.inspect_build(builtins)
+        astroid_builtin = _build_builtins()
 
     # pylint: disable=redefined-outer-name
     for cls, node_cls in node_classes.CONST_CLS.items():
@@ -389,29 +446,93 @@ def _astroid_bootstrapping(astroid_builtin=None):
             node_cls._proxied = proxy
         else:
             _CONST_PROXY[cls] = proxy
+    return astroid_builtin
+
+
+BUILTIN_TYPES = (types.GetSetDescriptorType, types.GeneratorType,
+                 types.MemberDescriptorType, type(None), type(NotImplemented),
+                 types.FunctionType, types.MethodType,
+                 types.BuiltinFunctionType, types.ModuleType, types.TracebackType)
+
+
+def _build_generator_type(builtins):
+    generator_type = nodes.ClassDef(types.GeneratorType.__name__, types.GeneratorType.__doc__)
+    generator_type.parent = builtins
+    bases.Generator._proxied = generator_type
+    Astroid_BUILDER.object_build(bases.Generator._proxied, types.GeneratorType)
+
+
+def _build_builtin_types(builtins):
+    """add the classes of the builtin types which aren't named in *builtins*"""
+    for type_ in BUILTIN_TYPES:
+        if type_.__name__ not in builtins:
+            cls = nodes.ClassDef(type_.__name__, type_.__doc__)
+            cls.parent = builtins
+            Astroid_BUILDER.object_build(cls, type_)
+            builtins[type_.__name__] = cls
+
+
+_BOOTSTRAP = {'done': False, 'running': False, 'hooks': []}
+
+
+def bootstrap(astroid_builtin=None):
+    """build the builtins module and proxy the builtin types to its classes
+
+    This is done the first time that the builtins module or a proxy is
+    needed, instead of when astroid is imported, so that the manager's
+    serialization directory can be set first and the builtins module
+    be restored from it. Calling it again builds the builtins module again.
+    """
+    if _BOOTSTRAP['running']:
+        return
+    _BOOTSTRAP['running'] = True
+    try:
+        astroid_builtin = _astroid_bootstrapping(astroid_builtin=astroid_builtin)
+        if not _BOOTSTRAP['done']:
+            _build_generator_type(astroid_builtin)
+        _build_builtin_types(astroid_builtin)
+        _BOOTSTRAP['done'] = True
+    finally:
+        _BOOTSTRAP['running'] = False
+    hooks = _BOOTSTRAP['hooks']
+    while hooks:
+        hooks.pop(0)()
+
+
+def on_bootstrap(hook):
+    """call *hook* once the builtins module is built, or now if it already is"""
+    if _BOOTSTRAP['done']:
+        hook()
+    else:
+        _BOOTSTRAP['hooks'].append(hook)
+
+
+def _ensure_bootstrapped():
+    if not _BOOTSTRAP['done']:
+        bootstrap()
+
+
+class _LazyProxied(object):
+    """stands for the _proxied class of a node class until the builtins are built"""
+
+    def __get__(self, instance, owner):
+        _ensure_bootstrapped()
+        for klass in owner.__mro__:
+            if '_proxied' in vars(klass):
+                value = vars(klass)['_proxied']
+                return None if value is self else value
+        return None
+
+
+for _cls in (dict, list, set, tuple):
+    node_classes.CONST_CLS[_cls]._proxied = _LazyProxied()
+bases.Generator._proxied = _LazyProxied()
 
-_astroid_bootstrapping()
 
 # TODO : find a nicer way to handle this situation;
 # However __proxied introduced an
 # infinite recursion (see https://bugs.launchpad.net/pylint/+bug/456870)
 def _set_proxied(const):
-    return _CONST_PROXY[const.value.__class__]
+    _ensure_bootstrapped()
+    return _CONST_PROXY.get(const.value.__class__)
 nodes.Const._proxied = property(_set_proxied)
-
-_GeneratorType = nodes.ClassDef(types.GeneratorType.__name__, types.GeneratorType.__doc__)
-_GeneratorType.parent = MANAGER.astroid_cache[six.moves.builtins.__name__]
-bases.Generator._proxied = _GeneratorType
-Astroid_BUILDER.object_build(bases.Generator._proxied, types.GeneratorType)
-
-_builtins = MANAGER.astroid_cache[six.moves.builtins.__name__]
-BUILTIN_TYPES = (types.GetSetDescriptorType, types.GeneratorType,
-                 types.MemberDescriptorType, type(None), type(NotImplemented),
-                 types.FunctionType, types.MethodType,
-                 types.BuiltinFunctionType, types.ModuleType, types.TracebackType)
-for _type in BUILTIN_TYPES:
-    if _type.__name__ not in _builtins:
-        cls = nodes.ClassDef(_type.__name__, _type.__doc__)
-        cls.parent = MANAGER.astroid_cache[six.moves.builtins.__name__]
-        Astroid_BUILDER.object_build(cls, _type)
-        _builtins[_type.__name__] = cls
@@ -10,6 +10,7 @@
 order to get a single Astroid representation
 """
 
+import collections
 import sys
 import _ast
 
@@ -100,6 +101,15 @@ def _visit_or_none(node, attr, visitor, parent, visit='visit',
     return None
 
 
+def _get_node_index(built_nodes):
+    """Map each class of the given nodes to its nodes, keeping their order"""
+    index = collections.defaultdict(list)
+    for node in built_nodes:
+        if node is not None:
+            index[node.__class__].append(node)
+    return dict(index)
+
+
 def _get_context(node):
     return CONTEXTS.get(type(node.ctx), astroid.Load)
 
@@ -107,20 +117,26 @@ def _get_context(node):
 class TreeRebuilder(object):
     """Rebuilds the _ast tree to become an Astroid tree"""
 
-    def __init__(self, manager):
+    def __init__(self, manager, index_nodes=False):
         self._manager = manager
         self._global_names = []
         self._import_from_nodes = []
         self._delayed_assattr = []
         self._visit_meths = {}
         self._peepholer = astpeephole.ASTPeepholeOptimizer()
+        # the built nodes, in the order of the source, if they are indexed
+        self._nodes = [] if index_nodes else None
 
     def visit_module(self, node, modname, modpath, package):
         """visit a Module node by returning a fresh instance of it"""
         node, doc = _get_doc(node)
         newnode = nodes.Module(name=modname, doc=doc, file=modpath, path=modpath,
                                package=package, parent=None)
+        if self._nodes is not None:
+            self._nodes.append(newnode)
         newnode.postinit([self.visit(child, newnode) for child in node.body])
+        if self._nodes is not None:
+            newnode.node_index = _get_node_index(self._nodes)
         return newnode
 
     def visit(self, node, parent):
@@ -132,7 +148,21 @@ class TreeRebuilder(object):
             visit_name = 'visit_' + REDIRECT.get(cls_name, cls_name).lower()
             visit_method = getattr(self, visit_name)
             self._visit_meths[cls] = visit_method
-        return visit_method(node, parent)
+        if self._nodes is None:
+            return visit_method(node, parent)
+        return self._visit_indexed(visit_method, node, parent)
+
+    def _visit_indexed(self, visit_method, node, parent, *args):
+        """call the given visit method and index the node that it returns
+        before the nodes that it contains
+        """
+        if self._nodes is None:
+            return visit_method(node, parent, *args)
+        position = len(self._nodes)
+        self._nodes.append(None)
+        newnode = visit_method(node, parent, *args)
+        self._nodes[position] = newnode
+        return newnode
 
     def _save_assignment(self, node, name=None):
         """save assignement situation since node.parent is not available yet"""
@@ -206,11 +236,12 @@ class TreeRebuilder(object):
     def visit_assert(self, node, parent):
         """visit a Assert node by returning a fresh instance of it"""
         newnode = nodes.Assert(node.lineno, node.col_offset, parent)
+        test = self.visit(node.test, newnode)
         if node.msg:
             msg = self.visit(node.msg, newnode)
         else:
             msg = None
-        newnode.postinit(self.visit(node.test, newnode), msg)
+        newnode.postinit(test, msg)
         return newnode
 
     def visit_assign(self, node, parent):
@@ -284,6 +315,7 @@ class TreeRebuilder(object):
     def visit_call(self, node, parent):
         """visit a CallFunc node by returning a fresh instance of it"""
         newnode = nodes.Call(node.lineno, node.col_offset, parent)
+        func = self.visit(node.func, newnode)
         starargs = _visit_or_none(node, 'starargs', self, newnode)
         kwargs = _visit_or_none(node, 'kwargs', self, newnode)
         args = [self.visit(child, newnode)
@@ -310,8 +342,7 @@ class TreeRebuilder(object):
             else:
                 keywords = [new_kwargs]
 
-        newnode.postinit(self.visit(node.func, newnode),
-                         args, keywords)
+        newnode.postinit(func, args, keywords)
         return newnode
 
     def visit_classdef(self, node, parent, newstyle=None):
@@ -323,10 +354,14 @@ class TreeRebuilder(object):
         if PY3:
             for keyword in node.keywords:
                 if keyword.arg == 'metaclass':
+                    # the keyword isn't part of the tree so it isn't indexed
+                    nodes_ = self._nodes
+                    self._nodes = None
                     metaclass = self.visit(keyword, newnode).value
+                    self._nodes = nodes_
                     break
         if node.decorator_list:
-            decorators = self.visit_decorators(node, newnode)
+            decorators = self._visit_indexed(self.visit_decorators, node, newnode)
         else:
             decorators = None
         newnode.postinit([self.visit(child, newnode)
@@ -387,14 +422,22 @@ class TreeRebuilder(object):
 
     def _visit_dict_items(self, node, parent, newnode):
         for key, value in zip(node.keys, node.values):
-            rebuilt_value = self.visit(value, newnode)
-            if not key:
-                # Python 3.5 and extended unpacking
+            if key:
+                rebuilt_key = self.visit(key, newnode)
+                rebuilt_value = self.visit(value, newnode)
+            else:
+                # Python 3.5 and extended unpacking. The key is built from
+                # the value but it comes first, like in the tree
+                position = None
+                if self._nodes is not None:
+                    position = len(self._nodes)
+                    self._nodes.append(None)
+                rebuilt_value = self.visit(value, newnode)
                 rebuilt_key = nodes.DictUnpack(rebuilt_value.lineno,
                                                rebuilt_value.col_offset,
                                                parent)
-            else:
-                rebuilt_key = self.visit(key, newnode)
+                if position is not None:
+                    self._nodes[position] = rebuilt_key
             yield rebuilt_key, rebuilt_value
 
     def visit_dict(self, node, parent):
@@ -487,14 +530,15 @@ class TreeRebuilder(object):
         newnode = cls(node.name, doc, node.lineno,
                       node.col_offset, parent)
         if node.decorator_list:
-            decorators = self.visit_decorators(node, newnode)
+            decorators = self._visit_indexed(self.visit_decorators, node, newnode)
         else:
             decorators = None
+        args = self.visit(node.args, newnode)
         if PY3 and node.returns:
             returns = self.visit(node.returns, newnode)
         else:
             returns = None
-        newnode.postinit(self.visit(node.args, newnode),
+        newnode.postinit(args,
                          [self.visit(child, newnode)
                           for child in node.body],
                          decorators, returns)
@@ -788,7 +832,7 @@ class TreeRebuilder3(TreeRebuilder):
         """visit an ExceptHandler node by returning a fresh instance of it"""
         newnode = nodes.ExceptHandler(node.lineno, node.col_offset, parent)
         if node.name:
-            name = self.visit_assignname(node, newnode, node.name)
+            name = self._visit_indexed(self.visit_assignname, node, newnode, node.name)
         else:
             name = None
         newnode.postinit(_visit_or_none(node, 'type', self, newnode),
@@ -826,7 +870,7 @@ class TreeRebuilder3(TreeRebuilder):
         if node.finalbody:
             newnode = nodes.TryFinally(node.lineno, node.col_offset, parent)
             if node.handlers:
-                body = [self.visit_tryexcept(node, newnode)]
+                body = [self._visit_indexed(self.visit_tryexcept, node, newnode)]
             else:
                 body = [self.visit(child, newnode)
                         for child in node.body]
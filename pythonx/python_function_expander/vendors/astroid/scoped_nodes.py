@@ -285,6 +285,11 @@ class Module(LocalsDictNodeNG):
     lineno = 0
     """The line that this node appears on in the source code.
 
+    :type: int or None
+    """
+    col_offset = None
+    """The column that this node appears on in the source code.
+
     :type: int or None
     """
 
@@ -338,6 +343,14 @@ class Module(LocalsDictNodeNG):
 
     :type: set(str) or None
     """
+    node_index = None
+    """A map of each class of node in this module to the nodes of that
+    exact class, in the order of the source. It's only built when it's
+    asked for, see :class:`~astroid.builder.AstroidBuilder`. Nodes which
+    transforms replace or add aren't in it.
+
+    :type: dict(type, list(NodeNG)) or None
+    """
     special_attributes = objectmodel.ModuleModel()
     """The names of special attributes that this module has.
 
@@ -407,6 +420,30 @@ class Module(LocalsDictNodeNG):
         """
         self.body = body
 
+    def nodes_of_class(self, klass, skip_klass=None):
+        """Get the nodes (including this one or below) of the given type.
+
+        The nodes are looked up in :attr:`node_index`, if the module has
+        one and if only one class of node in it matches *klass*.
+
+        :param klass: The type of node to search for.
+        :type klass: builtins.type
+
+        :param skip_klass: A type of node to ignore. This is useful to ignore
+            subclasses of :attr:`klass`.
+        :type skip_klass: builtins.type
+
+        :returns: The node of the given type.
+        :rtype: iterable(NodeNG)
+        """
+        if self.node_index is not None and skip_klass is None:
+            classes = [cls for cls in self.node_index if issubclass(cls, klass)]
+            if not classes:
+                return iter(())
+            if len(classes) == 1:
+                return iter(self.node_index[classes[0]])
+        return super(Module, self).nodes_of_class(klass, skip_klass)
+
     def _get_stream(self):
         if self.file_bytes is not None:
             return io.BytesIO(self.file_bytes)
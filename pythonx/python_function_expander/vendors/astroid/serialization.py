@@ -0,0 +1,334 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/COPYING.LESSER
+
+"""Save built modules to disk and load them back, instead of parsing them again.
+
+Only the tree that the rebuilder makes is saved, before any transform
+was applied, because transforms may attach functions to nodes which
+can't be saved. The builder's post build steps and the transforms still
+run after a module is loaded, exactly like they would after a parse.
+
+Trees are too deep to be pickled directly so the nodes are saved as
+a flat list and each reference to a node is saved as its index in it.
+Anything that isn't a node or plain data, like the live objects of an
+introspected module, is loaded as None.
+
+Entries are keyed by the module's name and path, a hash of its source,
+the astroid version and the Python version. An entry that can't be read
+is deleted and the module is simply built again. Saving an entry deletes
+the older entries of the same module and path, so that the directory
+doesn't grow every time that a module changes.
+"""
+
+import enum
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+
+import six
+
+from astroid import __pkginfo__
+from astroid import node_classes
+
+
+# Change this whenever the saved data changes, so that old entries are ignored
+_FORMAT = 1
+_SLOTS = {}
+# The version of each installed distribution, by its top-level module names
+_VERSIONS = {}
+# Any other attribute, like the live objects that introspected modules refer to, is saved as None
+_SAVED_TYPES = six.integer_types + (
+    node_classes.NodeNG, six.text_type, bytes, float, complex, bool, type(None),
+    type(Ellipsis), type(NotImplemented), list, tuple, dict, set, frozenset, enum.Enum,
+)
+
+
+def _get_slots(cls):
+    try:
+        return _SLOTS[cls]
+    except KeyError:
+        slots = []
+        for klass in cls.__mro__:
+            names = getattr(klass, '__slots__', ())
+            if isinstance(names, six.string_types):
+                names = (names, )
+            slots.extend(name for name in names
+                         if name not in ('__dict__', '__weakref__'))
+        _SLOTS[cls] = slots
+        return slots
+
+
+def _get_state(node):
+    slots = _get_slots(type(node))
+    if not slots:
+        return node.__dict__
+    state = dict(getattr(node, '__dict__', {}))
+    for name in slots:
+        try:
+            state[name] = getattr(node, name)
+        except AttributeError:
+            pass
+    return state
+
+
+def _get_saved_state(node):
+    state = _get_state(node)
+    if all(isinstance(value, _SAVED_TYPES) for value in state.values()):
+        return state
+    return {name: value if isinstance(value, _SAVED_TYPES) else None
+            for name, value in state.items()}
+
+
+def _set_state(node, state):
+    if not _get_slots(type(node)):
+        node.__dict__ = state
+        return
+    for name, value in state.items():
+        setattr(node, name, value)
+
+
+def _iter_nodes(value):
+    """Find the nodes in *value*, looking inside of lists, tuples and dicts"""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, node_classes.NodeNG):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+
+
+def _get_nodes(module):
+    """Find every node which *module* references, directly or not"""
+    nodes = [module]
+    indices = {id(module): 0}
+    index = 0
+    while index < len(nodes):
+        for node in _iter_nodes(list(_get_state(nodes[index]).values())):
+            if id(node) not in indices:
+                indices[id(node)] = len(nodes)
+                nodes.append(node)
+        index += 1
+    return nodes, indices
+
+
+class _Pickler(pickle.Pickler):
+    """Save each node as the index of the node in a flat list of nodes"""
+
+    def __init__(self, stream, indices):
+        pickle.Pickler.__init__(self, stream, pickle.HIGHEST_PROTOCOL)
+        self._indices = indices
+
+    def persistent_id(self, obj):
+        if isinstance(obj, node_classes.NodeNG):
+            return self._indices[id(obj)]
+        return None
+
+
+def dumps(module):
+    """Serialize the tree of *module* into a string of bytes"""
+    nodes, indices = _get_nodes(module)
+    stream = io.BytesIO()
+    pickler = _Pickler(stream, indices)
+    pickler.dump((_FORMAT, [type(node) for node in nodes]))
+    pickler.dump([_get_saved_state(node) for node in nodes])
+    return stream.getvalue()
+
+
+def loads(data):
+    """Create the module that was serialized by :func:`dumps`
+
+    :raises ValueError: If *data* was written by another format.
+    """
+    unpickler = pickle.Unpickler(io.BytesIO(data))
+    format_, classes = unpickler.load()
+    if format_ != _FORMAT:
+        raise ValueError('Unknown serialization format {!r}'.format(format_))
+    nodes = [cls.__new__(cls) for cls in classes]
+    unpickler.persistent_load = nodes.__getitem__
+    for node, state in zip(nodes, unpickler.load()):
+        _set_state(node, state)
+    return nodes[0]
+
+
+def get_cache_path(directory, modname, path, data):
+    """Get the file where the module built from *data* is saved
+
+    The file's name starts with a hash of *modname* and *path* so that the
+    entries which were saved for other versions of the module can be found.
+    """
+    if isinstance(data, six.text_type):
+        data = data.encode('utf-8')
+    identity = '\0'.join((modname, os.path.abspath(path) if path else ''))
+    key = '\0'.join((
+        identity,
+        hashlib.sha1(data).hexdigest(),
+        __pkginfo__.version,
+        sys.version,
+    ))
+    name = '{}-{}.ast'.format(
+        hashlib.sha1(identity.encode('utf-8')).hexdigest(),
+        hashlib.sha1(key.encode('utf-8')).hexdigest())
+    return os.path.join(directory, name)
+
+
+def _read_top_levels(folder):
+    """Get the top-level module names which a distribution's metadata *folder* lists"""
+    try:
+        with open(os.path.join(folder, 'top_level.txt')) as stream:
+            return [line.strip() for line in stream if line.strip()]
+    except (IOError, OSError):
+        return []
+
+
+def _find_distribution_versions():
+    """Find the version of every installed distribution, by its top-level module names
+
+    The metadata folders on :data:`sys.path` are read directly because
+    importing the distributions or a metadata library is much slower.
+    """
+    versions = {}
+    for root in sys.path:
+        try:
+            names = os.listdir(root or '.')
+        except OSError:
+            continue
+        for name in names:
+            base, extension = os.path.splitext(name)
+            if extension not in ('.dist-info', '.egg-info'):
+                continue
+            project, _, version = base.partition('-')
+            version = version.split('-')[0]
+            folder = os.path.join(root or '.', name)
+            for top_level in [project.replace('-', '_').lower()] + _read_top_levels(folder):
+                versions.setdefault(top_level, version)
+    return versions
+
+
+def _get_distribution_version(modname):
+    """Get the version of the installed distribution that *modname* belongs to, if it can be found"""
+    if not _VERSIONS:
+        _VERSIONS.update(_find_distribution_versions())
+        # don't scan again, even if nothing was found
+        _VERSIONS.setdefault('', '')
+    return _VERSIONS.get(modname.split('.')[0], '')
+
+
+def _get_inspection_key(modname, path):
+    """Get what identifies the compiled module *modname*, without importing it"""
+    try:
+        status = os.stat(path) if path else None
+    except OSError:
+        status = None
+    stamp = '{!r} {}'.format(status.st_mtime, status.st_size) if status else ''
+    return '\0'.join(('inspected', stamp, _get_distribution_version(modname)))
+
+
+def load_inspected_module(directory, modname, path):
+    """Load the introspected tree of a compiled module, if it was saved in *directory*
+
+    *path* is the module's file, or None for modules which are built into Python.
+    """
+    return load_module(directory, modname, path, _get_inspection_key(modname, path))
+
+
+def save_inspected_module(directory, modname, path, module):
+    """Save the introspected tree of a compiled module in *directory*"""
+    return save_module(directory, modname, path, _get_inspection_key(modname, path), module)
+
+
+def load_module(directory, modname, path, data):
+    """Load the module built from *data*, if it was saved in *directory*
+
+    Return None if it wasn't saved or if the saved entry is corrupt. Corrupt
+    entries are deleted.
+    """
+    cache_path = get_cache_path(directory, modname, path, data)
+    try:
+        with open(cache_path, 'rb') as stream:
+            content = stream.read()
+    except (IOError, OSError):
+        return None
+    try:
+        return loads(content)
+    except Exception: # pylint: disable=broad-except
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+        return None
+
+
+def save_module(directory, modname, path, data, module):
+    """Save *module*, which was built from *data*, in *directory*
+
+    Return False if the module couldn't be saved.
+    """
+    try:
+        content = dumps(module)
+    except Exception: # pylint: disable=broad-except
+        return False
+    return _write(directory, get_cache_path(directory, modname, path, data), content)
+
+
+def read_snapshot(directory, name):
+    """Get the content that :func:`write_snapshot` saved as *name*, or None"""
+    try:
+        with open(get_cache_path(directory, name, None, 'snapshot'), 'rb') as stream:
+            return stream.read()
+    except (IOError, OSError):
+        return None
+
+
+def write_snapshot(directory, name, content):
+    """Save *content*, which :func:`dumps` made, as *name* in *directory*"""
+    return _write(directory, get_cache_path(directory, name, None, 'snapshot'), content)
+
+
+def _write(directory, cache_path, content):
+    """Write *content* to *cache_path*
+
+    The content is written to a temporary file first so that readers never
+    see a half-written entry. Return False if it couldn't be written.
+    """
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        handle, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    except (IOError, OSError):
+        return False
+    try:
+        with os.fdopen(handle, 'wb') as stream:
+            stream.write(content)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        os.rename(temporary_path, cache_path)
+    except (IOError, OSError):
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        return False
+    _remove_superseded(directory, cache_path)
+    return True
+
+
+def _remove_superseded(directory, cache_path):
+    """Delete the other entries of the module and path that *cache_path* was saved for"""
+    name = os.path.basename(cache_path)
+    prefix = name.split('-')[0] + '-'
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for other in names:
+        if other != name and other.startswith(prefix) and other.endswith('.ast'):
+            try:
+                os.remove(os.path.join(directory, other))
+            except OSError:
+                pass
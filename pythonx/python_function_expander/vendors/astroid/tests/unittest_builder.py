@@ -10,6 +10,7 @@
 
 import os
 import sys
+import textwrap
 import unittest
 
 import six
@@ -17,6 +18,7 @@ import six
 from astroid import builder
 from astroid import exceptions
 from astroid import manager
+from astroid import node_classes
 from astroid import nodes
 from astroid import test_utils
 from astroid import util
@@ -571,6 +573,53 @@ class BuilderTest(unittest.TestCase):
         self.assertIsInstance(inferred, nodes.Const)
         self.assertEqual(inferred.value, NotImplemented)
 
+    def test_parse_syntax_skips_cache_and_transforms(self):
+        def transform_call(node):
+            node.transformed = True
+        builder.MANAGER.register_transform(nodes.Call, transform_call)
+        try:
+            module = builder.parse_syntax('a = foo(1)\n',
+                                          module_name='parse_syntax_test')
+        finally:
+            builder.MANAGER.unregister_transform(nodes.Call, transform_call)
+        call = module.body[0].value
+        self.assertIsInstance(call, nodes.Call)
+        self.assertFalse(hasattr(call, 'transformed'))
+        self.assertNotIn('parse_syntax_test', builder.MANAGER.astroid_cache)
+        self.assertIn('a', module.locals)
+
+        module = builder.parse('a = foo(1)\n', module_name='parse_syntax_test')
+        try:
+            self.assertIs(builder.MANAGER.astroid_cache['parse_syntax_test'], module)
+        finally:
+            builder.MANAGER.astroid_cache.pop('parse_syntax_test', None)
+
+    @test_utils.require_version(minver='3.5')
+    def test_parse_syntax_indexes_nodes(self):
+        code = textwrap.dedent('''
+        @decorate(1)
+        def function(value=first(), *args) -> returned():
+            assert check(value), message()
+            return outer(inner(value), {key(): value, **rest()})
+
+        class Class(Base, metaclass=Meta):
+            pass
+        ''')
+        module = builder.parse_syntax(code)
+        calls = list(module.nodes_of_class(nodes.Call))
+        walked = list(node_classes.NodeNG.nodes_of_class(module, nodes.Call))
+        self.assertEqual(calls, walked)
+        self.assertEqual([call.func.as_string() for call in calls],
+                         ['decorate', 'first', 'returned', 'check', 'message',
+                          'outer', 'inner', 'key', 'rest'])
+        self.assertEqual(list(module.nodes_of_class(nodes.Module)), [module])
+        self.assertEqual(list(module.nodes_of_class(nodes.Yield)), [])
+        self.assertEqual(len(module.node_index[nodes.DictUnpack]), 1)
+        self.assertNotIn(nodes.Keyword, module.node_index)
+        self.assertEqual([name.name for name in module.nodes_of_class(nodes.Name)],
+                         [name.name for name in node_classes.NodeNG.nodes_of_class(module, nodes.Name)])
+        self.assertIsNone(builder.parse(code).node_index)
+
 
 class FileBuildTest(unittest.TestCase):
     def setUp(self):
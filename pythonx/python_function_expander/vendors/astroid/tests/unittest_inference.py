@@ -25,6 +25,7 @@ from astroid.inference import infer_end as inference_infer_end
 from astroid.bases import Instance, BoundMethod, UnboundMethod,\
                                 BUILTINS
 from astroid import arguments
+from astroid import context as contextmod
 from astroid import decorators as decoratorsmod
 from astroid import exceptions
 from astroid import helpers
@@ -58,6 +59,71 @@ class InferenceUtilsTest(unittest.TestCase):
             next(infer_default(1))
         self.assertEqual(next(infer_end(1)), 1)
 
+    def test_cloned_paths_diverge(self):
+        context = contextmod.InferenceContext()
+        self.assertFalse(context.push(1))
+        clone = context.clone()
+        self.assertTrue(clone.push(1))
+        self.assertFalse(clone.push(2))
+        self.assertFalse(context.push(3))
+        self.assertEqual(set(context.path), {(1, None), (3, None)})
+        self.assertEqual(set(clone.path), {(1, None), (2, None)})
+
+    def test_path_chain_is_flattened(self):
+        path = contextmod.InferencePath
+        count = path.max_copied + path.max_depth * 2
+        context = contextmod.InferenceContext()
+        for number in range(count):
+            self.assertFalse(context.push(number))
+            context = context.clone()
+        self.assertIsNotNone(context.path._parent)
+        self.assertLessEqual(context.path._depth, path.max_depth)
+        self.assertTrue(context.push(0))
+        self.assertEqual(len(context.path), count)
+
+    def test_cache_generator_resumes(self):
+        produced = []
+
+        def generate():
+            for number in range(3):
+                produced.append(number)
+                yield number
+
+        context = contextmod.InferenceContext()
+        self.assertEqual(next(context.cache_generator('key', generate())), 0)
+        self.assertEqual(produced, [0])
+        hits = contextmod.CACHE_STATISTICS['hits']
+        self.assertEqual(list(context.get_cached('key')), [0, 1, 2])
+        self.assertEqual(list(context.clone().get_cached('key')), [0, 1, 2])
+        self.assertEqual(produced, [0, 1, 2])
+        self.assertEqual(contextmod.CACHE_STATISTICS['hits'], hits + 2)
+
+    def test_cache_generator_error_is_not_cached(self):
+        def generate():
+            yield 1
+            raise InferenceError
+
+        context = contextmod.InferenceContext()
+        with self.assertRaises(InferenceError):
+            list(context.cache_generator('key', generate()))
+        self.assertIsNone(context.get_cached('key'))
+
+    def test_first_inferred_value_is_cached(self):
+        node = extract_node('1 + 2')
+        context = contextmod.InferenceContext()
+        self.assertEqual(next(node.infer(context)).value, 3)
+        misses = contextmod.CACHE_STATISTICS['misses']
+        self.assertEqual(next(node.infer(context)).value, 3)
+        self.assertEqual(contextmod.CACHE_STATISTICS['misses'], misses)
+
+    def test_restore_path(self):
+        context = contextmod.InferenceContext()
+        context.push(1)
+        with context.restore_path():
+            self.assertFalse(context.push(2))
+        self.assertTrue(context.push(1))
+        self.assertFalse(context.push(2))
+
 
 def _assertInferElts(node_type, self, node, elts):
     inferred = next(node.infer())
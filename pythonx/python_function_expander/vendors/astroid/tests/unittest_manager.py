@@ -7,14 +7,17 @@
 
 import os
 import platform
+import shutil
 import site
 import sys
+import tempfile
 import unittest
 
 import pkg_resources
 import six
 
 import astroid
+from astroid import cache
 from astroid import exceptions
 from astroid import manager
 from astroid.tests import resources
@@ -269,6 +272,27 @@ class AstroidManagerTest(resources.SysPathSetup,
             self.manager.ast_from_module_name('foo.bar.baz')
         del self.manager._failed_import_hooks[0]
 
+    def test_brains_are_loaded_with_their_module(self):
+        directory = tempfile.mkdtemp()
+        with open(os.path.join(directory, 'brain_lazy_test.py'), 'w') as stream:
+            stream.write(
+                'import astroid\n'
+                'astroid.register_module_extender(\n'
+                '    astroid.MANAGER, "lazy_test.sub", lambda: astroid.parse("EXTENDED = 1"))\n'
+            )
+        sys.path.insert(0, directory)
+        try:
+            self.manager.register_brain('lazy_test', 'brain_lazy_test')
+            self.assertNotIn('brain_lazy_test', sys.modules)
+            module = astroid.builder.AstroidBuilder(self.manager).string_build('', 'lazy_test.sub')
+            self.assertIn('brain_lazy_test', sys.modules)
+        finally:
+            sys.path.remove(directory)
+            sys.modules.pop('brain_lazy_test', None)
+            shutil.rmtree(directory)
+        self.assertIn('EXTENDED', module.locals)
+        self.assertNotIn('lazy_test', self.manager._brains)
+
 
 class BorgAstroidManagerTC(unittest.TestCase):
 
@@ -283,5 +307,141 @@ class BorgAstroidManagerTC(unittest.TestCase):
         self.assertIs(built, second_built)
 
 
+class ModuleCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _build(self, name, code):
+        path = os.path.join(self.directory, name + '.py')
+        with open(path, 'w') as stream:
+            stream.write(code)
+        return astroid.builder.AstroidBuilder(
+            manager.AstroidManager(), cache_modules=False).file_build(path, name)
+
+    def test_least_recently_used_are_evicted(self):
+        module_cache = cache.ModuleCache(max_entries=2, protected=('builtins',))
+        module_cache['builtins'] = 1
+        module_cache['first'] = 2
+        module_cache['second'] = 3
+        self.assertEqual(list(module_cache), ['builtins', 'second'])
+        module_cache['second'] # pylint: disable=pointless-statement
+        module_cache['third'] = 4
+        self.assertEqual(list(module_cache), ['builtins', 'third'])
+        self.assertEqual(module_cache.stats()['evictions'], 2)
+        self.assertEqual(module_cache.stats()['hits'], 1)
+
+    def test_changed_files_are_invalidated(self):
+        for validation in (cache.MTIME, cache.HASH):
+            module_cache = cache.ModuleCache(validation=validation)
+            module = self._build('changed', 'a = 1\n')
+            module_cache['changed'] = module
+            self.assertIn('changed', module_cache)
+
+            with open(module.file, 'w') as stream:
+                stream.write('a = 2\n')
+            os.utime(module.file, (0, 0))
+            # files are only checked again once the cache is revalidated
+            self.assertIn('changed', module_cache)
+            module_cache.revalidate()
+            self.assertNotIn('changed', module_cache)
+            self.assertEqual(module_cache.stats()['invalidations'], 1)
+
+    def test_unchanged_files_are_not_hashed_again(self):
+        module_cache = cache.ModuleCache(validation=cache.HASH)
+        module = self._build('unchanged', 'a = 1\n')
+        module_cache['unchanged'] = module
+
+        # a touched file is hashed again, but kept if its content is the same
+        os.utime(module.file, (0, 0))
+        module_cache.revalidate()
+        self.assertIn('unchanged', module_cache)
+
+        # the content isn't read while the modification time and size are the same
+        with open(module.file, 'w') as stream:
+            stream.write('a = 2\n')
+        os.utime(module.file, (0, 0))
+        module_cache.revalidate()
+        self.assertIn('unchanged', module_cache)
+
+        os.utime(module.file, (1, 1))
+        module_cache.revalidate()
+        self.assertNotIn('unchanged', module_cache)
+        self.assertEqual(module_cache.stats()['invalidations'], 1)
+
+    def test_lookups_are_counted_once(self):
+        module_cache = cache.ModuleCache()
+        self.assertIsNone(module_cache.get('first'))
+        module_cache.setdefault('first', 1)
+        self.assertEqual(module_cache.get('first'), 1)
+        self.assertIn('first', module_cache)
+        stats = module_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_no_validation(self):
+        module_cache = cache.ModuleCache(validation=None)
+        module = self._build('unchecked', 'a = 1\n')
+        module_cache['unchecked'] = module
+        os.utime(module.file, (0, 0))
+        self.assertIn('unchecked', module_cache)
+
+    def test_manager_rebuilds_changed_files(self):
+        module = self._build('rebuilt', 'a = 1\n')
+        astroid_manager = manager.AstroidManager()
+        astroid_manager.cache_module(module)
+        try:
+            self.assertIs(astroid_manager.ast_from_file(module.file, 'rebuilt'), module)
+            with open(module.file, 'w') as stream:
+                stream.write('b = 2\n')
+            os.utime(module.file, (0, 0))
+            astroid_manager.revalidate_cache()
+            rebuilt = astroid_manager.ast_from_file(module.file, 'rebuilt')
+            self.assertIsNot(rebuilt, module)
+            self.assertIn('b', rebuilt.locals)
+            self.assertIn('invalidations', astroid_manager.cache_stats()['modules'])
+        finally:
+            astroid_manager.astroid_cache.pop('rebuilt', None)
+
+    def test_removed_entries_are_reported(self):
+        removed = []
+        module_cache = cache.ModuleCache(
+            max_entries=1, on_remove=lambda: removed.append(True))
+        module_cache['first'] = 1
+        module_cache['first'] = 1
+        self.assertEqual(len(removed), 0)
+        module_cache['first'] = 2
+        module_cache['second'] = 3
+        module_cache.clear()
+        self.assertEqual(len(removed), 3)
+
+    def test_inferences_are_remembered_for_a_generation(self):
+        astroid_manager = manager.AstroidManager()
+        node = astroid.extract_node('int(1).real')
+        inferred = list(node.infer())
+        hits = astroid_manager.cache_stats()['inferences']['hits']
+        self.assertEqual(list(node.infer()), inferred)
+        self.assertEqual(astroid_manager.cache_stats()['inferences']['hits'], hits + 1)
+
+        generation = astroid_manager.generation
+        module = self._build('forgotten', 'a = 1\n')
+        astroid_manager.cache_module(module)
+        del astroid_manager.astroid_cache['forgotten']
+        self.assertEqual(astroid_manager.generation, generation + 1)
+        self.assertIsNone(astroid_manager.get_inference((node, None)))
+
+    def test_revalidation_forgets_inferences(self):
+        astroid_manager = manager.AstroidManager()
+        node = astroid.extract_node('int(1).real')
+        list(node.infer())
+        self.assertIsNotNone(astroid_manager.get_inference((node, None)))
+        generation = astroid_manager.generation
+        astroid_manager.revalidate_cache()
+        self.assertEqual(astroid_manager.generation, generation + 1)
+        self.assertIsNone(astroid_manager.get_inference((node, None)))
+
+
 if __name__ == '__main__':
     unittest.main()
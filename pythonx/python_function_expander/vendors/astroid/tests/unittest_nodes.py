@@ -463,6 +463,20 @@ class NameNodeTest(unittest.TestCase):
             self.assertIsInstance(del_true, nodes.DelName)
             self.assertEqual(del_true.name, "True")
 
+    def test_slots_keep_dict_for_caches(self):
+        """slotted nodes only get a __dict__ once something caches on them"""
+        module = builder.parse("""
+            value = 1
+            value
+        """)
+        name = module.body[1].value
+        self.assertIsInstance(name, nodes.Name)
+        self.assertFalse(name.__dict__)
+        self.assertEqual(name.inferred()[0].value, 1)
+        # lookups and inference can still cache on the node
+        name.cached = True
+        self.assertTrue(name.__dict__)
+
 
 class AnnAssignNodeTest(unittest.TestCase):
     @test_utils.require_version(minver='3.6')
@@ -0,0 +1,190 @@
+# Licensed under the LGPL: https://www.gnu.org/licenses/old-licenses/lgpl-2.1.en.html
+# For details: https://github.com/PyCQA/astroid/blob/master/COPYING.LESSER
+
+"""tests for saving built modules to disk"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import six
+
+from astroid import builder
+from astroid import manager
+from astroid import modutils
+from astroid import nodes
+from astroid import raw_building
+from astroid import serialization
+
+
+BUILTINS = six.moves.builtins.__name__
+CODE = '''
+import os
+
+class Base(object):
+    attribute = [1, 2.5, 'text', b'bytes', None, Ellipsis]
+
+    def method(self, value=os.sep, *args, **kwargs):
+        self.value = {value: args}
+        return lambda: (yield value)
+
+def function():
+    return Base().method()
+'''
+
+
+class SerializationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'module.py')
+        with open(self.path, 'w') as stream:
+            stream.write(CODE)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _data_build(self, data=CODE):
+        return builder.AstroidBuilder()._data_build(data, 'module', self.path)
+
+    def test_round_trip(self):
+        module = self._data_build()
+        loaded = serialization.loads(serialization.dumps(module))
+        self.assertEqual(loaded.as_string(), module.as_string())
+        base = loaded['Base']
+        self.assertIs(base.parent, loaded)
+        self.assertIs(base.locals['method'][0].parent, base)
+        self.assertEqual(len(loaded._delayed_assattr), 1)
+        self.assertIsInstance(base.locals['attribute'][0].parent.value, nodes.List)
+
+    def test_save_and_load(self):
+        cache = os.path.join(self.directory, 'cache')
+        module = self._data_build()
+        self.assertIsNone(serialization.load_module(cache, 'module', self.path, CODE))
+        self.assertTrue(serialization.save_module(cache, 'module', self.path, CODE, module))
+        loaded = serialization.load_module(cache, 'module', self.path, CODE)
+        self.assertEqual(loaded.as_string(), module.as_string())
+        # A changed source is a different entry
+        self.assertIsNone(serialization.load_module(cache, 'module', self.path, CODE + '\n'))
+
+    def test_superseded_entries_are_deleted(self):
+        cache = os.path.join(self.directory, 'cache')
+        module = self._data_build()
+        serialization.save_module(cache, 'module', self.path, CODE, module)
+        serialization.save_module(cache, 'other', self.path, CODE, module)
+        serialization.save_module(cache, 'module', self.path, CODE + '\n', module)
+        self.assertEqual(sorted(os.listdir(cache)), sorted([
+            os.path.basename(serialization.get_cache_path(cache, 'other', self.path, CODE)),
+            os.path.basename(serialization.get_cache_path(cache, 'module', self.path, CODE + '\n')),
+        ]))
+
+    def test_distribution_version(self):
+        site = os.path.join(self.directory, 'site')
+        folder = os.path.join(site, 'Some_Project-1.2.3.dist-info')
+        os.makedirs(folder)
+        with open(os.path.join(folder, 'top_level.txt'), 'w') as stream:
+            stream.write('some_project\nsome_module\n')
+        versions = dict(serialization._VERSIONS)
+        serialization._VERSIONS.clear()
+        sys.path.insert(0, site)
+        try:
+            self.assertEqual(serialization._get_distribution_version('some_module.sub'), '1.2.3')
+            self.assertEqual(serialization._get_distribution_version('some_project'), '1.2.3')
+            self.assertEqual(serialization._get_distribution_version('not_installed'), '')
+        finally:
+            sys.path.remove(site)
+            serialization._VERSIONS.clear()
+            serialization._VERSIONS.update(versions)
+
+    def test_corrupt_entries_are_deleted(self):
+        cache = os.path.join(self.directory, 'cache')
+        serialization.save_module(cache, 'module', self.path, CODE, self._data_build())
+        cache_path = serialization.get_cache_path(cache, 'module', self.path, CODE)
+        with open(cache_path, 'wb') as stream:
+            stream.write(b'not a pickle')
+        self.assertIsNone(serialization.load_module(cache, 'module', self.path, CODE))
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_file_build_uses_directory(self):
+        astroid_manager = manager.AstroidManager()
+        cache = os.path.join(self.directory, 'cache')
+        astroid_manager.serialization_directory = cache
+        try:
+            first = builder.AstroidBuilder(cache_modules=False).file_build(self.path, 'module')
+            self.assertEqual(len(os.listdir(cache)), 1)
+            second = builder.AstroidBuilder(cache_modules=False).file_build(self.path, 'module')
+        finally:
+            astroid_manager.serialization_directory = None
+        self.assertIsNot(first, second)
+        self.assertEqual(first.as_string(), second.as_string())
+        inferred = next(second['function'].infer_call_result(None))
+        self.assertIsInstance(inferred, nodes.Lambda)
+
+    def test_compiled_modules_are_loaded_without_importing(self):
+        astroid_manager = manager.AstroidManager()
+        original = astroid_manager.astroid_cache.pop('_csv', None)
+        astroid_manager.serialization_directory = os.path.join(self.directory, 'cache')
+
+        def fail(*_):
+            raise AssertionError('The module was imported')
+
+        load_module_from_name = modutils.load_module_from_name
+        try:
+            inspected = astroid_manager.ast_from_module_name('_csv')
+            del astroid_manager.astroid_cache['_csv']
+            modutils.load_module_from_name = fail
+            loaded = astroid_manager.ast_from_module_name('_csv')
+        finally:
+            modutils.load_module_from_name = load_module_from_name
+            astroid_manager.serialization_directory = None
+            astroid_manager.astroid_cache.pop('_csv', None)
+            if original is not None:
+                astroid_manager.astroid_cache['_csv'] = original
+        self.assertIsNot(inspected, loaded)
+        self.assertEqual(sorted(inspected.locals), sorted(loaded.locals))
+        self.assertIsInstance(loaded['reader'], nodes.FunctionDef)
+
+    def test_builtins_are_restored_from_snapshot(self):
+        astroid_manager = manager.AstroidManager()
+        cache = os.path.join(self.directory, 'cache')
+        astroid_manager.serialization_directory = cache
+        raw_building._BUILTINS_SNAPSHOT['data'] = None
+        try:
+            astroid_manager.clear_cache()
+            data = raw_building._BUILTINS_SNAPSHOT['data']
+            self.assertIsNotNone(data)
+            self.assertEqual(serialization.read_snapshot(cache, BUILTINS), data)
+            first = astroid_manager.astroid_cache[BUILTINS]
+            astroid_manager.clear_cache()
+        finally:
+            astroid_manager.serialization_directory = None
+        restored = astroid_manager.astroid_cache[BUILTINS]
+        self.assertIsNot(first, restored)
+        self.assertEqual(sorted(first.locals), sorted(restored.locals))
+        self.assertIs(restored['help'].object, help)
+        inferred = next(builder.extract_node('[1].append').infer())
+        self.assertIs(inferred.parent.parent, restored)
+
+    def test_missing_builtins_are_built_from_directory(self):
+        astroid_manager = manager.AstroidManager()
+        cache = os.path.join(self.directory, 'cache')
+        original = astroid_manager.astroid_cache[BUILTINS]
+        serialization.write_snapshot(cache, BUILTINS, serialization.dumps(original))
+        raw_building._BUILTINS_SNAPSHOT['data'] = None
+        astroid_manager.astroid_cache.clear()
+        astroid_manager.serialization_directory = cache
+        try:
+            built = astroid_manager.astroid_cache[BUILTINS]
+        finally:
+            astroid_manager.serialization_directory = None
+        self.assertIsNot(built, original)
+        self.assertEqual(raw_building._BUILTINS_SNAPSHOT['data'],
+                         serialization.read_snapshot(cache, BUILTINS))
+        inferred = next(builder.extract_node('[1].append').infer())
+        self.assertIs(inferred.parent.parent, built)
+
+
+if __name__ == '__main__':
+    unittest.main()
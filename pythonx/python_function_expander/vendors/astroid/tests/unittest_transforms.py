@@ -11,6 +11,7 @@ import contextlib
 import time
 import unittest
 
+from astroid import MANAGER
 from astroid import builder
 from astroid import nodes
 from astroid import parse
@@ -230,6 +231,63 @@ class TestTransforms(unittest.TestCase):
                 import UserDict
         ''')
 
+    def test_unchanged_fields_are_kept(self):
+        def transform_name(node):
+            if node.name == 'replaced':
+                return nodes.const_factory(42)
+            return None
+
+        self.transformer.register_transform(nodes.Name, transform_name)
+        module = parse('''
+        def test(kept, replaced):
+            return [kept, replaced], (kept, kept)
+        ''', apply_transforms=False)
+        function = module.body[0]
+        body = function.body
+        elements = function.body[0].value.elts
+        first, second = elements[0].elts, elements[1].elts
+        self.transformer.visit(module)
+
+        self.assertIs(function.body, body)
+        self.assertIs(function.body[0].value.elts, elements)
+        self.assertIs(elements[1].elts, second)
+        self.assertIsNot(elements[0].elts, first)
+        self.assertIsInstance(first[1], nodes.Name)
+        self.assertIsInstance(elements[0].elts[1], nodes.Const)
+        self.assertIs(elements[0].elts[0], first[0])
+
+    def test_walk_is_skipped_without_node_transforms(self):
+        visited = []
+        self.transformer.register_transform(nodes.Module, visited.append)
+        self.transformer.register_transform(nodes.Call, visited.append)
+        self.transformer.unregister_transform(nodes.Call, visited.append)
+        module = parse('test()', apply_transforms=False)
+        self.transformer._visit = None
+        self.transformer.visit(module)
+        self.assertEqual(visited, [module])
+
+    def test_subtrees_without_transformed_nodes_are_skipped(self):
+        # The default brains register transforms for calls, but not for
+        # the nodes of an assignment like this one
+        transformer = MANAGER._transform
+        module = builder.parse_syntax('total = [1, 2][0] + 3\nprint(total)\n')
+        assignment, expression = module.body
+        walked = []
+        visit = transformer._visit
+
+        def walk(node):
+            walked.append(id(node))
+            return visit(node)
+
+        transformer._visit = walk
+        try:
+            transformer.visit(module)
+        finally:
+            del transformer._visit
+        self.assertIn(nodes.Call, transformer.transforms)
+        self.assertNotIn(id(assignment), walked)
+        self.assertIn(id(expression.value), walked)
+
 
 if __name__ == '__main__':
     unittest.main()
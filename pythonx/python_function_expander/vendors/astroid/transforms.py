@@ -19,13 +19,41 @@ class TransformVisitor(object):
 
     def __init__(self):
         self.transforms = collections.defaultdict(list)
+        # the node classes which have transforms, computed once per visit
+        self._classes = frozenset()
+        # the ids of the nodes to walk into, or None to walk into every node
+        self._walked = None
+
+    def _get_classes(self):
+        return frozenset(cls for cls, transforms in self.transforms.items()
+                         if transforms)
+
+    def _get_walked(self, module):
+        """Find the nodes which are, or contain, a node that could be transformed
+
+        The nodes are found with the module's node index. Return None if
+        it has no index, because then every node must be walked into.
+        """
+        index = getattr(module, 'node_index', None)
+        if index is None:
+            return None
+        walked = set()
+        for cls in self._classes:
+            for node in index.get(cls, ()):
+                while node is not None and id(node) not in walked:
+                    walked.add(id(node))
+                    node = node.parent
+        return walked
+
+    def _is_skipped(self, node):
+        return self._walked is not None and id(node) not in self._walked
 
     def _transform(self, node):
         """Call matching transforms for the given node if any and return the
         transformed node.
         """
         cls = node.__class__
-        if cls not in self.transforms:
+        if cls not in self._classes:
             # no transform registered for this class of node
             return node
 
@@ -45,20 +73,41 @@ class TransformVisitor(object):
         return node
 
     def _visit(self, node):
-        if hasattr(node, '_astroid_fields'):
-            for field in node._astroid_fields:
-                value = getattr(node, field)
-                visited = self._visit_generic(value)
+        for field in getattr(node, '_astroid_fields', ()):
+            value = getattr(node, field)
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)):
+                visited = self._visit_sequence(value)
+            elif self._is_skipped(value):
+                continue
+            else:
+                visited = self._visit(value)
+            # only fields whose children were replaced are rewritten
+            if visited is not value:
                 setattr(node, field, visited)
-        return self._transform(node)
-
-    def _visit_generic(self, node):
-        if isinstance(node, list):
-            return [self._visit_generic(child) for child in node]
-        elif isinstance(node, tuple):
-            return tuple(self._visit_generic(child) for child in node)
+        if node.__class__ in self._classes:
+            return self._transform(node)
+        return node
 
-        return self._visit(node)
+    def _visit_sequence(self, nodes):
+        replaced = None
+        for index, child in enumerate(nodes):
+            if isinstance(child, (list, tuple)):
+                visited = self._visit_sequence(child)
+            elif self._is_skipped(child):
+                continue
+            else:
+                visited = self._visit(child)
+            if visited is not child:
+                if replaced is None:
+                    replaced = list(nodes)
+                replaced[index] = visited
+        if replaced is None:
+            return nodes
+        if isinstance(nodes, tuple):
+            return tuple(replaced)
+        return replaced
 
     def register_transform(self, node_class, transform, predicate=None):
         """Register `transform(node)` function to be applied on the given
@@ -78,7 +127,15 @@ class TransformVisitor(object):
         """Walk the given astroid *tree* and transform each encountered node
 
         Only the nodes which have transforms registered will actually
-        be replaced or changed.
+        be replaced or changed. If the module has a node index, the
+        subtrees without any of those nodes aren't walked.
         """
-        module.body = [self._visit(child) for child in module.body]
+        self._classes = self._get_classes()
+        self._walked = self._get_walked(module)
+        try:
+            # the walk is skipped when only modules could be transformed
+            if self._classes - {module.__class__}:
+                module.body = self._visit_sequence(module.body)
+        finally:
+            self._walked = None
         return self._transform(module)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''Do the slow, one-time work of an expansion before the user asks for one.
+
+The first expansion of a session has to find a jedi environment, import
+astroid (and every one of its brain plugins) on Python versions which
+still use it and make jedi parse every module that the buffer imports. This module does all of that in a
+background thread as soon as a Python buffer is opened, so that the first
+expansion is as fast as every expansion after it.
+
+'''
+
+# IMPORT STANDARD LIBRARIES
+import threading
+
+# IMPORT THIRD-PARTY LIBRARIES
+import vim
+
+# IMPORT LOCAL LIBRARIES
+from . import common
+from . import environment as environment_
+from . import imports
+from . import session
+from .trimmer import trimmer
+
+
+_WORKERS = dict()
+_CHANGEDTICKS = dict()
+
+
+class _Worker(threading.Thread):
+
+    '''A cancellable, background thread that warms up one buffer.'''
+
+    def __init__(self, path, code, force_python_version):
+        '''Store the information that the thread needs from Vim.
+
+        The thread must never talk to Vim so everything it needs is read ahead of time.
+
+        Args:
+            path (str): The absolute path to the buffer.
+            code (str): The buffer's source code.
+            force_python_version (str): The value of `g:jedi#force_py_version`.
+
+        '''
+        super(_Worker, self).__init__()
+        self.daemon = True
+        self.path = path
+        self.code = code
+        self.force_python_version = force_python_version
+        self.cancelled = threading.Event()
+
+    def _warm_jedi(self, module):
+        '''Make jedi parse and infer `module` so that its results are cached.'''
+        code = 'import {module}\n{module}.'.format(module=module)
+        lines = code.split('\n')
+        session.get_script(code, len(lines), len(lines[-1]), self.path).completions()
+
+    @staticmethod
+    def _warm_astroid(module):
+        '''Build `module` with astroid so that it is stored in astroid's cache.'''
+        # Importing the parser is part of the warm-up. It imports astroid and all of its brain plugins
+        astroid = trimmer.get_parser().astroid
+
+        try:
+            astroid.MANAGER.ast_from_module_name(module)
+        except astroid.AstroidBuildingError:
+            pass
+
+    def run(self):
+        '''Resolve the environment, import astroid and infer every imported module.
+
+        Each step holds the inference lock on its own and waits while Vim
+        needs it, so an expansion only ever waits for the current step.
+
+        '''
+        try:
+            with common.background_inference():
+                session.get_environment(self.force_python_version)
+
+            steps = [self._warm_jedi]
+
+            if trimmer.is_astroid_used():
+                steps.append(self._warm_astroid)
+
+            for module in sorted(imports.get_imported_modules(self.code)):
+                for step in steps:
+                    if self.cancelled.is_set():
+                        return
+
+                    with common.background_inference():
+                        step(module)
+        except Exception:  # pylint: disable=broad-except
+            # A warm-up is only an optimization. If it fails, the expansion
+            # will just do the same work later and report the error, then.
+            #
+            pass
+
+    def cancel(self):
+        '''Stop warming up as soon as the current step is finished.'''
+        self.cancelled.set()
+
+
+def start(number, path, code, force_python_version):
+    '''Warm up a buffer in the background.
+
+    If the buffer is already being warmed up for the same imports, nothing happens.
+
+    Args:
+        number (int): The Vim buffer number.
+        path (str): The absolute path to the buffer.
+        code (str): The buffer's source code.
+        force_python_version (str): The value of `g:jedi#force_py_version`.
+
+    '''
+    key = (path, force_python_version, frozenset(imports.get_imported_modules(code)))
+    (previous_key, worker) = _WORKERS.get(number, (None, None))
+
+    if previous_key == key:
+        return
+
+    if worker:
+        worker.cancel()
+
+    worker = _Worker(path, code, force_python_version)
+    _WORKERS[number] = (key, worker)
+    worker.start()
+
+
+def cancel(number):
+    '''Stop warming up the buffer whose Vim buffer number is `number`.'''
+    (_, worker) = _WORKERS.pop(number, (None, None))
+    _CHANGEDTICKS.pop(number, None)
+
+    if worker:
+        worker.cancel()
+
+
+def warm_up_current_buffer():
+    '''Warm up Vim's current buffer in the background, if it has changed since its last warm-up.'''
+    settings = environment_.get_settings()
+
+    if not settings.warm_up:
+        return
+
+    buffer_ = vim.current.buffer
+    changedtick = vim.eval('b:changedtick')
+
+    # `BufEnter` runs often. If the buffer hasn't changed, neither have its imports
+    if _CHANGEDTICKS.get(buffer_.number) == changedtick:
+        return
+
+    _CHANGEDTICKS[buffer_.number] = changedtick
+
+    start(buffer_.number, buffer_.name or '', '\n'.join(buffer_), settings.force_python_version)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests to make sure modules are split into their top-level statements.'''
+
+# IMPORT STANDARD LIBRARIES
+import ast
+import textwrap
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander.trimmer import blocks
+
+
+_CODE = textwrap.dedent(
+    '''\
+    import os
+
+    class Base(object):
+        pass
+
+    @decorator
+    @another
+    def helper(value=Base):
+        try:
+            pass
+        except Exception:
+            pass
+    # A comment at column 0
+        return value
+
+    UNUSED = 8
+
+    if True:
+        pass
+    else:
+        helper(
+            value=Base,
+        )
+    '''
+).split('\n')
+
+
+class Blocks(unittest.TestCase):
+
+    '''Split a module into its statements and only keep what a statement needs.'''
+
+    def test_blocks(self):
+        '''Keep decorators, clauses and comments in the statement above them.'''
+        self.assertEqual(
+            [(0, 2), (2, 5), (5, 15), (15, 17), (17, 24)],
+            blocks.get_blocks(_CODE),
+        )
+
+    def test_block(self):
+        '''Find the statement of a 1-based row.'''
+        self.assertEqual((5, 15), blocks.get_block(_CODE, 6))
+        self.assertEqual((5, 15), blocks.get_block(_CODE, 15))
+        self.assertEqual((17, 24), blocks.get_block(_CODE, 21))
+
+    def test_context(self):
+        '''Keep imports and the definitions that a statement needs, even indirectly.'''
+        context = blocks.get_context_lines(_CODE, 21)
+
+        self.assertEqual(len(_CODE), len(context))
+        self.assertEqual(
+            ['' if line.startswith('UNUSED') else line for line in _CODE],
+            context,
+        )
+
+    def test_cached_parse(self):
+        '''Only parse the same statement once and keep the module's line numbers.'''
+        first = blocks.parse(ast.parse, _CODE, 2, 5)
+
+        self.assertIs(first, blocks.parse(ast.parse, _CODE, 2, 5))
+        self.assertEqual(3, first.body[0].lineno)
+
+    def test_strings(self):
+        '''Don't split a statement on text at column 0 inside of a multi-line string.'''
+        code = 'def f():\n    x = """\nfoo(a, b=1)\n"""\n    return x\nbar()'.split('\n')
+
+        self.assertEqual([(0, 5), (5, 6)], blocks.get_blocks(code))
+        self.assertEqual((0, 5), blocks.get_block(code, 3))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests to make sure that documents give the same code in every form.'''
+
+# IMPORT STANDARD LIBRARIES
+import tokenize
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander.trimmer import document
+
+
+class SourceDocument(unittest.TestCase):
+
+    '''Check that text, lines, offsets and tokens agree with each other.'''
+
+    def test_text_and_lines(self):
+        '''Make lines from text and text from lines, only when they're needed.'''
+        text = 'foo(\n    bar=8,\n)\n'
+        lines = ['foo(', '    bar=8,', ')', '']
+
+        self.assertEqual(lines, document.SourceDocument(text).lines)
+        self.assertEqual(text, document.SourceDocument.from_lines(lines).text)
+
+        from_lines = document.SourceDocument.from_lines(lines)
+        self.assertIs(lines, from_lines.lines)
+
+    def test_offsets(self):
+        '''Convert line and column positions into indexes of the text.'''
+        source = document.SourceDocument('foo(\n    bar=8,\n)')
+
+        self.assertEqual([0, 5, 16, 18], source.offsets)
+        self.assertEqual('bar', source.text[source.get_offset(1, 4):source.get_offset(1, 7)])
+
+    def test_segment(self):
+        '''Read text between byte columns, like `ast.get_source_segment`.'''
+        source = document.SourceDocument(u'é = ü(bar=[1,\n    2])')
+
+        self.assertEqual(u'ü', source.get_segment(1, 5, 1, 7))
+        self.assertEqual(u'[1,\n    2]', source.get_segment(1, 12, 2, 6))
+
+    def test_tokens(self):
+        '''Start tokenizing from any line and keep the document's line numbers.'''
+        source = document.SourceDocument('import os\n\nfoo(bar)\n')
+        tokens = [(string, start) for _, string, start, _ in source.iter_tokens(2) if string]
+
+        self.assertEqual(('foo', (2, 0)), tokens[0])
+        self.assertEqual((')', (2, 7)), tokens[3])
+
+    def test_get_document(self):
+        '''Only wrap text that isn't already a document.'''
+        source = document.SourceDocument('foo()')
+
+        self.assertIs(source, document.get_document(source))
+        self.assertEqual('foo()', document.get_document('foo()').text)
+        self.assertEqual(tokenize.NAME, next(source.iter_tokens())[0])
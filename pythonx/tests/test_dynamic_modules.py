@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests to make sure jedi only gets buffers that the current file can import.'''
+
+# IMPORT STANDARD LIBRARIES
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander import dynamic_modules
+
+
+class Reachable(unittest.TestCase):
+
+    '''Find buffers through the current buffer's import graph.'''
+
+    def setUp(self):
+        '''Make a package of Python files and stop tracking any previous buffers.'''
+        self.root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.root, 'package'))
+
+        self.init = self._make_file(os.path.join('package', '__init__.py'))
+        self.helper = self._make_file(os.path.join('package', 'helper.py'), 'from . import deep')
+        self.deep = self._make_file(os.path.join('package', 'deep.py'))
+        self.other = self._make_file('other.py', 'import os')
+
+        dynamic_modules._BUFFERS.clear()
+
+        for path in (self.init, self.helper, self.deep, self.other):
+            dynamic_modules.add(path)
+
+    def tearDown(self):
+        '''Delete the test's files.'''
+        dynamic_modules._BUFFERS.clear()
+        shutil.rmtree(self.root)
+
+    def _make_file(self, name, text=''):
+        '''str: Write `text` to a file in the temporary folder and return its path.'''
+        path = os.path.join(self.root, name)
+
+        with open(path, 'w') as handle:
+            handle.write(textwrap.dedent(text))
+
+        return path
+
+    def test_module_names(self):
+        '''Get every dotted name of files, including package files.'''
+        self.assertEqual({'helper', 'package.helper'}, dynamic_modules.get_module_names(self.helper))
+        self.assertEqual({'package'}, dynamic_modules.get_module_names(self.init))
+        self.assertEqual({'other'}, dynamic_modules.get_module_names(self.other))
+
+    def test_transitive(self):
+        '''Follow the imports of reachable buffers, too.'''
+        current = os.path.join(self.root, 'current.py')
+
+        self.assertEqual(
+            sorted([self.init, self.helper, self.deep]),
+            dynamic_modules.get_reachable_modules(current, 'from package.helper import thing'),
+        )
+        self.assertEqual([self.other], dynamic_modules.get_reachable_modules(current, 'import other'))
+        self.assertEqual([], dynamic_modules.get_reachable_modules(current, 'import json'))
+
+    def test_buffer_events(self):
+        '''Stop returning deleted buffers and notice new imports after a buffer is written.'''
+        current = os.path.join(self.root, 'current.py')
+        dynamic_modules.remove(self.deep)
+
+        self.assertEqual(
+            sorted([self.init, self.helper]),
+            dynamic_modules.get_reachable_modules(current, 'import package.helper'),
+        )
+
+        self._make_file('other.py', 'import package')
+        dynamic_modules.refresh(self.other)
+
+        self.assertEqual(
+            sorted([self.init, self.other]),
+            dynamic_modules.get_reachable_modules(current, 'import other'),
+        )
+
+    def test_importers(self):
+        '''Include the buffers which import the current buffer, since they call its functions.'''
+        caller = self._make_file('caller.py', 'from package import helper')
+        dynamic_modules.add(caller)
+
+        self.assertEqual(
+            sorted([caller, self.deep]),
+            dynamic_modules.get_reachable_modules(self.helper, 'from . import deep'),
+        )
+
+        # "caller" reaches "deep" through "helper"
+        self.assertEqual(sorted([caller, self.helper]), dynamic_modules.get_reachable_modules(self.deep, ''))
+
+    def test_current_buffer(self):
+        '''Never give jedi the current buffer, even if it imports itself.'''
+        self.assertEqual([], dynamic_modules.get_reachable_modules(self.other, 'import other'))
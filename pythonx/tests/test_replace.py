@@ -4,10 +4,15 @@
 '''A series of tests to make sure unused args are deleted correctly.'''
 
 # IMPORT STANDARD LIBRARIES
+import os
+import shutil
+import sys
+import tempfile
 import textwrap
 import unittest
 
 # IMPORT 'LOCAL' LIBRARIES
+from python_function_expander.trimmer import parser
 from python_function_expander.trimmer import trimmer
 
 
@@ -1085,3 +1090,99 @@ class FailedCases(_Common):
         )
 
         self._compare(expected, code)
+
+
+class ChangedDependencies(_Common):
+
+    '''Make sure that trimming notices when a module that the code imports changes.'''
+
+    def setUp(self):
+        '''Put a temporary folder on the Python path, for the imported module.'''
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'expander_dependency.py')
+        sys.path.insert(0, self.directory)
+
+    def tearDown(self):
+        '''Forget the imported module and delete its folder.'''
+        sys.path.remove(self.directory)
+        parser.astroid.MANAGER.astroid_cache.pop('expander_dependency', None)
+        shutil.rmtree(self.directory)
+
+    def _write(self, default, mtime):
+        '''Write the imported module, with a known modification time.'''
+        with open(self.path, 'w') as handler:
+            handler.write('def func(a, b={default}):\n    pass\n'.format(default=default))
+
+        os.utime(self.path, (mtime, mtime))
+
+    def test_changed_default(self):
+        '''Keep an argument once the default that it matched changes.'''
+        code = 'import expander_dependency\nexpander_dependency.func(a, |b|=1)'
+
+        self._write(1, 1000000000)
+        self._compare('import expander_dependency\nexpander_dependency.func(a)', code)
+
+        self._write(2, 1000000010)
+        self._compare('import expander_dependency\nexpander_dependency.func(a, b=1)', code)
+
+
+class InferredDefaults(unittest.TestCase):
+
+    '''Make sure that astroid finds default values without jedi's help.'''
+
+    @staticmethod
+    def _get_info(code):
+        '''dict[str, str] or NoneType: Get the defaults of the call on the last line of `code`.'''
+        code = textwrap.dedent(code)
+
+        return parser.get_inferred_parameter_info(parser.get_nearest_call(code, len(code.splitlines())))
+
+    def test_function(self):
+        '''Read positional and keyword-only defaults.'''
+        code = '''\
+            def foo(bar, fizz=8, *args, thing=None, **kwargs):
+                pass
+
+            foo(1, thing=None)'''
+
+        self.assertEqual({'fizz': '8', 'thing': 'None'}, self._get_info(code))
+
+    def test_class(self):
+        '''Read the defaults of a class's (inherited) __init__ method.'''
+        code = '''\
+            class Base(object):
+                def __init__(self, value='text'):
+                    pass
+
+            class Thing(Base):
+                pass
+
+            Thing(value='text')'''
+
+        self.assertEqual({'value': "'text'"}, self._get_info(code))
+
+    def test_bound_method(self):
+        '''Read the defaults of a method which is called from an instance.'''
+        code = '''\
+            class Thing(object):
+                def method(self, value=(1, 2)):
+                    pass
+
+            Thing().method(value=(1, 2))'''
+
+        self.assertEqual({'value': '(1, 2)'}, self._get_info(code))
+
+    def test_unknown(self):
+        '''Let jedi find the defaults of objects that astroid can't infer.'''
+        self.assertIsNone(self._get_info('unknown(value=8)'))
+        self.assertIsNone(self._get_info('len([])'))
+
+    def test_transforms(self):
+        '''Apply astroid's brain plugins to the code before inferring it.'''
+        code = '''\
+            import collections
+
+            Point = collections.namedtuple('Point', 'x y')
+            Point._make([1, 2], len=len)'''
+
+        self.assertEqual({'new': 'tuple.__new__', 'len': 'len'}, self._get_info(code))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests to make sure keywords are removed without changing the rest of a call.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander.trimmer import document
+from python_function_expander.trimmer import rewrite
+
+
+def _remove_keywords(code, row, column, keywords):
+    '''str or NoneType: Remove keywords from `code` and join the changed lines back together.'''
+    lines = rewrite.remove_keywords(document.SourceDocument(code), row, column, keywords)
+
+    if lines is None:
+        return None
+
+    return '\n'.join(lines)
+
+
+class RemoveKeywords(unittest.TestCase):
+
+    '''Delete keywords from the text of a call.'''
+
+    def test_single_line(self):
+        '''Keep the formatting of the arguments that aren't removed.'''
+        code = "obj = foo(bar,  [1, 2],  thing=None, another = {'a': 8})"
+
+        self.assertEqual(
+            "obj = foo(bar,  [1, 2],  another = {'a': 8})",
+            _remove_keywords(code, 1, 9, {'thing'}),
+        )
+        self.assertEqual(
+            'obj = foo(bar,  [1, 2])',
+            _remove_keywords(code, 1, 9, {'thing', 'another'}),
+        )
+
+    def test_multi_line(self):
+        '''Remove the lines of removed keywords and keep any trailing comma.'''
+        code = textwrap.dedent(
+            '''\
+            foo(
+                bar,  # A comment
+                thing=call(None,
+                           8),
+                another=9,
+                last=None,
+            )
+            '''
+        )
+        expected = textwrap.dedent(
+            '''\
+            foo(
+                bar,  # A comment
+                another=9,
+            )
+            '''
+        )
+
+        self.assertEqual(expected, _remove_keywords(code, 1, 3, {'thing', 'last'}))
+
+    def test_all(self):
+        '''Remove every argument.'''
+        code = 'foo(\n    thing=None,\n)\nfoo(thing=None)'
+
+        self.assertEqual('foo()\nfoo(thing=None)', _remove_keywords(code, 1, 0, {'thing'}))
+
+    def test_unicode(self):
+        '''Convert byte columns into character columns.'''
+        code = u'é = ü(thing=None, bar=8)'
+
+        self.assertEqual(u'é = ü(bar=8)', _remove_keywords(code, 1, 6, {'thing'}))
+
+    def test_incomplete(self):
+        '''Don't change calls that aren't closed.'''
+        self.assertIsNone(_remove_keywords('foo(thing=None,', 1, 0, {'thing'}))
+
+    def test_lambda(self):
+        '''Don't split arguments on the commas between a lambda's parameters.'''
+        code = 'foo(1, key=lambda x, y=(1, 2): x, b=lambda: {1: 2}, c=1)'
+
+        self.assertEqual(
+            'foo(1, b=lambda: {1: 2}, c=1)',
+            _remove_keywords(code, 1, 0, {'key'}),
+        )
+        self.assertEqual(
+            'foo(1, key=lambda x, y=(1, 2): x, c=1)',
+            _remove_keywords(code, 1, 0, {'b'}),
+        )
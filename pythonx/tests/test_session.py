@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests to make sure jedi's environment and settings are shared.'''
+
+# IMPORT STANDARD LIBRARIES
+import os
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander import session
+
+
+class Session(unittest.TestCase):
+
+    '''Create jedi objects from one, shared environment.'''
+
+    def setUp(self):
+        '''Forget any environment from a previous test.'''
+        session.clear()
+
+    def tearDown(self):
+        '''Forget the test's environment.'''
+        session.clear()
+
+    def test_cached_environment(self):
+        '''Only find the environment again when the requested version changes.'''
+        environment = session.get_environment('auto')
+
+        self.assertIs(environment, session.get_environment('auto'))
+        self.assertIs(environment, session.get_script('import os\nos.', 2, 3)._evaluator.environment)
+
+    def test_path(self):
+        '''Give jedi the path of the file that the code comes from.'''
+        path = os.path.abspath(__file__)
+        script = session.get_script('import os\nos.', 2, 3, path)
+
+        self.assertEqual(path, script.path)
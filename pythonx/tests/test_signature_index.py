@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests for writing and reading precomputed signature indexes.'''
+
+# IMPORT STANDARD LIBRARIES
+import os
+import shutil
+import sys
+import tempfile
+import textwrap
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander import imports
+from python_function_expander import signature_index
+
+
+class _Common(unittest.TestCase):
+
+    '''A base class which writes its files into a temporary folder.'''
+
+    def setUp(self):
+        '''Make a temporary folder for the test's files.'''
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        '''Delete the test's files.'''
+        shutil.rmtree(self.root)
+
+    def _make_file(self, name, text=''):
+        '''str: Write `text` to a file in the temporary folder and return its path.'''
+        path = os.path.join(self.root, name)
+
+        with open(path, 'w') as handle:
+            handle.write(textwrap.dedent(text))
+
+        return path
+
+
+class Lookup(_Common):
+
+    '''Make sure that written indexes return the same signatures.'''
+
+    def _write(self, modules, entries):
+        '''`signature_index.SignatureIndex`: Write and open an index file.'''
+        path = os.path.join(self.root, 'signatures.idx')
+        signature_index.write_index(path, modules, entries)
+        index = signature_index.SignatureIndex(path)
+        self.addCleanup(index.close)
+
+        return index
+
+    def test_round_trip(self):
+        '''Write several signatures and read each of them back.'''
+        parameters = [
+            signature_index.IndexedParameter('pattern'),
+            signature_index.IndexedParameter('count', default='0'),
+            signature_index.IndexedParameter('args', kind=signature_index.VAR_POSITIONAL),
+            signature_index.IndexedParameter('flags', kind=signature_index.KEYWORD_ONLY, default="u'é'"),
+            signature_index.IndexedParameter('kwargs', kind=signature_index.VAR_KEYWORD),
+        ]
+        entries = {
+            're.sub': (parameters, 0),
+            're.compile': ([], 0),
+            'os.path.join': (parameters[:1], 0),
+        }
+        index = self._write([('re', '', 0.0, '', '')], entries)
+
+        self.assertEqual(3, len(index))
+        self.assertEqual(parameters, index.lookup('re.sub'))
+        self.assertEqual([], index.lookup('re.compile'))
+        self.assertEqual(parameters[:1], index.lookup('os.path.join'))
+        self.assertIsNone(index.lookup('re.su'))
+        self.assertIsNone(index.lookup('zzz'))
+        self.assertEqual(
+            ['param pattern', 'param count=0', 'param *args', "param flags=u'é'", 'param **kwargs'],
+            [parameter.description for parameter in index.lookup('re.sub')],
+        )
+
+    def test_stale_mtime(self):
+        '''Ignore entries whose module file has changed since the index was written.'''
+        module = self._make_file('module.py')
+        mtime = os.path.getmtime(module)
+        index = self._write(
+            [('module', module, mtime, '', '')],
+            {'module.foo': ([signature_index.IndexedParameter('bar')], 0)},
+        )
+
+        self.assertIsNotNone(index.lookup('module.foo'))
+        os.utime(module, (mtime + 10, mtime + 10))
+        self.assertIsNone(index.lookup('module.foo'))
+
+    def test_stale_distribution(self):
+        '''Ignore entries whose distribution was removed or upgraded.'''
+        folder = os.path.join(self.root, 'package-1.0.dist-info')
+        os.mkdir(folder)
+        index = self._write(
+            [('package', '', 0.0, folder, '1.0')],
+            {'package.foo': ([], 0)},
+        )
+
+        self.assertIsNotNone(index.lookup('package.foo'))
+        os.rmdir(folder)
+        self.assertIsNone(index.lookup('package.foo'))
+
+    def test_invalid_file(self):
+        '''Don't open files which are not signature indexes.'''
+        self.assertIsNone(signature_index.get_index(self._make_file('empty.idx')))
+        self.assertIsNone(signature_index.get_index(self._make_file('text.idx', 'not an index')))
+        self.assertIsNone(signature_index.get_index(os.path.join(self.root, 'missing.idx')))
+
+
+class Stubs(_Common):
+
+    '''Make sure that signatures are read from stub files correctly.'''
+
+    def test_stub(self):
+        '''Read functions, classes and methods but not private or nested objects.'''
+        path = self._make_file(
+            'module.pyi',
+            '''\
+            def sub(pattern: str, repl: str, string: str, count: int = ..., flags: int = 0) -> str: ...
+            def _private(foo): ...
+            class Thing(object):
+                def __init__(self, value, *args, strict=True, **kwargs): ...
+                def method(self, other): ...
+                @classmethod
+                def create(cls, value): ...
+                def _hidden(self): ...
+            ''',
+        )
+        signatures = signature_index.get_stub_signatures(path)
+
+        self.assertEqual(['Thing', 'Thing.create', 'Thing.method', 'sub'], sorted(signatures))
+        self.assertEqual(
+            ['param self', 'param other'],
+            [parameter.description for parameter in signatures['Thing.method']],
+        )
+        self.assertEqual(['param value'], [parameter.description for parameter in signatures['Thing.create']])
+        self.assertEqual(
+            ['param pattern', 'param repl', 'param string', 'param count=...', 'param flags=0'],
+            [parameter.description for parameter in signatures['sub']],
+        )
+        self.assertEqual(
+            ['param value', 'param *args', 'param strict=True', 'param **kwargs'],
+            [parameter.description for parameter in signatures['Thing']],
+        )
+
+
+    def test_stub_defaults(self):
+        '''Write dotted names, constants and positional-only parameters the way that they were written.'''
+        path = self._make_file(
+            'module.pyi',
+            '''\
+            import os
+            def walk(top, sep=os.path.sep, follow=False, *, onerror=None, name: str): ...
+            ''',
+        )
+        parameters = signature_index.get_stub_signatures(path)['walk']
+
+        self.assertEqual(
+            ['param top', 'param sep=os.path.sep', 'param follow=False', 'param onerror=None', 'param name'],
+            [parameter.description for parameter in parameters],
+        )
+        self.assertEqual(signature_index.KEYWORD_ONLY, parameters[-1].kind)
+
+
+class Modules(unittest.TestCase):
+
+    '''Make sure that live modules are indexed.'''
+
+    def test_methods(self):
+        '''Index the public methods of classes, as they're called through their class.'''
+        signatures = signature_index._get_module_signatures(textwrap)  # pylint: disable=protected-access
+
+        self.assertIn('TextWrapper', signatures)
+        self.assertEqual(
+            ['param self', 'param text'],
+            [parameter.description for parameter in signatures['TextWrapper.wrap']],
+        )
+        self.assertNotIn('TextWrapper._split', signatures)
+
+    def test_build(self):
+        '''Build an index in another process and report when it's finished.'''
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        path = os.path.join(root, 'signatures.idx')
+        build = signature_index.start_build(sys.executable, path, ['textwrap'])
+        build.process.wait()
+
+        (succeeded, message) = build.poll()
+
+        self.assertTrue(succeeded)
+        self.assertTrue(message.startswith('Indexed '))
+        self.assertTrue(os.path.isfile(path))
+
+        # The index can't be written inside of a file
+        build = signature_index.start_build(sys.executable, os.path.join(path, 'signatures.idx'), ['textwrap'])
+        build.process.wait()
+
+        self.assertFalse(build.poll()[0])
+
+
+class Aliases(unittest.TestCase):
+
+    '''Make sure that imported names are resolved to their fully-qualified names.'''
+
+    def test_aliases(self):
+        '''Find plain, aliased, dotted and parenthesized imports.'''
+        code = textwrap.dedent(
+            '''\
+            import os.path
+            import numpy as np, re
+            from collections import (
+                OrderedDict,
+                namedtuple as tuple_,
+            )
+            from . import sibling
+            from textwrap import *
+
+            def foo():
+                from json import dumps  # Nested imports count, too
+            '''
+        )
+
+        self.assertEqual(
+            {
+                'os': 'os',
+                'np': 'numpy',
+                're': 're',
+                'OrderedDict': 'collections.OrderedDict',
+                'tuple_': 'collections.namedtuple',
+                'dumps': 'json.dumps',
+            },
+            imports.get_aliases(code),
+        )
+        self.assertEqual(
+            {'os.path', 'numpy', 're', 'collections', 'textwrap', 'json'},
+            imports.get_imported_modules(code),
+        )
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests to make sure large buffers are reduced to only what jedi needs.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander import slicer
+
+
+class Slice(unittest.TestCase):
+
+    '''Keep imports, used module-level names and the cursor's statement.'''
+
+    def _slice(self, code):
+        '''list[str]: Slice `code`, using its last line as the cursor's line.'''
+        lines = textwrap.dedent(code).splitlines()
+
+        return slicer.get_sliced_lines(lines, len(lines))
+
+    def test_keep_used(self):
+        '''Remove unused statements but keep everything else on the same line.'''
+        code = '''\
+            import os
+            from textwrap import (
+                dedent,
+            )
+
+            WIDTH = 10
+            UNUSED = 5
+
+            def helper(value):
+                return value
+
+            @decorator
+            def unused():
+                """A docstring
+                over two lines."""
+
+            class Thing(object):
+                def method(self):
+                    value = helper(WIDTH)
+                    os.path.join('''
+
+        self.assertEqual(
+            [
+                'import os',
+                'from textwrap import (',
+                '    dedent,',
+                ')',
+                '',
+                'WIDTH = 10',
+                '',
+                '',
+                'def helper(value):',
+                '    return value',
+                '',
+                '',
+                '',
+                '',
+                '',
+                '',
+                'class Thing(object):',
+                '    def method(self):',
+                '        value = helper(WIDTH)',
+                '        os.path.join(',
+            ],
+            self._slice(code),
+        )
+
+    def test_import_blocks(self):
+        '''Keep try/except blocks which import modules, along with all of their clauses.'''
+        code = '''\
+            try:
+                import json
+            except ImportError:
+                json = None
+
+            if True:
+                pass
+
+            json.dumps('''
+
+        self.assertEqual(
+            ['try:', '    import json', 'except ImportError:', '    json = None', '', '', '', '', "json.dumps("],
+            self._slice(code),
+        )
+
+    def test_ignore_later_lines(self):
+        '''Remove every line after the cursor.'''
+        lines = ['import os', 'os.path.join(', 'UNUSED = 8']
+
+        self.assertEqual(['import os', 'os.path.join('], slicer.get_sliced_lines(lines, 2))
+
+    def test_broken_code(self):
+        '''Give up on code whose indentation can't be read.'''
+        lines = ['def foo():', '        pass', '    bar(']
+
+        self.assertIsNone(slicer.get_sliced_lines(lines, 3))
+
+    def test_keep_dependencies(self):
+        '''Keep the statements which the cursor's statement depends on, indirectly.'''
+        code = '''\
+            def f():
+                return thing
+
+            a = f()
+            b = a.x
+            UNUSED = 8
+            foo(b'''
+
+        self.assertEqual(
+            ['def f():', '    return thing', '', 'a = f()', 'b = a.x', '', 'foo(b'],
+            self._slice(code),
+        )
+
+    def test_bound_names(self):
+        '''Keep names which are bound by for loops and with statements.'''
+        code = '''\
+            for item in []:
+                pass
+
+            with open(path) as (handle, other):
+                pass
+
+            for unused in []:
+                pass
+
+            foo(item, handle'''
+
+        self.assertEqual(
+            ['for item in []:', '    pass', '', 'with open(path) as (handle, other):', '    pass',
+             '', '', '', '', 'foo(item, handle'],
+            self._slice(code),
+        )
+
+    def test_extra_names(self):
+        '''Keep statements which define names that the caller asks for.'''
+        lines = ['import os.path as path_', 'WIDTH = 10', 'UNUSED = 5', 'foo(']
+
+        self.assertEqual(
+            ['import os.path as path_', 'WIDTH = 10', '', 'foo('],
+            slicer.get_sliced_lines(lines, 4, names=['WIDTH']),
+        )
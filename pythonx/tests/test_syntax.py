@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''A series of tests to make sure calls are found with Python's `ast` module.'''
+
+# IMPORT STANDARD LIBRARIES
+import textwrap
+import unittest
+
+# IMPORT 'LOCAL' LIBRARIES
+from python_function_expander.trimmer import syntax
+
+
+@unittest.skipUnless(syntax.is_supported(), 'Python 3.8+ is required for end positions.')
+class NearestCall(unittest.TestCase):
+
+    '''Find the call under the cursor and read its keywords exactly as they were written.'''
+
+    code = textwrap.dedent(
+        '''\
+        import os
+
+        result = os.path.join(
+            "root",
+            name=os.path.basename("path"),
+            other = {'a':  1},
+            **kwargs
+        )
+        '''
+    )
+
+    def test_outer_call(self):
+        '''Prefer the outer call, from any of its lines.'''
+        for row in (3, 4, 8):
+            node = syntax.get_nearest_call(self.code, row)
+
+            self.assertEqual((3, 9), (node.lineno, node.col_offset))
+            self.assertEqual('os.path.join', syntax.get_callee(self.code, node))
+
+    def test_values(self):
+        '''Keep the user's formatting and skip "**kwargs".'''
+        node = syntax.get_nearest_call(self.code, 5)
+
+        self.assertEqual(
+            {'name': 'os.path.basename("path")', 'other': "{'a':  1}"},
+            syntax.get_parameter_values(self.code, node),
+        )
+
+    def test_string(self):
+        '''Don't find calls in the text of a multi-line string.'''
+        code = 'def f():\n    x = """\nfoo(a, b=1)\n"""\n    return x'
+
+        self.assertIsNone(syntax.get_nearest_call(code, 3))
+
+    def test_no_call(self):
+        '''Don't find calls on other lines or in code that can't be parsed.'''
+        self.assertIsNone(syntax.get_nearest_call(self.code, 1))
+        self.assertIsNone(syntax.get_nearest_call('foo(', 1))
+
+
+class UnchangedKeywords(unittest.TestCase):
+
+    '''Compare the user's values to a definition's defaults.'''
+
+    def test_unchanged(self):
+        '''Only return keywords whose value is the same as their default.'''
+        self.assertEqual(
+            [('count', '0')],
+            syntax.get_unchanged_keywords({'count': '0', 'flags': '8', 'other': '1'}, {'count': '0', 'flags': '0'}),
+        )
+        self.assertEqual([], syntax.get_unchanged_keywords({}, {'count': '0'}))
+
+    def test_differently_written(self):
+        '''Match defaults which are written differently than the user's values.'''
+        self.assertEqual(
+            [('name', '"x"'), ('ratio', '1.')],
+            sorted(syntax.get_unchanged_keywords(
+                {'name': '"x"', 'ratio': '1.', 'count': '1'},
+                {'name': "'x'", 'ratio': '1.0', 'count': 'True'},
+            )),
+        )
+        self.assertEqual([], syntax.get_unchanged_keywords({'item': '<object>'}, {'item': '<thing>'}))